@@ -5,19 +5,29 @@ Prevents buffer overflow when TTS generates audio faster than network can transm
 Uses bounded queues with timeout to detect stalls.
 Always transmits at 20ms intervals — silence when idle, TTS audio when available.
 This keeps the Twilio media path established (both sides must send for RTP to flow).
+
+Also holds UtteranceCapture, the inbound-side buffer that collects one caller
+utterance for STT, and AudioRing, a fixed-size history of recent PCM.
 """
 import asyncio
 import base64
 import json
 import logging
+import time
 from asyncio import Queue
-from typing import Optional
+from collections import deque
+from typing import Deque, Optional
+
+import numpy as np
 from fastapi import WebSocket
 
+from .conversion import mulaw_to_pcm
+
 logger = logging.getLogger(__name__)
 
 # 160 bytes of 0xFF mulaw = 20ms of silence at 8kHz mono
 _SILENCE_PAYLOAD = base64.b64encode(b'\xff' * 160).decode('utf-8')
+_SILENCE_PCM = np.zeros(160, dtype=np.int16)
 
 
 class AudioStreamer:
@@ -35,6 +45,16 @@ class AudioStreamer:
         self.outbound_queue: Queue[str] = Queue(maxsize=50)
         self.running = False
         self._send_task: Optional[asyncio.Task] = None
+        # monotonic time the last queued (non-silence) frame went out
+        self.last_audio_sent_at: Optional[float] = None
+        # Queued (non-silence) frames sent so far
+        self.audio_frames_sent = 0
+        # Optional src.audio.echo.EchoGate fed with every frame actually sent
+        self.echo_gate = None
+        # While paused the send loop sends silence and the queue is kept
+        self.paused = False
+        self._resumed = asyncio.Event()
+        self._resumed.set()
 
     async def start(self):
         """Start background task to send queued audio to Twilio"""
@@ -58,7 +78,8 @@ class AudioStreamer:
         Queue audio for sending to Twilio.
 
         Implements backpressure: if queue is full, this will block
-        until space is available, preventing memory overflow.
+        until space is available, preventing memory overflow. While
+        playback is paused it waits for resume() instead of timing out.
 
         Args:
             audio_payload: Base64-encoded mu-law audio
@@ -66,25 +87,47 @@ class AudioStreamer:
         Raises:
             asyncio.TimeoutError: If can't queue within 1 second (stall detected)
         """
-        try:
-            await asyncio.wait_for(
-                self.outbound_queue.put(audio_payload),
-                timeout=1.0
-            )
-        except asyncio.TimeoutError:
-            logger.warning(
-                f"Audio queue full for stream {self.stream_sid}, dropping packet. "
-                f"Queue size: {self.outbound_queue.qsize()}/{self.outbound_queue.maxsize}"
-            )
-            raise
+        while True:
+            await self._resumed.wait()
+            try:
+                await asyncio.wait_for(
+                    self.outbound_queue.put(audio_payload),
+                    timeout=1.0
+                )
+                return
+            except asyncio.TimeoutError:
+                if self.paused:
+                    continue
+                logger.warning(
+                    f"Audio queue full for stream {self.stream_sid}, dropping packet. "
+                    f"Queue size: {self.outbound_queue.qsize()}/{self.outbound_queue.maxsize}"
+                )
+                raise
+
+    def pause(self):
+        """Hold queued audio (send silence) without dropping it."""
+        self.paused = True
+        self._resumed.clear()
+
+    def resume(self):
+        """Continue sending the queued audio from where pause() stopped."""
+        self.paused = False
+        self._resumed.set()
 
     async def clear_queue(self):
-        """Clear all queued audio (used for interruptions)"""
+        """
+        Clear all queued audio (used for interruptions).
+
+        Never yields to the event loop, so no further queued frame can be
+        sent once this is awaited. Also ends a pause: there is nothing
+        left to resume.
+        """
         while not self.outbound_queue.empty():
             try:
                 self.outbound_queue.get_nowait()
             except asyncio.QueueEmpty:
                 break
+        self.resume()
         logger.info(f"Cleared audio queue for stream: {self.stream_sid}")
 
     async def _send_loop(self):
@@ -97,11 +140,15 @@ class AudioStreamer:
         """
         while self.running:
             try:
-                # Send TTS audio if available, otherwise silence
-                try:
-                    payload = self.outbound_queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    payload = _SILENCE_PAYLOAD
+                # Send TTS audio if available (and not paused), otherwise silence
+                payload = _SILENCE_PAYLOAD
+                is_audio = False
+                if not self.paused:
+                    try:
+                        payload = self.outbound_queue.get_nowait()
+                        is_audio = True
+                    except asyncio.QueueEmpty:
+                        pass
 
                 message = {
                     "event": "media",
@@ -111,6 +158,13 @@ class AudioStreamer:
                     }
                 }
                 await self.websocket.send_text(json.dumps(message))
+                if is_audio:
+                    self.last_audio_sent_at = time.monotonic()
+                    self.audio_frames_sent += 1
+                if self.echo_gate is not None:
+                    self.echo_gate.push_outbound(
+                        mulaw_to_pcm(base64.b64decode(payload)) if is_audio else _SILENCE_PCM
+                    )
                 await asyncio.sleep(0.020)
 
             except asyncio.CancelledError:
@@ -121,3 +175,132 @@ class AudioStreamer:
                 break
 
         logger.info("Send loop exited")
+
+
+class AudioRing:
+    """
+    Fixed-capacity int16 ring buffer holding the most recent audio.
+
+    Writes are a constant-size slice copy (no list pops or reallocation);
+    read() returns the contents oldest-first. Used for the VAD pre-roll and
+    the echo gate's reference/inbound history.
+    """
+
+    def __init__(self, capacity: int):
+        self.buffer = np.zeros(max(1, capacity), dtype=np.int16)
+        self.pos = 0
+        self.filled = 0
+
+    def write(self, samples: np.ndarray):
+        capacity = len(self.buffer)
+        if len(samples) >= capacity:
+            self.buffer[:] = samples[-capacity:]
+            self.pos = 0
+            self.filled = capacity
+            return
+        end = self.pos + len(samples)
+        if end <= capacity:
+            self.buffer[self.pos:end] = samples
+        else:
+            split = capacity - self.pos
+            self.buffer[self.pos:] = samples[:split]
+            self.buffer[:end - capacity] = samples[split:]
+        self.pos = end % capacity
+        self.filled = min(capacity, self.filled + len(samples))
+
+    def read(self, n: Optional[int] = None) -> np.ndarray:
+        """Return the last n samples (all if None), oldest first."""
+        if n is not None and n <= 0:
+            return self.buffer[:0].copy()
+        if n is not None and n < self.filled:
+            start = (self.pos - n) % len(self.buffer)
+            if start < self.pos:
+                return self.buffer[start:self.pos].copy()
+            return np.concatenate([self.buffer[start:], self.buffer[:self.pos]])
+        if self.filled < len(self.buffer):
+            return self.buffer[:self.filled].copy()
+        return np.concatenate([self.buffer[self.pos:], self.buffer[:self.pos]])
+
+    def clear(self):
+        self.pos = 0
+        self.filled = 0
+
+
+class UtteranceCapture:
+    """
+    Collects one caller utterance for STT, driven by the VAD speaking state.
+
+    Starts from the VAD pre-roll on speech onset, then keeps every inbound
+    chunk — including the caller's pauses inside the utterance — until the
+    turn ends. On finish, trailing silence beyond trailing_padding_ms is
+    trimmed so Whisper gets continuous speech that is as short as possible.
+
+    Long utterances can be handed off in pieces with drain(); max_seconds
+    is a hard cap after which the oldest audio is dropped.
+    """
+
+    def __init__(self, sample_rate: int = 8000, trailing_padding_ms: int = 200,
+                 max_seconds: Optional[float] = None):
+        self.sample_rate = sample_rate
+        self.trailing_padding_samples = int(trailing_padding_ms * sample_rate / 1000)
+        self.max_samples = int(max_seconds * sample_rate) if max_seconds else None
+        # Dropped from the front once max_seconds is reached: O(1) per chunk
+        self.chunks: Deque[np.ndarray] = deque()
+        self.num_samples = 0
+        self.dropped_samples = 0
+        self.active = False
+
+    def start(self, preroll: np.ndarray):
+        """Begin a new utterance seeded with pre-roll audio (replaces any previous one)."""
+        self.chunks = deque([preroll] if len(preroll) else [])
+        self.num_samples = len(preroll)
+        self.dropped_samples = 0
+        self.active = True
+
+    def append(self, chunk: np.ndarray):
+        """Add an inbound chunk to the active utterance (no-op when idle)."""
+        if not self.active:
+            return
+        self.chunks.append(chunk)
+        self.num_samples += len(chunk)
+        if self.max_samples is not None:
+            while self.num_samples > self.max_samples and len(self.chunks) > 1:
+                oldest = self.chunks.popleft()
+                self.num_samples -= len(oldest)
+                self.dropped_samples += len(oldest)
+
+    def drain(self) -> np.ndarray:
+        """Return the audio captured so far and clear it, keeping the utterance active."""
+        audio = np.concatenate(self.chunks) if self.chunks else np.array([], dtype=np.int16)
+        self.chunks.clear()
+        self.num_samples = 0
+        return audio
+
+    @property
+    def duration_s(self) -> float:
+        return self.num_samples / self.sample_rate
+
+    def finish(self, trailing_silence_samples: int = 0) -> np.ndarray:
+        """
+        End the utterance and return its audio.
+
+        Args:
+            trailing_silence_samples: How much of the tail the VAD judged
+                silent; everything past trailing_padding_ms of it is dropped.
+
+        Returns:
+            int16 numpy array at sample_rate (empty if nothing was captured)
+        """
+        audio = np.concatenate(self.chunks) if self.chunks else np.array([], dtype=np.int16)
+        trim = max(0, trailing_silence_samples - self.trailing_padding_samples)
+        if trim:
+            audio = audio[:max(0, len(audio) - trim)]
+        self.discard()
+        return audio
+
+    def discard(self):
+        """Drop the current utterance (e.g. VAD aborted a too-short segment)."""
+        self.chunks.clear()
+        self.num_samples = 0
+        self.dropped_samples = 0
+        self.active = False
@@ -0,0 +1,162 @@
+"""
+Echo-aware barge-in gating.
+
+On speakerphones and poor lines our own TTS leaks back into the inbound
+track, and the VAD happily reports it as caller speech. EchoGate keeps a
+time-aligned history of what AudioStreamer actually sent (8kHz PCM, one
+write per 20ms frame, silence included) and of the inbound audio, and
+asks whether a barge-in candidate is explained by that reference:
+
+- Nothing (audible) was sent within the echo-delay range -> not echo.
+- The inbound onset correlates with the reference at some delay in
+  [0, max_delay_ms] -> echo.
+- A weaker correlation is still echo when the inbound level is well
+  below the reference (typical echo return loss); a caller talking over
+  us is usually louder than the leak (double talk) and is accepted.
+"""
+
+import logging
+
+import numpy as np
+
+from .buffers import AudioRing
+
+logger = logging.getLogger(__name__)
+
+
+class EchoGate:
+    """
+    Per-call echo check for barge-in candidates.
+
+    Usage:
+        streamer.echo_gate = gate        # streamer writes outbound frames
+        gate.push_inbound(pcm_8khz)      # every inbound frame
+        if gate.check_candidate(): suppress the barge-in
+        else if no candidate this frame: gate.end_candidate()
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 8000,
+        window_ms: int = 128,
+        max_delay_ms: int = 500,
+        correlation_threshold: float = 0.5,
+        echo_return_loss_db: float = 6.0,
+        min_reference_rms: float = 100.0,
+    ):
+        """
+        Args:
+            sample_rate: Rate of both streams (Twilio: 8000)
+            window_ms: Inbound audio compared against the reference
+            max_delay_ms: Longest round trip at which echo is searched
+            correlation_threshold: Normalized correlation that marks echo
+            echo_return_loss_db: Inbound this far below the reference counts
+                as echo at half the correlation threshold
+            min_reference_rms: Reference quieter than this cannot cause echo
+        """
+        self.sample_rate = sample_rate
+        self.window = int(window_ms * sample_rate / 1000)
+        self.max_lag = int(max_delay_ms * sample_rate / 1000)
+        self.correlation_threshold = correlation_threshold
+        self.echo_return_loss_db = echo_return_loss_db
+        self.min_reference_rms = min_reference_rms
+
+        self.reference = AudioRing(self.window + self.max_lag)
+        self.inbound = AudioRing(self.window)
+
+        # Last decision, for logging
+        self.last_correlation = 0.0
+        self._suppressing = False
+
+        # Counters: one per barge-in candidate (a run of speech frames)
+        self.suppressed = 0
+        self.accepted = 0
+
+    def push_outbound(self, pcm: np.ndarray):
+        """Record a frame as it is sent (zeros for silence frames)."""
+        self.reference.write(pcm)
+
+    def push_inbound(self, pcm: np.ndarray):
+        self.inbound.write(pcm)
+
+    def is_echo(self) -> bool:
+        """True if the recent inbound audio is explained by what we sent."""
+        x = self.inbound.read().astype(np.float64)
+        ref = self.reference.read().astype(np.float64)
+        n = len(x)
+        if n == 0 or len(ref) < n:
+            self.last_correlation = 0.0
+            return False
+
+        ref_rms = np.sqrt(np.max(_sliding_energy(ref, n)) / n)
+        if ref_rms < self.min_reference_rms:
+            self.last_correlation = 0.0
+            return False
+
+        x = x - x.mean()
+        x_energy = float(np.dot(x, x))
+        if x_energy <= 0:
+            self.last_correlation = 0.0
+            return False
+
+        correlation = _max_normalized_correlation(ref, x, n * self.min_reference_rms ** 2)
+        self.last_correlation = correlation
+        if correlation >= self.correlation_threshold:
+            return True
+
+        x_rms = np.sqrt(x_energy / n)
+        level_db = 20 * np.log10(max(x_rms, 1e-9) / ref_rms)
+        return (
+            level_db <= -self.echo_return_loss_db
+            and correlation >= self.correlation_threshold / 2
+        )
+
+    def check_candidate(self) -> bool:
+        """
+        Decide on a barge-in candidate frame and count it.
+
+        A candidate is re-checked on every frame while it lasts; a run of
+        echo frames counts as one suppressed interrupt.
+        """
+        echo = self.is_echo()
+        if echo:
+            if not self._suppressing:
+                self.suppressed += 1
+        else:
+            self.accepted += 1
+        self._suppressing = echo
+        return echo
+
+    def end_candidate(self):
+        """No barge-in candidate this frame (ends a suppressed run)."""
+        self._suppressing = False
+
+
+def _sliding_energy(signal: np.ndarray, n: int) -> np.ndarray:
+    """Energy of every length-n window of signal."""
+    c = np.concatenate([[0.0], np.cumsum(signal * signal)])
+    return c[n:] - c[:-n]
+
+
+def _max_normalized_correlation(ref: np.ndarray, x: np.ndarray, min_energy: float) -> float:
+    """
+    Max |NCC| of x against every alignment inside ref (FFT, O(L log L)).
+
+    Reference windows with less than min_energy are skipped: they cannot
+    produce echo and their correlation is all rounding noise.
+    """
+    n = len(x)
+    size = 1 << int(np.ceil(np.log2(len(ref) + n)))
+    corr = np.fft.irfft(np.fft.rfft(ref, size) * np.conj(np.fft.rfft(x, size)), size)
+    corr = corr[:len(ref) - n + 1]  # corr[k] = sum(ref[k + i] * x[i])
+
+    # x is zero-mean, so subtracting each window's mean from ref changes nothing
+    # in the numerator; the denominator needs the window's variance
+    c1 = np.concatenate([[0.0], np.cumsum(ref)])
+    sums = c1[n:] - c1[:-n]
+    energy = _sliding_energy(ref, n) - sums * sums / n
+    audible = energy >= min_energy
+    if not np.any(audible):
+        return 0.0
+    denom = np.sqrt(energy[audible] * float(np.dot(x, x)))
+    return float(np.max(np.abs(corr[audible]) / denom))
@@ -11,15 +11,117 @@ class Settings(BaseSettings):
 
     # LLM Configuration (vLLM / RunPod)
     llm_base_url: str = Field(default="http://localhost:8000/v1", env="LLM_BASE_URL")
+    # Comma-separated vLLM replicas; overrides llm_base_url when set
+    llm_base_urls: str = Field(default="", env="LLM_BASE_URLS")
+    llm_max_failures: int = Field(default=3, env="LLM_MAX_FAILURES")
+    llm_slow_ttft_s: float = Field(default=5.0, env="LLM_SLOW_TTFT_S")
+    llm_eject_s: float = Field(default=30.0, env="LLM_EJECT_S")
+    llm_sticky_slack: int = Field(default=2, env="LLM_STICKY_SLACK")
+    # Admission control: outstanding LLM requests per replica. Must not exceed
+    # vLLM's --max-num-seqs (10 in docker-compose.yml, which sets both from
+    # VLLM_MAX_NUM_SEQS), or the excess queues unseen inside vLLM; more wait in a
+    # client-side queue (first turns, then short outputs, fair per call)
+    llm_max_concurrent_requests: int = Field(default=10, env="LLM_MAX_CONCURRENT_REQUESTS")
+    llm_short_output_tokens: int = Field(default=64, env="LLM_SHORT_OUTPUT_TOKENS")
+    # HTTP connection pool per LLM endpoint: max_concurrent_calls * this many
+    # connections (turn stream + prefill/warm-up or hedge), all kept alive
+    llm_connections_per_call: int = Field(default=2, env="LLM_CONNECTIONS_PER_CALL")
+    llm_keepalive_expiry_s: float = Field(default=60.0, env="LLM_KEEPALIVE_EXPIRY_S")
+    # Connections opened per endpoint at startup and pinged every interval (0 = no pings)
+    llm_warm_connections: int = Field(default=2, env="LLM_WARM_CONNECTIONS")
+    llm_keep_warm_interval_s: float = Field(default=4.0, env="LLM_KEEP_WARM_INTERVAL_S")
+    # Hedging: duplicate a streaming request to a second replica when its first
+    # token is later than the llm_hedge_percentile of recent TTFTs (clamped)
+    llm_hedging_enabled: bool = Field(default=True, env="LLM_HEDGING_ENABLED")
+    llm_hedge_percentile: float = Field(default=95.0, env="LLM_HEDGE_PERCENTILE")
+    llm_hedge_default_ms: float = Field(default=1000.0, env="LLM_HEDGE_DEFAULT_MS")
+    llm_hedge_min_ms: float = Field(default=150.0, env="LLM_HEDGE_MIN_MS")
+    llm_hedge_max_ms: float = Field(default=2000.0, env="LLM_HEDGE_MAX_MS")
+    # Max extra requests from hedging, as a fraction of all streaming requests
+    llm_hedge_budget: float = Field(default=0.05, env="LLM_HEDGE_BUDGET")
     llm_api_key: str = Field(default="EMPTY", env="LLM_API_KEY")
     llm_model: str = Field(default="google/gemma-3-27b-it", env="LLM_MODEL")
     llm_max_tokens: int = Field(default=256, env="LLM_MAX_TOKENS")
     llm_temperature: float = Field(default=0.7, env="LLM_TEMPERATURE")
+    # Prefill the call's prompt prefix at call start (vLLM automatic prefix caching)
+    llm_prefix_warming_enabled: bool = Field(default=True, env="LLM_PREFIX_WARMING_ENABLED")
+    llm_max_history_messages: int = Field(default=20, env="LLM_MAX_HISTORY_MESSAGES")
+    llm_history_trim_batch: int = Field(default=8, env="LLM_HISTORY_TRIM_BATCH")
+    # Prefill committed partial transcripts of long turns while the caller speaks
+    llm_partial_prefill_enabled: bool = Field(default=True, env="LLM_PARTIAL_PREFILL_ENABLED")
+    llm_partial_prefill_min_chars: int = Field(default=24, env="LLM_PARTIAL_PREFILL_MIN_CHARS")
+    # Two-tier cascade: a small model's opener is spoken while the large model
+    # continues it; off unless the small model's endpoint and name are set
+    llm_cascade_enabled: bool = Field(default=False, env="LLM_CASCADE_ENABLED")
+    llm_cascade_base_url: str = Field(default="", env="LLM_CASCADE_BASE_URL")
+    llm_cascade_model: str = Field(default="", env="LLM_CASCADE_MODEL")
+    llm_cascade_opener_max_tokens: int = Field(default=16, env="LLM_CASCADE_OPENER_MAX_TOKENS")
+    llm_cascade_opener_timeout_ms: int = Field(default=400, env="LLM_CASCADE_OPENER_TIMEOUT_MS")
+    llm_cascade_min_words: int = Field(default=3, env="LLM_CASCADE_MIN_WORDS")
+    llm_cascade_min_ttft_ms: int = Field(default=250, env="LLM_CASCADE_MIN_TTFT_MS")
 
     # TTS Configuration
     tts_engine: str = Field(default="edge", env="TTS_ENGINE")
     tts_voice: str = Field(default="en-US-AriaNeural", env="TTS_VOICE")
     tts_rate: str = Field(default="+0%", env="TTS_RATE")
+    # Synthesized-audio cache (LRU under a memory budget, single-flight misses);
+    # edge only, CSM audio depends on the call's speaker context
+    tts_cache_enabled: bool = Field(default=True, env="TTS_CACHE_ENABLED")
+    tts_cache_max_mb: float = Field(default=64.0, env="TTS_CACHE_MAX_MB")
+    # Prebuilt phrase audio (python -m src.tts.phrase_bank); "" = none
+    phrase_bank_path: str = Field(default="", env="PHRASE_BANK_PATH")
+    # Spoken as soon as the media stream starts; "" = wait for the caller
+    call_greeting: str = Field(default="", env="CALL_GREETING")
+    # Precomputed backchannel ("|"-separated) queued when a response has no
+    # audio this long after turn end; only phrase-bank/cached audio is used,
+    # so it is off until a bank with the phrases is built (PHRASE_BANK_PATH)
+    latency_filler_enabled: bool = Field(default=False, env="LATENCY_FILLER_ENABLED")
+    latency_filler_delay_ms: int = Field(default=800, env="LATENCY_FILLER_DELAY_MS")
+    latency_filler_phrases: str = Field(default="Mm-hmm.|Let me check.", env="LATENCY_FILLER_PHRASES")
+
+    # STT Configuration (fast model tried first for short turns; "" = no cascade)
+    # stt_language "auto" detects once per call; needs multilingual (non-.en) models
+    stt_language: str = Field(default="en", env="STT_LANGUAGE")
+    stt_language_min_detect_s: float = Field(default=1.5, env="STT_LANGUAGE_MIN_DETECT_S")
+    stt_language_lock_probability: float = Field(default=0.8, env="STT_LANGUAGE_LOCK_PROBABILITY")
+    stt_model: str = Field(default="base.en", env="STT_MODEL")
+    stt_fast_model: str = Field(default="tiny.en", env="STT_FAST_MODEL")
+    stt_fast_max_duration_s: float = Field(default=2.0, env="STT_FAST_MAX_DURATION_S")
+    stt_escalate_logprob: float = Field(default=-0.8, env="STT_ESCALATE_LOGPROB")
+    stt_incremental_after_s: float = Field(default=6.0, env="STT_INCREMENTAL_AFTER_S")
+    stt_incremental_step_s: float = Field(default=2.0, env="STT_INCREMENTAL_STEP_S")
+    stt_incremental_trim_s: float = Field(default=10.0, env="STT_INCREMENTAL_TRIM_S")
+    stt_max_buffer_s: float = Field(default=30.0, env="STT_MAX_BUFFER_S")
+    stt_filter_enabled: bool = Field(default=True, env="STT_FILTER_ENABLED")
+    stt_filter_min_rms_dbfs: float = Field(default=-50.0, env="STT_FILTER_MIN_RMS_DBFS")
+
+    # VAD Configuration (8000 = run Silero on native telephony audio)
+    vad_sample_rate: int = Field(default=8000, env="VAD_SAMPLE_RATE")
+    vad_prefix_padding_ms: int = Field(default=300, env="VAD_PREFIX_PADDING_MS")
+    vad_trailing_padding_ms: int = Field(default=200, env="VAD_TRAILING_PADDING_MS")
+
+    # Barge-in (early onset triggers before VAD confirmation; 0 = off)
+    barge_in_early_onset_ms: int = Field(default=32, env="BARGE_IN_EARLY_ONSET_MS")
+    barge_in_early_threshold: float = Field(default=0.8, env="BARGE_IN_EARLY_THRESHOLD")
+    barge_in_target_p95_ms: float = Field(default=150.0, env="BARGE_IN_TARGET_P95_MS")
+    # Echo gate: suppress barge-ins explained by our own outbound audio
+    echo_gate_enabled: bool = Field(default=True, env="ECHO_GATE_ENABLED")
+    echo_gate_max_delay_ms: int = Field(default=500, env="ECHO_GATE_MAX_DELAY_MS")
+    echo_gate_correlation: float = Field(default=0.5, env="ECHO_GATE_CORRELATION")
+    # Backchannels: pause on barge-in, resume if the overlap was "uh-huh"/"right"
+    backchannel_enabled: bool = Field(default=True, env="BACKCHANNEL_ENABLED")
+    backchannel_max_speech_ms: float = Field(default=800.0, env="BACKCHANNEL_MAX_SPEECH_MS")
+    backchannel_end_silence_ms: float = Field(default=250.0, env="BACKCHANNEL_END_SILENCE_MS")
+    backchannel_max_pause_ms: float = Field(default=1500.0, env="BACKCHANNEL_MAX_PAUSE_MS")
+    # Turn coalescing: a turn arriving before the previous response played merges into it
+    turn_coalescing_enabled: bool = Field(default=True, env="TURN_COALESCING_ENABLED")
+    # Response cache: replay the spoken answer to short common turns ("Hello?")
+    response_cache_enabled: bool = Field(default=True, env="RESPONSE_CACHE_ENABLED")
+    response_cache_max_entries: int = Field(default=256, env="RESPONSE_CACHE_MAX_ENTRIES")
+    response_cache_ttl_s: float = Field(default=3600.0, env="RESPONSE_CACHE_TTL_S")
+    response_cache_max_words: int = Field(default=6, env="RESPONSE_CACHE_MAX_WORDS")
+    # Comma-separated utterances never answered from the cache
+    response_cache_opt_outs: str = Field(default="", env="RESPONSE_CACHE_OPT_OUTS")
 
     # GPU / Production Configuration
     use_gpu: bool = Field(default=False, env="USE_GPU")
@@ -1,4 +1,7 @@
+from .cascade import LLMCascade
 from .client import LLMClient
 from .conversation import ConversationManager
+from .pool import EndpointPool
+from .scheduler import LLMScheduler
 
-__all__ = ["LLMClient", "ConversationManager"]
+__all__ = ["LLMCascade", "LLMClient", "ConversationManager", "EndpointPool", "LLMScheduler"]
@@ -0,0 +1,204 @@
+"""
+Two-tier LLM cascade: a small model speaks the opening clause.
+
+The large model's time to first token sets the floor on how soon a
+response starts. With the cascade, a small fast model first writes a
+brief opener ("Sure, let me look into that.") that goes to TTS at once,
+and the large model writes the rest as a continuation of that opener
+(vLLM continue_final_message), so the two halves read as one reply.
+
+Routing: a turn goes through the cascade only when
+- the caller said at least min_words words (a "yes" gets a short answer
+  that an opener would only pad), and
+- the large model is currently slow: its recent TTFT p50 is at least
+  min_ttft_s (or it has too few samples to tell).
+An opener that is late, fails or has no clause boundary is dropped and
+the turn is answered by the large model alone, by a plain request started
+alongside the opener. A usable opener cancels that request, so a routed
+turn costs the large model a second slot and prefill (the "replaced"
+count and wasted_request_rate in get_stats()).
+"""
+
+import asyncio
+import logging
+import re
+import time
+from contextlib import aclosing
+from typing import AsyncIterator, Dict, List, Optional
+
+from src.llm.client import LLMClient
+
+logger = logging.getLogger(__name__)
+
+OPENER_INSTRUCTION = (
+    "Reply with only a brief, natural opening phrase (at most 8 words) that "
+    "acknowledges what the caller just said, such as \"Sure, let me look into that.\" "
+    "Do not answer the question itself."
+)
+
+_SENTENCE_END_RE = re.compile(r"[.!?]")
+_CLAUSE_END_RE = re.compile(r"[,;:.!?]")
+
+
+def trim_opener(text: str, max_words: int = 12) -> str:
+    """
+    The opener up to its first sentence end, else its last clause boundary.
+
+    Returns "" if there is no boundary (the text may stop mid-phrase) or the
+    opener is too long to be one.
+    """
+    sentence_end = _SENTENCE_END_RE.search(text)
+    if sentence_end:
+        opener = text[:sentence_end.end()]
+    else:
+        boundaries = list(_CLAUSE_END_RE.finditer(text))
+        if not boundaries:
+            return ""
+        opener = text[:boundaries[-1].end()]
+    opener = opener.strip()
+    if not opener or len(opener.split()) > max_words:
+        return ""
+    return opener
+
+
+def continuation_messages(messages: List[Dict[str, str]], opener: str) -> List[Dict[str, str]]:
+    """The large model's request: the turn plus the spoken opener, left open."""
+    return messages + [{"role": "assistant", "content": opener}]
+
+
+class ReadAhead:
+    """
+    Drain an async token stream in a background task.
+
+    The request behind the stream runs (and is buffered) while the consumer
+    is busy elsewhere, e.g. speaking the opener. cancel() stops it; the
+    consumer then sees the end of the stream.
+    """
+
+    _DONE = object()
+
+    def __init__(self, tokens: AsyncIterator[str]):
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._pump(tokens))
+
+    async def _pump(self, tokens: AsyncIterator[str]):
+        try:
+            async for token in tokens:
+                self._queue.put_nowait(token)
+        except Exception as e:
+            self._queue.put_nowait(e)
+        finally:
+            self._queue.put_nowait(self._DONE)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> str:
+        item = await self._queue.get()
+        if item is self._DONE:
+            raise StopAsyncIteration
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    def cancel(self):
+        self._task.cancel()
+
+
+class LLMCascade:
+    """
+    Opener generation and routing for the small model of the cascade.
+
+    Usage:
+        if cascade.should_route(messages, llm_client):
+            opener = await cascade.opener(messages, call_id)   # "" = no opener
+    """
+
+    def __init__(self, client: LLMClient, min_words: int = 3, min_ttft_s: float = 0.25,
+                 timeout_s: float = 0.4, max_opener_words: int = 12):
+        """
+        Args:
+            client: Client of the small model (its max_tokens bounds the opener)
+            min_words: Shorter caller turns are answered by the large model alone
+            min_ttft_s: Route only while the large model's TTFT p50 is at least this
+            timeout_s: An opener not complete by then is dropped
+            max_opener_words: Longer openers are dropped (they start answering)
+        """
+        self.client = client
+        self.min_words = min_words
+        self.min_ttft_s = min_ttft_s
+        self.timeout_s = timeout_s
+        self.max_opener_words = max_opener_words
+
+        # Counters (totals since startup)
+        self.routed = 0
+        self.openers = 0
+        self.fallbacks = 0
+        self.skipped_short = 0
+        self.skipped_fast = 0
+        # Plain large-model requests started with the opener and cancelled
+        # for its continuation: a slot and a prefill spent for nothing
+        self.replaced = 0
+
+    def should_route(self, messages: List[Dict[str, str]], large: LLMClient) -> bool:
+        if not messages or messages[-1]["role"] != "user":
+            return False
+        if len(messages[-1]["content"].split()) < self.min_words:
+            self.skipped_short += 1
+            return False
+        tracker = large.ttft_tracker
+        if len(tracker.samples) >= tracker.min_samples and tracker.get_stats()["p50_s"] < self.min_ttft_s:
+            self.skipped_fast += 1
+            return False
+        self.routed += 1
+        return True
+
+    async def opener(self, messages: List[Dict[str, str]], call_id: Optional[str] = None) -> str:
+        """The small model's opening clause for this turn, or "" to fall back."""
+        start = time.monotonic()
+        try:
+            text = await asyncio.wait_for(self._generate(messages, call_id), self.timeout_s)
+        except asyncio.TimeoutError:
+            self.fallbacks += 1
+            logger.info(f"[{call_id}] Cascade opener late (>{self.timeout_s * 1000:.0f}ms), skipped")
+            return ""
+        except Exception as e:
+            self.fallbacks += 1
+            logger.warning(f"[{call_id}] Cascade opener failed: {e}")
+            return ""
+        opener = trim_opener(text, self.max_opener_words)
+        if not opener:
+            self.fallbacks += 1
+            logger.info(f"[{call_id}] Cascade opener unusable: {text!r}")
+            return ""
+        self.openers += 1
+        logger.info(f"[{call_id}] Cascade opener {opener!r} in {(time.monotonic() - start) * 1000:.0f}ms")
+        return opener
+
+    async def _generate(self, messages: List[Dict[str, str]], call_id: Optional[str]) -> str:
+        """Stream the small model until its first sentence ends."""
+        system = messages[0]
+        if system["role"] == "system":
+            prompt = [{"role": "system", "content": f"{system['content']}\n\n{OPENER_INSTRUCTION}"}]
+            prompt += messages[1:]
+        else:
+            prompt = [{"role": "system", "content": OPENER_INSTRUCTION}] + messages
+        text = ""
+        async with aclosing(self.client.generate_streaming(prompt, call_id=call_id)) as tokens:
+            async for token in tokens:
+                text += token
+                if _SENTENCE_END_RE.search(text):
+                    break
+        return text
+
+    def get_stats(self) -> Dict[str, int]:
+        """Routing and opener counters for /metrics"""
+        return {
+            "routed": self.routed,
+            "openers": self.openers,
+            "fallbacks": self.fallbacks,
+            "skipped_short": self.skipped_short,
+            "skipped_fast": self.skipped_fast,
+            "replaced": self.replaced,
+            "wasted_request_rate": self.replaced / self.routed if self.routed else 0.0,
+        }
@@ -2,13 +2,21 @@
 LLM client for streaming text generation via OpenAI-compatible API.
 
 Works with vLLM, RunPod, or any OpenAI-compatible endpoint.
-Uses AsyncOpenAI for non-blocking streaming in FastAPI.
+Uses AsyncOpenAI for non-blocking streaming in FastAPI. Several replicas
+(LLM_BASE_URLS) are balanced by an EndpointPool.
 """
 
+import asyncio
 import logging
-from typing import AsyncGenerator, List, Dict, Optional
+import time
+from typing import AsyncGenerator, List, Dict, Optional, Tuple
+import httpx
 from openai import AsyncOpenAI
 from src.config import settings
+from src.llm.http_pool import PoolStatsTransport, build_http_client
+from src.llm.hedging import HedgeBudget, TTFTTracker
+from src.llm.pool import Endpoint, EndpointPool
+from src.llm.scheduler import LLMScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +26,8 @@ class LLMClient:
     Async LLM client for streaming chat completions.
 
     Uses the OpenAI-compatible API to talk to vLLM, RunPod, or OpenAI.
-    Streams tokens one-by-one for minimum latency.
+    Streams tokens one-by-one for minimum latency. Requests tagged with a
+    call_id stick to one endpoint for prefix-cache locality.
     """
 
     def __init__(
@@ -28,58 +37,344 @@ class LLMClient:
         model: Optional[str] = None,
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        base_urls: Optional[List[str]] = None,
     ):
         self.model = model or settings.llm_model
         self.max_tokens = max_tokens or settings.llm_max_tokens
         self.temperature = temperature or settings.llm_temperature
 
-        self.client = AsyncOpenAI(
-            api_key=api_key or settings.llm_api_key,
-            base_url=base_url or settings.llm_base_url,
+        if base_urls is None:
+            base_urls = [base_url] if base_url else _configured_base_urls()
+        # Connection pools this client built (none when http_client is injected)
+        self.transports: List[PoolStatsTransport] = []
+        self.pool = EndpointPool(
+            [
+                Endpoint(url, AsyncOpenAI(
+                    api_key=api_key or settings.llm_api_key,
+                    base_url=url,
+                    http_client=http_client or self._pooled_http_client(),
+                ))
+                for url in base_urls
+            ],
+            max_failures=settings.llm_max_failures,
+            slow_ttft_s=settings.llm_slow_ttft_s,
+            eject_s=settings.llm_eject_s,
+            sticky_slack=settings.llm_sticky_slack,
+            max_in_flight=settings.llm_max_concurrent_requests,
         )
+        # First endpoint's client (the only one with a single backend)
+        self.client = self.pool.endpoints[0].client
+        # Admission control: capacity is per replica, so only the replicas
+        # taking traffic count, and the pool keeps each under its cap
+        self.scheduler = LLMScheduler(
+            max_concurrent=settings.llm_max_concurrent_requests * len(base_urls),
+            short_output_tokens=settings.llm_short_output_tokens,
+            capacity=self.pool.capacity,
+        )
+
+        # Connection keep-warm pings sent / failed
+        self.connection_pings = 0
+        self.connection_ping_failures = 0
+
+        # Prefix warm-up requests sent / failed / skipped (no free slot)
+        self.warmups = 0
+        self.warmup_failures = 0
+        self.warmups_skipped = 0
+
+        # Hedging of streaming requests with a late first token
+        self.hedging_enabled = settings.llm_hedging_enabled
+        self.ttft_tracker = TTFTTracker(
+            percentile=settings.llm_hedge_percentile,
+            default_s=settings.llm_hedge_default_ms / 1000,
+            min_s=settings.llm_hedge_min_ms / 1000,
+            max_s=settings.llm_hedge_max_ms / 1000,
+        )
+        self.hedge_budget = HedgeBudget(ratio=settings.llm_hedge_budget)
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.hedges_denied = 0
+        self.hedges_no_slot = 0
+
+        logger.info(f"LLMClient initialized: model={self.model}, base_urls={base_urls}")
+
+    def _pooled_http_client(self) -> httpx.AsyncClient:
+        """Keep-alive pool for one endpoint, sized for every call's concurrent requests."""
+        client, transport = build_http_client(
+            max_connections=settings.max_concurrent_calls * settings.llm_connections_per_call,
+            keepalive_expiry_s=settings.llm_keepalive_expiry_s,
+        )
+        self.transports.append(transport)
+        return client
+
+    async def warm_connections(self, count: Optional[int] = None) -> int:
+        """
+        Open, or keep alive, count pooled connections to every endpoint.
+
+        Sends count concurrent GET /models per endpoint: idle pooled
+        connections are reused (and their keep-alive timers reset), any
+        missing ones are opened. Never raises.
+
+        Returns:
+            Number of pings that succeeded
+        """
+        count = count or settings.llm_warm_connections
+
+        async def ping(endpoint: Endpoint) -> bool:
+            try:
+                await endpoint.client.models.list()
+                return True
+            except Exception as e:
+                logger.debug(f"LLM connection ping failed ({endpoint.base_url}): {e}")
+                return False
+
+        results = await asyncio.gather(
+            *(ping(endpoint) for endpoint in self.pool.endpoints for _ in range(count))
+        )
+        self.connection_pings += len(results)
+        self.connection_ping_failures += results.count(False)
+        return sum(results)
+
+    def get_connection_stats(self) -> Dict[str, int]:
+        """HTTP connection pool counters (summed over endpoints) for /metrics"""
+        return {
+            "in_use": sum(t.in_use for t in self.transports),
+            "waiting": sum(t.waiting for t in self.transports),
+            "new_connections": sum(t.new_connections for t in self.transports),
+            "pings": self.connection_pings,
+            "ping_failures": self.connection_ping_failures,
+        }
+
+    async def close(self):
+        """Close every endpoint's HTTP client (and its pooled connections)."""
+        for endpoint in self.pool.endpoints:
+            await endpoint.client.close()
+
+    def forget_call(self, call_id: str):
+        """Release a finished call's endpoint stickiness."""
+        self.pool.forget(call_id)
 
-        logger.info(f"LLMClient initialized: model={self.model}, base_url={base_url or settings.llm_base_url}")
+    def get_scheduler_stats(self) -> Dict[str, float]:
+        """Admission queue stats plus warm-ups skipped for lack of a slot"""
+        return {**self.scheduler.get_stats(), "warmups_skipped": self.warmups_skipped}
+
+    def get_hedge_stats(self) -> Dict[str, float]:
+        """Hedging counters plus streaming TTFT percentiles for /metrics"""
+        return {
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "hedges_denied": self.hedges_denied,
+            "hedges_no_slot": self.hedges_no_slot,
+            "hedge_delay_s": self.ttft_tracker.hedge_delay(),
+            **self.ttft_tracker.get_stats(),
+        }
 
     async def generate_streaming(
         self,
         messages: List[Dict[str, str]],
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
+        call_id: Optional[str] = None,
+        continue_final_message: bool = False,
     ) -> AsyncGenerator[str, None]:
         """
         Generate a streaming response from the LLM.
 
+        If no token has arrived after the hedge delay (a recent TTFT
+        percentile), the same request goes to a second endpoint as well;
+        the first to produce a token is streamed and the other cancelled.
+        Hedges are limited by the hedge budget and need two endpoints.
+        The request first waits for a scheduler slot; a hedge only goes
+        out if a second slot is free at once and the backup has room.
+
         Args:
             messages: Chat messages in OpenAI format
                 [{"role": "system", "content": "..."}, {"role": "user", "content": "..."}]
             max_tokens: Override default max tokens
             temperature: Override default temperature
+            call_id: Route with this call's stickiness (e.g. stream_sid)
+            continue_final_message: Extend the last (assistant) message
+                instead of starting a new one (vLLM chat template option)
 
         Yields:
             str: Individual text tokens as they're generated
         """
+        request = dict(
+            model=self.model,
+            messages=messages,
+            max_tokens=max_tokens or self.max_tokens,
+            temperature=temperature or self.temperature,
+            stream=True,
+        )
+        if continue_final_message:
+            request["extra_body"] = {"continue_final_message": True, "add_generation_prompt": False}
+        await self.scheduler.acquire(call_id, self.scheduler.priority_for(messages, request["max_tokens"]))
+        primary = self.pool.choose(call_id)
+        self.hedge_budget.earn()
+        start = time.monotonic()
+        # attempt task -> (endpoint, start time); outcome: endpoint -> (ttft, error)
+        attempts: Dict[asyncio.Task, Tuple[Endpoint, float]] = {}
+        outcome: Dict[Endpoint, Tuple[Optional[float], bool]] = {}
+        winner: Optional[asyncio.Task] = None
+        endpoint = primary
+        hedge_slots = 0
         try:
-            stream = await self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                max_tokens=max_tokens or self.max_tokens,
-                temperature=temperature or self.temperature,
-                stream=True,
-            )
+            attempts[self._start_attempt(primary, request)] = (primary, start)
+            hedge_at = start + self.ttft_tracker.hedge_delay() if self._can_hedge() else None
+            pending = set(attempts)
+            first_error = None
+            while pending and winner is None:
+                timeout = max(0.0, hedge_at - time.monotonic()) if hedge_at is not None else None
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    hedge_at = None
+                    backup = self._hedge_endpoint(primary, call_id)
+                    if backup is not None:
+                        hedge_slots += 1
+                        task = self._start_attempt(backup, request)
+                        attempts[task] = (backup, time.monotonic())
+                        pending.add(task)
+                    continue
+                for task in done:
+                    failed_endpoint, _ = attempts[task]
+                    if task.exception() is not None:
+                        outcome[failed_endpoint] = (None, True)
+                        first_error = first_error or task.exception()
+                        logger.warning(f"LLM request failed ({failed_endpoint.base_url}): {task.exception()}")
+                    elif winner is None:
+                        winner = task
+            if winner is None:
+                raise first_error
 
-            async for chunk in stream:
-                if chunk.choices and chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
+            endpoint, attempt_start = attempts[winner]
+            if len(attempts) > 1 and endpoint is not primary:
+                self.hedge_wins += 1
+            for task in attempts:
+                if task is not winner and not task.done():
+                    task.cancel()
+            stream, chunks, first = winner.result()
+            if first is not None:
+                ttft = time.monotonic() - start
+                self.ttft_tracker.add(ttft)
+                outcome[endpoint] = (time.monotonic() - attempt_start, False)
+                yield first
+                async for chunk in chunks:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            else:
+                outcome[endpoint] = (None, False)
 
         except Exception as e:
-            logger.error(f"LLM generation error: {e}")
+            if winner is not None:
+                outcome[endpoint] = (None, True)
+            logger.error(f"LLM generation error ({endpoint.base_url}): {e}")
             raise
+        finally:
+            await self._finish_attempts(attempts, outcome, winner)
+            for _ in range(1 + hedge_slots):
+                self.scheduler.release(call_id)
+
+    def _can_hedge(self) -> bool:
+        return self.hedging_enabled and len(self.pool.endpoints) > 1
+
+    def _hedge_endpoint(self, primary: Endpoint, call_id: Optional[str]) -> Optional[Endpoint]:
+        """
+        Second endpoint for a slow request, holding a scheduler slot of its own.
+
+        None if no other endpoint is up with room, the budget is spent or
+        no slot is free: replicas are slow exactly when hedges fire, and
+        a hedge must not push one past its cap or jump the queue.
+        """
+        backup = self.pool.choose_other(primary)
+        if backup is None:
+            return None
+        if not self.scheduler.try_acquire(call_id):
+            self.hedges_no_slot += 1
+            return None
+        if not self.hedge_budget.try_spend():
+            self.hedges_denied += 1
+            self.scheduler.release(call_id)
+            return None
+        self.hedges += 1
+        logger.info(f"Hedging slow LLM request from {primary.base_url} to {backup.base_url}")
+        return backup
+
+    def _start_attempt(self, endpoint: Endpoint, request: Dict) -> asyncio.Task:
+        self.pool.begin(endpoint)
+        return asyncio.create_task(self._first_token(endpoint, request))
+
+    @staticmethod
+    async def _first_token(endpoint: Endpoint, request: Dict):
+        """Open a stream and read up to its first token: (stream, chunk iterator, token or None)."""
+        stream = await endpoint.client.chat.completions.create(**request)
+        chunks = stream.__aiter__()
+        async for chunk in chunks:
+            if chunk.choices and chunk.choices[0].delta.content:
+                return stream, chunks, chunk.choices[0].delta.content
+        return stream, chunks, None
+
+    async def _finish_attempts(self, attempts, outcome, winner):
+        """Cancel or close every attempt's stream and record its outcome in the pool."""
+        for task in attempts:
+            if not task.done():
+                task.cancel()
+        results = await asyncio.gather(*attempts, return_exceptions=True)
+        for (task, (endpoint, started)), result in zip(attempts.items(), results):
+            if isinstance(result, tuple):
+                try:
+                    await result[0].close()
+                except Exception:
+                    pass
+            elif (isinstance(result, Exception) and not isinstance(result, asyncio.CancelledError)
+                    and endpoint not in outcome):
+                outcome[endpoint] = (None, True)
+            ttft_s, error = outcome.get(endpoint, (None, False))
+            self.pool.end(endpoint, ttft_s=ttft_s, error=error, started=started)
+
+    async def warm_prefix(self, messages: List[Dict[str, str]], call_id: Optional[str] = None) -> None:
+        """
+        Prefill messages into the server's prefix cache.
+
+        vLLM's automatic prefix caching keeps the KV blocks of this prompt,
+        so a later request starting with the same messages only prefills
+        what follows. One token is generated and discarded. Never raises:
+        a failed warm-up only costs the cache hit. With a call_id it goes
+        to the endpoint that call's turns will use. Skipped when no
+        scheduler slot is free: under load it would delay real turns.
+        """
+        if not self.scheduler.try_acquire(call_id):
+            self.warmups_skipped += 1
+            return
+        self.warmups += 1
+        endpoint = self.pool.choose(call_id)
+        start = self.pool.begin(endpoint)
+        ttft_s, error = None, False
+        try:
+            await endpoint.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                max_tokens=1,
+                temperature=self.temperature,
+            )
+            # One generated token: the round trip is this prompt's TTFT
+            ttft_s = time.monotonic() - start
+        except Exception as e:
+            error = True
+            self.warmup_failures += 1
+            logger.warning(f"LLM prefix warm-up failed ({endpoint.base_url}): {e}")
+        finally:
+            # Also when cancelled (the call ended)
+            self.pool.end(endpoint, ttft_s=ttft_s, error=error, started=start)
+            self.scheduler.release(call_id)
 
     async def generate(
         self,
         messages: List[Dict[str, str]],
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
+        call_id: Optional[str] = None,
     ) -> str:
         """
         Generate a complete (non-streaming) response.
@@ -88,19 +383,34 @@ class LLMClient:
             messages: Chat messages in OpenAI format
             max_tokens: Override default max tokens
             temperature: Override default temperature
+            call_id: Route with this call's stickiness (e.g. stream_sid)
 
         Returns:
             str: Complete response text
         """
-        try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                max_tokens=max_tokens or self.max_tokens,
-                temperature=temperature or self.temperature,
-            )
-            return response.choices[0].message.content
+        max_tokens = max_tokens or self.max_tokens
+        async with self.scheduler.slot(call_id, self.scheduler.priority_for(messages, max_tokens)):
+            endpoint = self.pool.choose(call_id)
+            started = self.pool.begin(endpoint)
+            error = False
+            try:
+                response = await endpoint.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature or self.temperature,
+                )
+                return response.choices[0].message.content
 
-        except Exception as e:
-            logger.error(f"LLM generation error: {e}")
-            raise
+            except Exception as e:
+                error = True
+                logger.error(f"LLM generation error ({endpoint.base_url}): {e}")
+                raise
+            finally:
+                self.pool.end(endpoint, error=error, started=started)
+
+
+def _configured_base_urls() -> List[str]:
+    """LLM_BASE_URLS (comma-separated replicas), else LLM_BASE_URL."""
+    urls = [u.strip() for u in settings.llm_base_urls.split(",") if u.strip()]
+    return urls or [settings.llm_base_url]
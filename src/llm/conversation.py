@@ -3,6 +3,11 @@ Conversation manager for per-call message history.
 
 Tracks user/assistant messages and manages context window for the LLM.
 Each phone call gets its own ConversationManager instance.
+
+get_messages() is append-only between trims: every turn's request starts
+with the byte-identical messages of the previous one, so vLLM's automatic
+prefix caching only prefills the new tail. History is trimmed in batches
+(trim_batch) so the prefix is rewritten rarely rather than on every turn.
 """
 
 import logging
@@ -31,6 +36,7 @@ class ConversationManager:
         self,
         system_prompt: Optional[str] = None,
         max_history_messages: int = 20,
+        trim_batch: int = 1,
     ):
         """
         Initialize conversation manager for a single call.
@@ -39,9 +45,12 @@ class ConversationManager:
             system_prompt: System message defining AI behavior.
             max_history_messages: Max user+assistant messages to keep.
                 Oldest messages are trimmed when limit is reached.
+            trim_batch: Messages dropped at once when over the limit; larger
+                batches invalidate the LLM prefix cache less often.
         """
         self.system_prompt = system_prompt or DEFAULT_SYSTEM_PROMPT
         self.max_history_messages = max_history_messages
+        self.trim_batch = max(1, trim_batch)
         self.history: List[Dict[str, str]] = []
 
     def add_user_message(self, text: str) -> None:
@@ -52,6 +61,26 @@ class ConversationManager:
         self._trim_history()
         logger.debug(f"Added user message: {text[:50]}...")
 
+    def extend_user_message(self, text: str) -> bool:
+        """
+        Append text to the last message if it is an unanswered user turn.
+
+        Used for turn coalescing: a caller who keeps talking after the
+        turn ended gets one LLM request for the whole utterance.
+
+        Returns:
+            True if merged, False if the last message is not a user turn
+            (caller should add_user_message() instead).
+        """
+        if not text or not text.strip():
+            return True
+        if not self.history or self.history[-1]["role"] != "user":
+            return False
+        last = self.history[-1]
+        last["content"] = f"{last['content']} {text.strip()}"
+        logger.debug(f"Merged into user message: {last['content'][:50]}...")
+        return True
+
     def add_assistant_message(self, text: str) -> None:
         """Add an assistant message (from LLM response)."""
         if not text or not text.strip():
@@ -72,15 +101,45 @@ class ConversationManager:
             *self.history,
         ]
 
+    def get_partial_messages(self, partial_text: str) -> List[Dict[str, str]]:
+        """
+        Messages as they will be sent once partial_text becomes the user turn.
+
+        Mirrors add_user_message()/extend_user_message() without changing
+        history, so prefilling these puts the final request's prefix
+        (up to the words not yet spoken) in the LLM's cache.
+        """
+        messages = self.get_messages()
+        text = partial_text.strip()
+        if self.history and self.history[-1]["role"] == "user":
+            last = messages[-1]
+            messages[-1] = {"role": "user", "content": f"{last['content']} {text}"}
+        else:
+            messages.append({"role": "user", "content": text})
+        return messages
+
+    def get_warmup_messages(self) -> List[Dict[str, str]]:
+        """
+        Messages that prefill everything the next request will start with.
+
+        An empty user turn is appended: chat templates such as Gemma's fold
+        the system prompt into the first user turn and render nothing for
+        a system-only conversation.
+        """
+        return [*self.get_messages(), {"role": "user", "content": ""}]
+
     def get_turn_count(self) -> int:
         """Get number of user turns in the conversation."""
         return sum(1 for m in self.history if m["role"] == "user")
 
     def _trim_history(self) -> None:
-        """Trim oldest messages if history exceeds max."""
-        while len(self.history) > self.max_history_messages:
-            removed = self.history.pop(0)
-            logger.debug(f"Trimmed oldest message: {removed['role']}")
+        """Trim oldest messages (at least trim_batch) if history exceeds max."""
+        overflow = len(self.history) - self.max_history_messages
+        if overflow <= 0:
+            return
+        drop = max(overflow, min(self.trim_batch, len(self.history) - 1))
+        del self.history[:drop]
+        logger.debug(f"Trimmed {drop} oldest messages")
 
     def add_assistant_message_partial(self, spoken_text: str) -> None:
         """
@@ -0,0 +1,86 @@
+"""
+Request hedging for LLM time-to-first-token.
+
+A slow replica or a queued batch leaves the caller in dead air. When the
+first token is later than usual, LLMClient sends the same request to a
+second replica and streams from whichever answers first. Two pieces
+keep that safe:
+
+- TTFTTracker: "later than usual" is a percentile of recent TTFTs, so
+  the hedge delay adapts to the deployment instead of being hand-tuned.
+- HedgeBudget: a token bucket that caps extra requests at a fraction of
+  all requests, so hedging cannot amplify an overload.
+"""
+
+from collections import deque
+from typing import Deque, Dict
+
+import numpy as np
+
+
+class TTFTTracker:
+    """Recent time-to-first-token samples and the hedge delay derived from them."""
+
+    def __init__(
+        self,
+        window: int = 500,
+        percentile: float = 95.0,
+        min_samples: int = 20,
+        default_s: float = 1.0,
+        min_s: float = 0.15,
+        max_s: float = 2.0,
+    ):
+        """
+        Args:
+            window: Samples kept
+            percentile: TTFT percentile after which a request is hedged
+            min_samples: Below this many samples default_s is used
+            default_s: Hedge delay until enough samples exist
+            min_s: Lower clamp of the hedge delay
+            max_s: Upper clamp of the hedge delay
+        """
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.default_s = default_s
+        self.min_s = min_s
+        self.max_s = max_s
+
+    def add(self, ttft_s: float):
+        self.samples.append(ttft_s)
+
+    def hedge_delay(self) -> float:
+        """Seconds without a first token before a request is hedged."""
+        if len(self.samples) < self.min_samples:
+            return self.default_s
+        delay = float(np.percentile(self.samples, self.percentile))
+        return min(self.max_s, max(self.min_s, delay))
+
+    def get_stats(self) -> Dict[str, float]:
+        """p50/p95/p99 TTFT (seconds) over the window"""
+        if not self.samples:
+            return {"p50_s": 0.0, "p95_s": 0.0, "p99_s": 0.0}
+        p50, p95, p99 = np.percentile(self.samples, [50, 95, 99])
+        return {"p50_s": float(p50), "p95_s": float(p95), "p99_s": float(p99)}
+
+
+class HedgeBudget:
+    """
+    Token bucket: each request earns `ratio` of a hedge, each hedge spends one.
+
+    Hedges therefore stay below ratio * requests + burst.
+    """
+
+    def __init__(self, ratio: float = 0.05, burst: float = 2.0):
+        self.ratio = ratio
+        self.burst = burst
+        self.tokens = burst
+
+    def earn(self):
+        self.tokens = min(self.burst, self.tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
@@ -0,0 +1,104 @@
+"""
+Pooled HTTP transport for the LLM endpoints.
+
+httpx's defaults (5 s keep-alive, limits sized for generic use) mean the
+first turn after an idle spell pays a fresh TCP (and TLS) handshake, and
+a burst of calls can queue for connections. build_http_client() sizes
+the pool explicitly; PoolStatsTransport counts what the pool is doing
+(connections in use, requests waiting for one, new connections opened)
+from httpcore's trace events, for /metrics.
+"""
+
+from typing import Tuple
+
+import httpx
+
+
+class _RequestState:
+    """Where one request is in the pool: waiting, then holding a connection."""
+
+    def __init__(self, stats: "PoolStatsTransport"):
+        self.stats = stats
+        self.acquired = False
+        self.released = False
+        stats.waiting += 1
+
+    def acquire(self):
+        if not self.acquired and not self.released:
+            self.acquired = True
+            self.stats.waiting -= 1
+            self.stats.in_use += 1
+
+    def release(self):
+        if self.released:
+            return
+        self.released = True
+        if self.acquired:
+            self.stats.in_use -= 1
+        else:
+            self.stats.waiting -= 1
+
+
+class PoolStatsTransport(httpx.AsyncBaseTransport):
+    """
+    Wraps a transport and tracks its connection pool.
+
+    A request is waiting until it starts sending on a connection, then
+    in use until its response is closed. HTTP/1.1 carries one request per
+    connection at a time, so in_use is the number of busy connections.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+        self.in_use = 0
+        self.waiting = 0
+        self.new_connections = 0
+        self.requests = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        state = _RequestState(self)
+        self.requests += 1
+        outer_trace = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: dict):
+            if event_name == "connection.connect_tcp.complete":
+                self.new_connections += 1
+            elif event_name.endswith("send_request_headers.started"):
+                state.acquire()
+            elif event_name.endswith(("response_closed.complete", "response_closed.failed")):
+                state.release()
+            if outer_trace is not None:
+                await outer_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+        try:
+            return await self._transport.handle_async_request(request)
+        except BaseException:
+            state.release()
+            raise
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+def build_http_client(
+    max_connections: int, keepalive_expiry_s: float
+) -> Tuple[httpx.AsyncClient, PoolStatsTransport]:
+    """
+    HTTP client for one LLM endpoint with an explicitly sized keep-alive pool.
+
+    Every connection may stay pooled (max_keepalive_connections ==
+    max_connections), so a burst's connections are reused by the next
+    one instead of being closed.
+
+    Returns:
+        (client, transport to read pool stats from)
+    """
+    transport = PoolStatsTransport(httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry_s,
+        )
+    ))
+    return httpx.AsyncClient(transport=transport), transport
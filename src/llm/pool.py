@@ -0,0 +1,196 @@
+"""
+Pool of OpenAI-compatible LLM endpoints (vLLM replicas).
+
+Routing:
+- Sticky per call: a call keeps its endpoint, so the prompt it grows turn
+  by turn stays in that replica's prefix cache. It only moves when its
+  endpoint is ejected, full (max_in_flight), or has sticky_slack more
+  requests in flight than the least-loaded one.
+- Least outstanding requests: everything else goes to the endpoint with
+  the fewest in-flight requests (ties: lower TTFT EWMA, then pool order).
+- Per-replica cap: endpoints with max_in_flight requests outstanding
+  (vLLM's --max-num-seqs) are skipped while another has room; beyond
+  that vLLM would queue the request internally. capacity() is what an
+  admission scheduler may let through without overfilling any replica.
+- Passive health: max_failures consecutive errors, or a TTFT EWMA above
+  slow_ttft_s, eject an endpoint for eject_s. After that it takes
+  traffic again with fresh stats. If every endpoint is ejected the
+  least-loaded one is still used — the pool never fails closed.
+"""
+
+import logging
+import time
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Endpoint:
+    """One backend: its client plus the counters routing decisions use."""
+
+    def __init__(self, base_url: str, client):
+        self.base_url = base_url
+        self.client = client
+        self.in_flight = 0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.ttft_ewma: Optional[float] = None
+        self.ejected_until = 0.0
+        self.ejected_at: Optional[float] = None
+        self.ejections = 0
+
+    def available(self, now: float) -> bool:
+        return now >= self.ejected_until
+
+
+class EndpointPool:
+    """
+    Chooses an endpoint per request and tracks its outcome.
+
+    Usage:
+        endpoint = pool.choose(call_id)
+        started = pool.begin(endpoint)
+        ... request via endpoint.client ...
+        pool.end(endpoint, ttft_s=..., error=..., started=started)
+    """
+
+    def __init__(
+        self,
+        endpoints: List[Endpoint],
+        max_failures: int = 3,
+        slow_ttft_s: float = 5.0,
+        eject_s: float = 30.0,
+        sticky_slack: int = 2,
+        ewma_alpha: float = 0.3,
+        max_in_flight: Optional[int] = None,
+    ):
+        """
+        Args:
+            endpoints: Backends in preference order (at least one)
+            max_failures: Consecutive errors that eject an endpoint
+            slow_ttft_s: TTFT EWMA that ejects an endpoint
+            eject_s: How long an ejected endpoint gets no new requests
+            sticky_slack: Extra in-flight requests tolerated to keep a call
+                on its endpoint
+            ewma_alpha: Weight of the newest TTFT sample
+            max_in_flight: Outstanding requests one endpoint takes (None = no cap)
+        """
+        if not endpoints:
+            raise ValueError("EndpointPool needs at least one endpoint")
+        self.endpoints = endpoints
+        self.max_failures = max_failures
+        self.slow_ttft_s = slow_ttft_s
+        self.eject_s = eject_s
+        self.sticky_slack = sticky_slack
+        self.ewma_alpha = ewma_alpha
+        self.max_in_flight = max_in_flight
+        self.sticky: Dict[str, Endpoint] = {}
+
+    def choose(self, call_id: Optional[str] = None) -> Endpoint:
+        """Pick the endpoint for a request (and pin the call to it)."""
+        available = self._routable()
+        # Over the cap only if every replica is full (the scheduler prevents that)
+        with_room = [e for e in available if self._has_room(e)] or available
+        least = min(with_room, key=self._load_key)
+
+        if call_id is not None:
+            pinned = self.sticky.get(call_id)
+            if (pinned is not None and pinned in with_room
+                    and pinned.in_flight <= least.in_flight + self.sticky_slack):
+                return pinned
+            self.sticky[call_id] = least
+        return least
+
+    def capacity(self) -> Optional[int]:
+        """Requests the routable endpoints take in total (None = no cap)."""
+        if self.max_in_flight is None:
+            return None
+        return self.max_in_flight * len(self._routable())
+
+    def _routable(self) -> List[Endpoint]:
+        """Endpoints not ejected, or all of them if every one is (never fail closed)."""
+        now = time.monotonic()
+        return [e for e in self.endpoints if e.available(now)] or self.endpoints
+
+    def _has_room(self, endpoint: Endpoint) -> bool:
+        return self.max_in_flight is None or endpoint.in_flight < self.max_in_flight
+
+    def choose_other(self, exclude: Endpoint) -> Optional[Endpoint]:
+        """
+        Least-loaded available endpoint other than exclude (for a hedge).
+
+        None if there is none: a hedge to the same replica, an ejected
+        one or a full one would only add load where it is already slow.
+        """
+        now = time.monotonic()
+        others = [e for e in self.endpoints
+                  if e is not exclude and e.available(now) and self._has_room(e)]
+        return min(others, key=self._load_key) if others else None
+
+    @staticmethod
+    def _load_key(endpoint: Endpoint):
+        return (endpoint.in_flight, endpoint.ttft_ewma or 0.0)
+
+    def begin(self, endpoint: Endpoint) -> float:
+        """Count a request in flight; returns its start time for end()."""
+        endpoint.in_flight += 1
+        endpoint.requests += 1
+        return time.monotonic()
+
+    def end(self, endpoint: Endpoint, ttft_s: Optional[float] = None, error: bool = False,
+            started: Optional[float] = None):
+        """
+        Record a finished request; ttft_s is None when no token arrived.
+
+        A failed request started (begin()) before the endpoint's last
+        ejection still counts as a failure, but not toward another
+        ejection: that outage is already accounted for.
+        """
+        endpoint.in_flight = max(0, endpoint.in_flight - 1)
+        if error:
+            endpoint.failures += 1
+            if (started is not None and endpoint.ejected_at is not None
+                    and started < endpoint.ejected_at):
+                return
+            endpoint.consecutive_failures += 1
+            if endpoint.consecutive_failures >= self.max_failures:
+                self._eject(endpoint, f"{endpoint.consecutive_failures} consecutive errors")
+            return
+        endpoint.consecutive_failures = 0
+        if ttft_s is not None:
+            if endpoint.ttft_ewma is None:
+                endpoint.ttft_ewma = ttft_s
+            else:
+                endpoint.ttft_ewma += self.ewma_alpha * (ttft_s - endpoint.ttft_ewma)
+            if endpoint.ttft_ewma > self.slow_ttft_s:
+                self._eject(endpoint, f"TTFT EWMA {endpoint.ttft_ewma:.2f}s")
+
+    def _eject(self, endpoint: Endpoint, reason: str):
+        endpoint.ejected_at = time.monotonic()
+        endpoint.ejected_until = endpoint.ejected_at + self.eject_s
+        endpoint.ejections += 1
+        # Fresh stats when it comes back (half-open)
+        endpoint.consecutive_failures = 0
+        endpoint.ttft_ewma = None
+        logger.warning(f"LLM endpoint {endpoint.base_url} ejected for {self.eject_s:.0f}s: {reason}")
+
+    def forget(self, call_id: str):
+        """Drop a finished call's stickiness."""
+        self.sticky.pop(call_id, None)
+
+    def get_stats(self) -> List[Dict[str, float]]:
+        """Per-endpoint counters for /metrics"""
+        now = time.monotonic()
+        return [
+            {
+                "base_url": e.base_url,
+                "in_flight": e.in_flight,
+                "requests": e.requests,
+                "failures": e.failures,
+                "ejections": e.ejections,
+                "ejected": 0 if e.available(now) else 1,
+                "ttft_ewma_s": e.ttft_ewma or 0.0,
+            }
+            for e in self.endpoints
+        ]
@@ -0,0 +1,137 @@
+"""
+Cache of spoken responses to common, context-independent caller turns.
+
+"Hello?", "Can you hear me?", "Who is this?" arrive on call after call,
+usually as the first turn under the same system prompt, and each costs a
+full LLM generation plus TTS. ResponseCache keeps the response text and
+its Twilio-ready audio, so a repeat is played straight into the
+AudioStreamer without touching the LLM or TTS.
+
+Key: normalized user text + system-prompt hash + a small state
+fingerprint (how many turns came before, bucketed, and the last
+assistant reply). Only short utterances are cached, entries expire after
+ttl_s, the least recently used entry is evicted at max_entries, and
+individual utterances can be opted out.
+"""
+
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+_PUNCT_RE = re.compile(r"[^\w\s]")
+
+
+def normalize_utterance(text: str) -> str:
+    """Lowercase, punctuation to spaces, whitespace collapsed."""
+    return " ".join(_PUNCT_RE.sub(" ", text.lower()).split())
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+class CachedResponse(NamedTuple):
+    """
+    A complete spoken response.
+
+    segments: one (end offset in text, audio payloads) per sentence, so a
+    barge-in during playback can save exactly the spoken prefix.
+    """
+    text: str
+    segments: List[Tuple[int, List[str]]]
+    created_at: float
+
+
+class ResponseCache:
+    """
+    LRU + TTL cache of responses keyed by utterance and conversation state.
+
+    Usage:
+        key = cache.key_for(messages)          # None: not cacheable
+        cached = cache.get(key) if key else None
+        ... on a complete miss: cache.put(key, text, segments)
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_s: float = 3600.0, max_words: int = 6,
+                 opt_outs: Optional[Iterable[str]] = None):
+        """
+        Args:
+            max_entries: Entries kept before LRU eviction
+            ttl_s: Seconds an entry stays valid
+            max_words: Longer utterances are never cached (not "common")
+            opt_outs: Utterances never cached (matched after normalization)
+        """
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self.max_words = max_words
+        self.opt_outs = {normalize_utterance(t) for t in (opt_outs or ())}
+        self.entries: "OrderedDict[Tuple[str, str, str], CachedResponse]" = OrderedDict()
+
+        # Counters (totals since startup)
+        self.lookups = 0
+        self.hits = 0
+        self.stores = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def opt_out(self, text: str):
+        """Never cache (or serve) responses to this utterance."""
+        normalized = normalize_utterance(text)
+        self.opt_outs.add(normalized)
+        for key in [k for k in self.entries if k[0] == normalized]:
+            del self.entries[key]
+
+    def key_for(self, messages: List[Dict[str, str]]) -> Optional[Tuple[str, str, str]]:
+        """
+        Cache key for answering messages, or None if the turn is not cacheable.
+
+        messages is the LLM request: system prompt first, the user turn last.
+        """
+        if len(messages) < 2 or messages[0]["role"] != "system" or messages[-1]["role"] != "user":
+            return None
+        utterance = normalize_utterance(messages[-1]["content"])
+        if not utterance or len(utterance.split()) > self.max_words or utterance in self.opt_outs:
+            return None
+        prior = messages[1:-1]
+        prior_turns = sum(1 for m in prior if m["role"] == "user")
+        last_reply = next((m["content"] for m in reversed(prior) if m["role"] == "assistant"), "")
+        fingerprint = _digest(f"{min(prior_turns, 2)}|{last_reply}")
+        return utterance, _digest(messages[0]["content"]), fingerprint
+
+    def get(self, key: Tuple[str, str, str]) -> Optional[CachedResponse]:
+        self.lookups += 1
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.created_at > self.ttl_s:
+            del self.entries[key]
+            self.expirations += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: Tuple[str, str, str], text: str, segments: List[Tuple[int, List[str]]]):
+        """Store a response that was generated and synthesized completely."""
+        if key[0] in self.opt_outs or not segments:
+            return
+        self.entries[key] = CachedResponse(text, segments, time.monotonic())
+        self.entries.move_to_end(key)
+        self.stores += 1
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def get_stats(self) -> Dict[str, float]:
+        """Lookups, hits, hit rate and size for /metrics"""
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "hit_rate": self.hits / self.lookups if self.lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "entries": len(self.entries),
+        }
@@ -0,0 +1,173 @@
+"""
+Admission control for LLM requests.
+
+vLLM runs at most --max-num-seqs sequences per replica and queues the
+rest internally, first come first served, where nobody can see or order
+them. LLMScheduler keeps that queue on our side instead: at most
+max_concurrent requests are outstanding, and the rest wait here where
+the order is ours and the depth and wait time are measured.
+
+Order when a slot frees:
+1. Priority: a call's first turn (the caller is waiting on a greeting-
+   level reply), then short expected outputs, then everything else.
+2. Fairness: within a priority, the call holding the fewest slots goes
+   first, so one call's back-to-back requests cannot starve the others.
+3. Arrival order.
+"""
+
+import asyncio
+import itertools
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Callable, Deque, Dict, List, Optional
+
+import numpy as np
+
+PRIORITY_FIRST_TURN = 0
+PRIORITY_SHORT = 1
+PRIORITY_NORMAL = 2
+
+
+class _Waiter:
+    def __init__(self, call_id: str, priority: int, seq: int):
+        self.call_id = call_id
+        self.priority = priority
+        self.seq = seq
+        self.enqueued_at = time.monotonic()
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+
+class LLMScheduler:
+    """
+    Concurrency cap with a priority/fair queue in front of the LLM.
+
+    Usage:
+        async with scheduler.slot(call_id, scheduler.priority_for(messages, max_tokens)):
+            ... one request ...
+    """
+
+    def __init__(self, max_concurrent: int, short_output_tokens: int = 64, window: int = 500,
+                 capacity: Optional[Callable[[], Optional[int]]] = None):
+        """
+        Args:
+            max_concurrent: Outstanding requests allowed (backend capacity)
+            short_output_tokens: max_tokens at or below this is a short output
+            window: Recent queue waits kept for percentiles
+            capacity: Current backend capacity, re-read at every admission
+                (e.g. EndpointPool.capacity, smaller while a replica is
+                ejected); the limit is the lower of it and max_concurrent
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.capacity = capacity
+        self.short_output_tokens = short_output_tokens
+        self.running = 0
+        self.running_by_call: Dict[str, int] = {}
+        self._waiters: List[_Waiter] = []
+        self._seq = itertools.count()
+
+        # Counters (totals since startup)
+        self.admitted = 0
+        self.queued = 0
+        self.rejected = 0
+        self.waits_ms: Deque[float] = deque(maxlen=window)
+
+    def priority_for(self, messages: List[Dict[str, str]], max_tokens: int) -> int:
+        """First turn (one user message; a greeting may precede it), short output, or normal."""
+        if sum(1 for m in messages if m["role"] == "user") <= 1:
+            return PRIORITY_FIRST_TURN
+        if max_tokens <= self.short_output_tokens:
+            return PRIORITY_SHORT
+        return PRIORITY_NORMAL
+
+    async def acquire(self, call_id: Optional[str], priority: int = PRIORITY_NORMAL):
+        """Wait for a slot. Cancelling the wait leaves the queue cleanly."""
+        key = call_id or ""
+        if self.running < self.limit and not self._waiters:
+            self._admit(key, 0.0)
+            return
+        waiter = _Waiter(key, priority, next(self._seq))
+        self._waiters.append(waiter)
+        self.queued += 1
+        # Capacity may have grown (an ejection expired) since the last release
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Admitted just as we were cancelled: hand the slot on
+                self.release(key)
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+    def try_acquire(self, call_id: Optional[str]) -> bool:
+        """Take a slot only if one is free and nobody is queued (opportunistic work)."""
+        if self.running < self.limit and not self._waiters:
+            self._admit(call_id or "", 0.0)
+            return True
+        self.rejected += 1
+        return False
+
+    def release(self, call_id: Optional[str]):
+        key = call_id or ""
+        self.running -= 1
+        remaining = self.running_by_call.get(key, 1) - 1
+        if remaining > 0:
+            self.running_by_call[key] = remaining
+        else:
+            self.running_by_call.pop(key, None)
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, call_id: Optional[str], priority: int = PRIORITY_NORMAL):
+        await self.acquire(call_id, priority)
+        try:
+            yield
+        finally:
+            self.release(call_id)
+
+    def _admit(self, key: str, wait_ms: float):
+        self.running += 1
+        self.running_by_call[key] = self.running_by_call.get(key, 0) + 1
+        self.admitted += 1
+        self.waits_ms.append(wait_ms)
+
+    def _dispatch(self):
+        # Cancelling a queued acquire() cancels its future at once, but the
+        # waiter only leaves the queue when its task runs again: skip it
+        self._waiters = [w for w in self._waiters if not w.future.done()]
+        while self.running < self.limit and self._waiters:
+            waiter = min(
+                self._waiters,
+                key=lambda w: (w.priority, self.running_by_call.get(w.call_id, 0), w.seq),
+            )
+            self._waiters.remove(waiter)
+            self._admit(waiter.call_id, (time.monotonic() - waiter.enqueued_at) * 1000)
+            waiter.future.set_result(None)
+
+    @property
+    def limit(self) -> int:
+        """Requests admitted right now: max_concurrent, or less if capacity is lower."""
+        capacity = self.capacity() if self.capacity is not None else None
+        if capacity is None:
+            return self.max_concurrent
+        return max(1, min(self.max_concurrent, capacity))
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def get_stats(self) -> Dict[str, float]:
+        """Queue depth, running requests and queue-wait percentiles for /metrics"""
+        p50, p95 = np.percentile(self.waits_ms, [50, 95]) if self.waits_ms else (0.0, 0.0)
+        return {
+            "queue_depth": self.queue_depth,
+            "running": self.running,
+            "max_concurrent": self.limit,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "wait_p50_ms": float(p50),
+            "wait_p95_ms": float(p95),
+        }
@@ -54,6 +54,17 @@ metrics = CallMetrics()
 _shutdown_event = asyncio.Event()
 
 
+async def _keep_llm_connections_warm():
+    """Ping the LLM endpoints so pooled connections never idle out between calls."""
+    llm_client = manager.get_llm_client()
+    cascade = manager.get_llm_cascade()
+    while True:
+        await asyncio.sleep(settings.llm_keep_warm_interval_s)
+        await llm_client.warm_connections()
+        if cascade is not None:
+            await cascade.client.warm_connections()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown lifecycle."""
@@ -64,7 +75,7 @@ async def lifespan(app: FastAPI):
 
     # Pre-load models so first call doesn't wait for downloads
     logger.info("Pre-loading STT model (faster-whisper)...")
-    await asyncio.to_thread(manager.get_stt_processor)
+    await asyncio.to_thread(manager.get_stt_router)
     logger.info("STT model loaded")
 
     logger.info("Pre-loading VAD model (Silero)...")
@@ -72,6 +83,23 @@ async def lifespan(app: FastAPI):
     manager.vad_detectors.pop("__warmup__", None)
     logger.info("VAD model loaded")
 
+    # Map prebuilt phrase audio so the greeting plays without synthesis
+    phrase_bank = manager.load_phrase_bank()
+    if phrase_bank:
+        logger.info(f"Phrase bank loaded: {phrase_bank.get_stats()['phrases']} phrases")
+
+    # Open LLM connections now so the first turn skips the TCP/TLS handshake
+    llm_client = manager.get_llm_client()
+    warmed = await llm_client.warm_connections()
+    logger.info(f"LLM connections warmed: {warmed} ok")
+    cascade = manager.get_llm_cascade()
+    if cascade is not None:
+        warmed = await cascade.client.warm_connections()
+        logger.info(f"Cascade opener model connections warmed: {warmed} ok")
+    keep_warm_task = None
+    if settings.llm_keep_warm_interval_s > 0:
+        keep_warm_task = asyncio.create_task(_keep_llm_connections_warm())
+
     # Register SIGTERM handler for graceful shutdown
     loop = asyncio.get_event_loop()
 
@@ -91,6 +119,11 @@ async def lifespan(app: FastAPI):
             if manager.get_active_call_count() == 0:
                 break
             await asyncio.sleep(1)
+    if keep_warm_task is not None:
+        keep_warm_task.cancel()
+    await llm_client.close()
+    if cascade is not None:
+        await cascade.client.close()
     logger.info("Client Caller shut down")
 
 
@@ -116,6 +149,45 @@ async def health_check():
 async def metrics_endpoint():
     """Prometheus-compatible metrics."""
     active = manager.get_active_call_count()
+    vad_stats = manager.get_vad_stats()
+    vad_skipped = vad_stats["windows"] - vad_stats["model_calls"]
+    vad_skip_ratio = vad_skipped / vad_stats["windows"] if vad_stats["windows"] else 0.0
+    filter_stats = manager.get_transcript_filter_stats()
+    language_stats = manager.get_language_stats()
+    barge_in_stats = manager.get_barge_in_stats()
+    turn_latency_stats = manager.get_turn_latency_stats()
+    echo_stats = manager.get_echo_stats()
+    backchannel_stats = manager.get_backchannel_stats()
+    response_cache_stats = manager.response_cache.get_stats()
+    tts_stream = manager.tts_stream
+    tts_cache_stats = tts_stream.cache.get_stats() if tts_stream and tts_stream.cache else {
+        "hits": 0, "misses": 0, "shared": 0, "hit_rate": 0.0, "evictions": 0,
+        "entries": 0, "bytes_held": 0,
+    }
+    phrase_bank_stats = manager.phrase_bank.get_stats() if manager.phrase_bank else {
+        "phrases": 0, "bytes_mapped": 0, "hits": 0, "frames_served": 0,
+    }
+    llm_client = manager.llm_client
+    llm_warmups = llm_client.warmups if llm_client else 0
+    llm_warmup_failures = llm_client.warmup_failures if llm_client else 0
+    hedge_stats = llm_client.get_hedge_stats() if llm_client else {
+        "hedges": 0, "hedge_wins": 0, "hedges_denied": 0, "hedges_no_slot": 0, "hedge_delay_s": 0.0,
+        "p50_s": 0.0, "p95_s": 0.0, "p99_s": 0.0,
+    }
+    scheduler_stats = llm_client.get_scheduler_stats() if llm_client else {
+        "queue_depth": 0, "running": 0, "max_concurrent": 0, "admitted": 0, "queued": 0,
+        "rejected": 0, "wait_p50_ms": 0.0, "wait_p95_ms": 0.0, "warmups_skipped": 0,
+    }
+    cascade_stats = manager.llm_cascade.get_stats() if manager.llm_cascade else {
+        "routed": 0, "openers": 0, "fallbacks": 0, "skipped_short": 0, "skipped_fast": 0,
+        "replaced": 0, "wasted_request_rate": 0.0,
+    }
+    connection_stats = llm_client.get_connection_stats() if llm_client else {
+        "in_use": 0, "waiting": 0, "new_connections": 0, "pings": 0, "ping_failures": 0,
+    }
+    stt_stats = manager.stt_router.get_stats() if manager.stt_router else {
+        "turns": 0, "fast_turns": 0, "escalations": 0, "avg_decode_ms": 0.0, "avg_cpu_ms": 0.0,
+    }
     lines = [
         f"# HELP client_caller_calls_total Total calls handled",
         f"# TYPE client_caller_calls_total counter",
@@ -129,7 +201,237 @@ async def metrics_endpoint():
         f"# HELP client_caller_avg_call_duration_ms Average call duration",
         f"# TYPE client_caller_avg_call_duration_ms gauge",
         f"client_caller_avg_call_duration_ms {metrics.avg_call_duration_ms:.1f}",
+        f"# HELP client_caller_vad_windows_total VAD windows scored",
+        f"# TYPE client_caller_vad_windows_total counter",
+        f"client_caller_vad_windows_total {vad_stats['windows']}",
+        f"# HELP client_caller_vad_model_calls_total Silero inferences actually run",
+        f"# TYPE client_caller_vad_model_calls_total counter",
+        f"client_caller_vad_model_calls_total {vad_stats['model_calls']}",
+        f"# HELP client_caller_vad_model_skip_ratio Fraction of VAD windows gated before Silero",
+        f"# TYPE client_caller_vad_model_skip_ratio gauge",
+        f"client_caller_vad_model_skip_ratio {vad_skip_ratio:.3f}",
+        f"# HELP client_caller_turn_perceived_latency_p50_ms Turn end to first audio the caller hears (latency filler included), p50",
+        f"# TYPE client_caller_turn_perceived_latency_p50_ms gauge",
+        f"client_caller_turn_perceived_latency_p50_ms {turn_latency_stats['perceived_p50_ms']:.1f}",
+        f"# HELP client_caller_turn_perceived_latency_p95_ms Turn end to first audio the caller hears (latency filler included), p95",
+        f"# TYPE client_caller_turn_perceived_latency_p95_ms gauge",
+        f"client_caller_turn_perceived_latency_p95_ms {turn_latency_stats['perceived_p95_ms']:.1f}",
+        f"# HELP client_caller_turn_response_latency_p50_ms Turn end to first audio of the response itself, p50",
+        f"# TYPE client_caller_turn_response_latency_p50_ms gauge",
+        f"client_caller_turn_response_latency_p50_ms {turn_latency_stats['response_p50_ms']:.1f}",
+        f"# HELP client_caller_turn_response_latency_p95_ms Turn end to first audio of the response itself, p95",
+        f"# TYPE client_caller_turn_response_latency_p95_ms gauge",
+        f"client_caller_turn_response_latency_p95_ms {turn_latency_stats['response_p95_ms']:.1f}",
+        f"# HELP client_caller_latency_fillers_total Backchannel fillers played while a response was late",
+        f"# TYPE client_caller_latency_fillers_total counter",
+        f"client_caller_latency_fillers_total {turn_latency_stats['fillers']}",
+        f"# HELP client_caller_barge_ins_total Barge-in interrupts handled",
+        f"# TYPE client_caller_barge_ins_total counter",
+        f"client_caller_barge_ins_total {barge_in_stats['count']}",
+        f"# HELP client_caller_barge_in_stop_latency_p50_ms First caller speech frame to last AI audio frame, p50",
+        f"# TYPE client_caller_barge_in_stop_latency_p50_ms gauge",
+        f"client_caller_barge_in_stop_latency_p50_ms {barge_in_stats['p50_ms']:.1f}",
+        f"# HELP client_caller_barge_in_stop_latency_p95_ms First caller speech frame to last AI audio frame, p95",
+        f"# TYPE client_caller_barge_in_stop_latency_p95_ms gauge",
+        f"client_caller_barge_in_stop_latency_p95_ms {barge_in_stats['p95_ms']:.1f}",
+        f"# HELP client_caller_barge_in_stop_latency_target_ms Configured p95 target",
+        f"# TYPE client_caller_barge_in_stop_latency_target_ms gauge",
+        f"client_caller_barge_in_stop_latency_target_ms {settings.barge_in_target_p95_ms:.1f}",
+        f"# HELP client_caller_barge_in_echo_suppressed_total Barge-in candidates explained by echo",
+        f"# TYPE client_caller_barge_in_echo_suppressed_total counter",
+        f"client_caller_barge_in_echo_suppressed_total {echo_stats['suppressed']}",
+        f"# HELP client_caller_barge_in_echo_accepted_total Barge-in candidates passed by the echo gate",
+        f"# TYPE client_caller_barge_in_echo_accepted_total counter",
+        f"client_caller_barge_in_echo_accepted_total {echo_stats['accepted']}",
+        f"# HELP client_caller_backchannels_resumed_total Paused barge-ins resumed as backchannels",
+        f"# TYPE client_caller_backchannels_resumed_total counter",
+        f"client_caller_backchannels_resumed_total {backchannel_stats['resumed']}",
+        f"# HELP client_caller_barge_ins_committed_total Paused barge-ins that interrupted the response",
+        f"# TYPE client_caller_barge_ins_committed_total counter",
+        f"client_caller_barge_ins_committed_total {backchannel_stats['committed']}",
+        f"# HELP client_caller_regenerations_saved_total LLM+TTS responses kept instead of regenerated",
+        f"# TYPE client_caller_regenerations_saved_total counter",
+        f"client_caller_regenerations_saved_total {backchannel_stats['regenerations_saved']}",
+        f"# HELP client_caller_backchannel_tts_seconds_saved_total Estimated TTS audio not regenerated",
+        f"# TYPE client_caller_backchannel_tts_seconds_saved_total counter",
+        f"client_caller_backchannel_tts_seconds_saved_total {backchannel_stats['tts_seconds_saved']:.1f}",
+        f"# HELP client_caller_coalesced_turns_total Unplayed responses cancelled and merged into the next turn (duplicate generations avoided)",
+        f"# TYPE client_caller_coalesced_turns_total counter",
+        f"client_caller_coalesced_turns_total {manager.coalesced_turns_total}",
+        f"# HELP client_caller_response_cache_lookups_total Cacheable turns looked up in the response cache",
+        f"# TYPE client_caller_response_cache_lookups_total counter",
+        f"client_caller_response_cache_lookups_total {response_cache_stats['lookups']}",
+        f"# HELP client_caller_response_cache_hits_total Turns answered from the response cache (no LLM or TTS)",
+        f"# TYPE client_caller_response_cache_hits_total counter",
+        f"client_caller_response_cache_hits_total {response_cache_stats['hits']}",
+        f"# HELP client_caller_response_cache_hit_rate Response cache hits per lookup",
+        f"# TYPE client_caller_response_cache_hit_rate gauge",
+        f"client_caller_response_cache_hit_rate {response_cache_stats['hit_rate']:.3f}",
+        f"# HELP client_caller_response_cache_evictions_total Entries evicted (LRU)",
+        f"# TYPE client_caller_response_cache_evictions_total counter",
+        f"client_caller_response_cache_evictions_total {response_cache_stats['evictions']}",
+        f"# HELP client_caller_response_cache_entries Responses held",
+        f"# TYPE client_caller_response_cache_entries gauge",
+        f"client_caller_response_cache_entries {response_cache_stats['entries']}",
+        f"# HELP client_caller_tts_cache_hits_total Sentences replayed from the TTS audio cache",
+        f"# TYPE client_caller_tts_cache_hits_total counter",
+        f"client_caller_tts_cache_hits_total {tts_cache_stats['hits']}",
+        f"# HELP client_caller_tts_cache_shared_total Sentences that joined an in-flight synthesis",
+        f"# TYPE client_caller_tts_cache_shared_total counter",
+        f"client_caller_tts_cache_shared_total {tts_cache_stats['shared']}",
+        f"# HELP client_caller_tts_cache_misses_total Sentences synthesized",
+        f"# TYPE client_caller_tts_cache_misses_total counter",
+        f"client_caller_tts_cache_misses_total {tts_cache_stats['misses']}",
+        f"# HELP client_caller_tts_cache_hit_rate Sentences not synthesized (hit or shared) per request",
+        f"# TYPE client_caller_tts_cache_hit_rate gauge",
+        f"client_caller_tts_cache_hit_rate {tts_cache_stats['hit_rate']:.3f}",
+        f"# HELP client_caller_tts_cache_evictions_total Cached sentences evicted (LRU)",
+        f"# TYPE client_caller_tts_cache_evictions_total counter",
+        f"client_caller_tts_cache_evictions_total {tts_cache_stats['evictions']}",
+        f"# HELP client_caller_tts_cache_bytes Payload bytes held by the TTS audio cache",
+        f"# TYPE client_caller_tts_cache_bytes gauge",
+        f"client_caller_tts_cache_bytes {tts_cache_stats['bytes_held']}",
+        f"# HELP client_caller_phrase_bank_phrases Prebuilt phrases mapped from the phrase bank",
+        f"# TYPE client_caller_phrase_bank_phrases gauge",
+        f"client_caller_phrase_bank_phrases {phrase_bank_stats['phrases']}",
+        f"# HELP client_caller_phrase_bank_hits_total Phrases played from the phrase bank",
+        f"# TYPE client_caller_phrase_bank_hits_total counter",
+        f"client_caller_phrase_bank_hits_total {phrase_bank_stats['hits']}",
+        f"# HELP client_caller_llm_prefix_warmups_total Prompt-prefix warm-up requests sent",
+        f"# TYPE client_caller_llm_prefix_warmups_total counter",
+        f"client_caller_llm_prefix_warmups_total {llm_warmups}",
+        f"# HELP client_caller_llm_prefix_warmup_failures_total Prompt-prefix warm-ups that failed",
+        f"# TYPE client_caller_llm_prefix_warmup_failures_total counter",
+        f"client_caller_llm_prefix_warmup_failures_total {llm_warmup_failures}",
+        f"# HELP client_caller_llm_queue_depth LLM requests waiting for an admission slot",
+        f"# TYPE client_caller_llm_queue_depth gauge",
+        f"client_caller_llm_queue_depth {scheduler_stats['queue_depth']}",
+        f"# HELP client_caller_llm_running LLM requests holding an admission slot",
+        f"# TYPE client_caller_llm_running gauge",
+        f"client_caller_llm_running {scheduler_stats['running']}",
+        f"# HELP client_caller_llm_max_concurrent Admission slots (backend capacity)",
+        f"# TYPE client_caller_llm_max_concurrent gauge",
+        f"client_caller_llm_max_concurrent {scheduler_stats['max_concurrent']}",
+        f"# HELP client_caller_llm_admitted_total LLM requests admitted",
+        f"# TYPE client_caller_llm_admitted_total counter",
+        f"client_caller_llm_admitted_total {scheduler_stats['admitted']}",
+        f"# HELP client_caller_llm_queued_total LLM requests that had to wait for a slot",
+        f"# TYPE client_caller_llm_queued_total counter",
+        f"client_caller_llm_queued_total {scheduler_stats['queued']}",
+        f"# HELP client_caller_llm_queue_wait_p50_ms Admission queue wait over recent requests, p50",
+        f"# TYPE client_caller_llm_queue_wait_p50_ms gauge",
+        f"client_caller_llm_queue_wait_p50_ms {scheduler_stats['wait_p50_ms']:.1f}",
+        f"# HELP client_caller_llm_queue_wait_p95_ms Admission queue wait over recent requests, p95",
+        f"# TYPE client_caller_llm_queue_wait_p95_ms gauge",
+        f"client_caller_llm_queue_wait_p95_ms {scheduler_stats['wait_p95_ms']:.1f}",
+        f"# HELP client_caller_llm_prefix_warmups_skipped_total Prefix warm-ups skipped because no slot was free",
+        f"# TYPE client_caller_llm_prefix_warmups_skipped_total counter",
+        f"client_caller_llm_prefix_warmups_skipped_total {scheduler_stats['warmups_skipped']}",
+        f"# HELP client_caller_llm_cascade_routed_total Turns routed to the small-model opener",
+        f"# TYPE client_caller_llm_cascade_routed_total counter",
+        f"client_caller_llm_cascade_routed_total {cascade_stats['routed']}",
+        f"# HELP client_caller_llm_cascade_openers_total Small-model openers spoken before the large model's answer",
+        f"# TYPE client_caller_llm_cascade_openers_total counter",
+        f"client_caller_llm_cascade_openers_total {cascade_stats['openers']}",
+        f"# HELP client_caller_llm_cascade_fallbacks_total Routed turns whose opener was late, failed or unusable",
+        f"# TYPE client_caller_llm_cascade_fallbacks_total counter",
+        f"client_caller_llm_cascade_fallbacks_total {cascade_stats['fallbacks']}",
+        f"# HELP client_caller_llm_cascade_replaced_total Large-model requests started with the opener and cancelled for its continuation",
+        f"# TYPE client_caller_llm_cascade_replaced_total counter",
+        f"client_caller_llm_cascade_replaced_total {cascade_stats['replaced']}",
+        f"# HELP client_caller_llm_cascade_wasted_request_rate Replaced large-model requests per routed turn",
+        f"# TYPE client_caller_llm_cascade_wasted_request_rate gauge",
+        f"client_caller_llm_cascade_wasted_request_rate {cascade_stats['wasted_request_rate']:.3f}",
+        f"# HELP client_caller_llm_cascade_skipped_total Turns not routed, by rule",
+        f"# TYPE client_caller_llm_cascade_skipped_total counter",
+        f"client_caller_llm_cascade_skipped_total{{rule=\"short_turn\"}} {cascade_stats['skipped_short']}",
+        f"client_caller_llm_cascade_skipped_total{{rule=\"fast_model\"}} {cascade_stats['skipped_fast']}",
+        f"# HELP client_caller_llm_http_connections_in_use LLM HTTP connections carrying a request",
+        f"# TYPE client_caller_llm_http_connections_in_use gauge",
+        f"client_caller_llm_http_connections_in_use {connection_stats['in_use']}",
+        f"# HELP client_caller_llm_http_requests_waiting LLM requests waiting for a pooled connection",
+        f"# TYPE client_caller_llm_http_requests_waiting gauge",
+        f"client_caller_llm_http_requests_waiting {connection_stats['waiting']}",
+        f"# HELP client_caller_llm_http_new_connections_total LLM HTTP connections opened (TCP handshakes)",
+        f"# TYPE client_caller_llm_http_new_connections_total counter",
+        f"client_caller_llm_http_new_connections_total {connection_stats['new_connections']}",
+        f"# HELP client_caller_llm_keep_warm_pings_total Connection warm-up/keep-warm pings sent",
+        f"# TYPE client_caller_llm_keep_warm_pings_total counter",
+        f"client_caller_llm_keep_warm_pings_total {connection_stats['pings']}",
+        f"# HELP client_caller_llm_keep_warm_ping_failures_total Connection pings that failed",
+        f"# TYPE client_caller_llm_keep_warm_ping_failures_total counter",
+        f"client_caller_llm_keep_warm_ping_failures_total {connection_stats['ping_failures']}",
+        f"# HELP client_caller_llm_hedges_total Streaming requests duplicated to a second endpoint",
+        f"# TYPE client_caller_llm_hedges_total counter",
+        f"client_caller_llm_hedges_total {hedge_stats['hedges']}",
+        f"# HELP client_caller_llm_hedge_wins_total Hedged requests answered first by the second endpoint",
+        f"# TYPE client_caller_llm_hedge_wins_total counter",
+        f"client_caller_llm_hedge_wins_total {hedge_stats['hedge_wins']}",
+        f"# HELP client_caller_llm_hedges_denied_total Hedges skipped because the hedge budget was spent",
+        f"# TYPE client_caller_llm_hedges_denied_total counter",
+        f"client_caller_llm_hedges_denied_total {hedge_stats['hedges_denied']}",
+        f"# HELP client_caller_llm_hedges_no_slot_total Hedges skipped because no admission slot was free",
+        f"# TYPE client_caller_llm_hedges_no_slot_total counter",
+        f"client_caller_llm_hedges_no_slot_total {hedge_stats['hedges_no_slot']}",
+        f"# HELP client_caller_llm_hedge_delay_s Current adaptive hedge delay",
+        f"# TYPE client_caller_llm_hedge_delay_s gauge",
+        f"client_caller_llm_hedge_delay_s {hedge_stats['hedge_delay_s']:.3f}",
+        f"# HELP client_caller_llm_ttft_p50_s Streaming time to first token over recent requests, p50",
+        f"# TYPE client_caller_llm_ttft_p50_s gauge",
+        f"client_caller_llm_ttft_p50_s {hedge_stats['p50_s']:.3f}",
+        f"# HELP client_caller_llm_ttft_p99_s Streaming time to first token over recent requests, p99",
+        f"# TYPE client_caller_llm_ttft_p99_s gauge",
+        f"client_caller_llm_ttft_p99_s {hedge_stats['p99_s']:.3f}",
+        f"# HELP client_caller_llm_partial_prefills_total Prefills of committed partial transcripts during long turns",
+        f"# TYPE client_caller_llm_partial_prefills_total counter",
+        f"client_caller_llm_partial_prefills_total {manager.partial_prefills_total}",
+        f"# HELP client_caller_stt_turns_total Turn-end transcriptions",
+        f"# TYPE client_caller_stt_turns_total counter",
+        f"client_caller_stt_turns_total {stt_stats['turns']}",
+        f"# HELP client_caller_stt_fast_turns_total Turns answered by the fast STT model",
+        f"# TYPE client_caller_stt_fast_turns_total counter",
+        f"client_caller_stt_fast_turns_total {stt_stats['fast_turns']}",
+        f"# HELP client_caller_stt_escalations_total Fast decodes re-run on the accurate model",
+        f"# TYPE client_caller_stt_escalations_total counter",
+        f"client_caller_stt_escalations_total {stt_stats['escalations']}",
+        f"# HELP client_caller_stt_avg_decode_ms Average turn-end STT latency",
+        f"# TYPE client_caller_stt_avg_decode_ms gauge",
+        f"client_caller_stt_avg_decode_ms {stt_stats['avg_decode_ms']:.1f}",
+        f"# HELP client_caller_stt_avg_cpu_ms Average process CPU time per turn-end decode",
+        f"# TYPE client_caller_stt_avg_cpu_ms gauge",
+        f"client_caller_stt_avg_cpu_ms {stt_stats['avg_cpu_ms']:.1f}",
+        f"# HELP client_caller_stt_language_detect_turns_total Turns decoded with language detection",
+        f"# TYPE client_caller_stt_language_detect_turns_total counter",
+        f"client_caller_stt_language_detect_turns_total {language_stats['detect_turns']}",
+        f"# HELP client_caller_stt_language_pinned_turns_total Turns decoded in the call's pinned language",
+        f"# TYPE client_caller_stt_language_pinned_turns_total counter",
+        f"client_caller_stt_language_pinned_turns_total {language_stats['pinned_turns']}",
+        f"# HELP client_caller_stt_transcripts_dropped_total Transcripts rejected as noise or hallucination",
+        f"# TYPE client_caller_stt_transcripts_dropped_total counter",
+        f"client_caller_stt_transcripts_dropped_total {filter_stats['dropped']}",
+        f"# HELP client_caller_llm_calls_saved_total LLM generations avoided by the transcript filter",
+        f"# TYPE client_caller_llm_calls_saved_total counter",
+        f"client_caller_llm_calls_saved_total {filter_stats['llm_calls_saved']}",
+        f"# HELP client_caller_tts_seconds_saved_total Estimated TTS audio seconds avoided (drops x avg response)",
+        f"# TYPE client_caller_tts_seconds_saved_total counter",
+        f"client_caller_tts_seconds_saved_total {filter_stats['tts_seconds_saved']:.1f}",
     ]
+
+    # Per-replica LLM routing state (one series per endpoint)
+    endpoint_stats = llm_client.pool.get_stats() if llm_client else []
+    for name, kind, help_text in (
+        ("in_flight", "gauge", "LLM requests in flight per endpoint"),
+        ("requests", "counter", "LLM requests routed per endpoint"),
+        ("failures", "counter", "LLM request errors per endpoint"),
+        ("ejections", "counter", "Passive-health ejections per endpoint"),
+        ("ejected", "gauge", "1 while the endpoint is ejected"),
+        ("ttft_ewma_s", "gauge", "Smoothed time to first token per endpoint"),
+    ):
+        metric = f"client_caller_llm_endpoint_{name}" + ("_total" if kind == "counter" else "")
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        for stats in endpoint_stats:
+            lines.append(f'{metric}{{endpoint="{stats["base_url"]}"}} {stats[name]}')
     return PlainTextResponse("\n".join(lines) + "\n", media_type="text/plain")
 
 
@@ -147,6 +449,8 @@ async def twiml_endpoint(request: Request):
 async def initiate_outbound_call(to_number: str, websocket_url: str):
     """Initiate an outbound call."""
     try:
+        # Ringing takes seconds; warm the LLM prompt prefix meanwhile
+        manager.warm_llm_prefix()
         result = await create_outbound_call(to_number, websocket_url)
         return result
     except Exception as e:
@@ -3,8 +3,16 @@ Speech-to-Text (STT) module for real-time transcription.
 
 Exports:
     STTProcessor: Streaming STT processor using faster-whisper
+    STTRouter: Fast/accurate model cascade for turn-end transcription
+    TranscriptFilter: Post-STT gate for noise and hallucinated transcripts
+    LanguageLock: Per-call language detection and pinning
+    BackchannelClassifier: Tells acknowledgements apart from interruptions
 """
 
 from .processor import STTProcessor
+from .router import STTRouter
+from .filters import TranscriptFilter
+from .language import LanguageLock
+from .backchannel import BackchannelClassifier
 
-__all__ = ["STTProcessor"]
+__all__ = ["STTProcessor", "STTRouter", "TranscriptFilter", "LanguageLock", "BackchannelClassifier"]
@@ -0,0 +1,104 @@
+"""
+Backchannel detection for barge-in candidates.
+
+Callers say "uh-huh", "right" or "okay" while the AI is talking to show
+they are listening, not to take the turn. Treating that as an interrupt
+throws away the generated-but-unspoken audio and costs a whole new
+LLM + TTS response. BackchannelClassifier decides, from the transcript
+and length of the overlapping speech, whether playback should resume.
+"""
+
+import re
+from typing import FrozenSet, Iterable, Optional
+
+# Acknowledgements that do not take the turn (normalized: lowercase, no punctuation)
+BACKCHANNEL_PHRASES: FrozenSet[str] = frozenset({
+    "uh huh",
+    "uhhuh",
+    "mm hmm",
+    "mmhmm",
+    "mhm",
+    "mm",
+    "hmm",
+    "yeah",
+    "yep",
+    "yes",
+    "right",
+    "okay",
+    "ok",
+    "sure",
+    "i see",
+    "got it",
+    "alright",
+    "all right",
+    "cool",
+    "nice",
+    "great",
+    "true",
+    "exactly",
+})
+
+_PUNCT_RE = re.compile(r"[^\w\s]")
+
+
+def _normalize(text: str) -> str:
+    return " ".join(_PUNCT_RE.sub(" ", text.lower().replace("-", "")).split())
+
+
+class BackchannelClassifier:
+    """
+    Tells short acknowledgements apart from real interruptions.
+
+    Usage:
+        if classifier.is_backchannel(result["text"], speech_ms):
+            resume playback
+    """
+
+    def __init__(self, max_speech_ms: float = 800.0, phrases: Optional[Iterable[str]] = None):
+        """
+        Args:
+            max_speech_ms: Overlap speech longer than this is always an interrupt
+            phrases: Acknowledgement list (default BACKCHANNEL_PHRASES); a
+                transcript made only of these phrases is a backchannel
+        """
+        self.max_speech_ms = max_speech_ms
+        if phrases is None:
+            self.phrases = BACKCHANNEL_PHRASES
+        else:
+            self.phrases = frozenset(_normalize(p) for p in phrases)
+        self._max_words = max(len(p.split()) for p in self.phrases)
+
+        # Counters (totals since startup)
+        self.resumed = 0
+        self.committed = 0
+
+    def is_backchannel(self, text: str, speech_ms: float) -> bool:
+        """
+        True if the overlap is an acknowledgement.
+
+        Empty text (noise the VAD let through) also counts: there is
+        nothing to respond to, so the response should carry on.
+        """
+        if speech_ms > self.max_speech_ms:
+            return False
+        normalized = _normalize(text)
+        if not normalized:
+            return True
+        return self._only_phrases(normalized.split())
+
+    def _only_phrases(self, words) -> bool:
+        """Whether words split entirely into known phrases ("yeah okay", "mm hmm right")."""
+        reachable = [True] + [False] * len(words)
+        for end in range(1, len(words) + 1):
+            for size in range(1, min(self._max_words, end) + 1):
+                if reachable[end - size] and " ".join(words[end - size:end]) in self.phrases:
+                    reachable[end] = True
+                    break
+        return reachable[-1]
+
+    def record_resume(self):
+        """One response kept instead of regenerated"""
+        self.resumed += 1
+
+    def record_commit(self):
+        self.committed += 1
@@ -0,0 +1,149 @@
+"""
+Post-STT gate for noise and Whisper hallucinations.
+
+Line noise or a cough that gets past the VAD is still transcribed, and
+Whisper tends to hallucinate stock phrases on it ("Thank you.", "you").
+Each such transcript would cost a full LLM generation plus TTS.
+TranscriptFilter rejects them using the decode's own confidence signals
+(no_speech_prob, avg_logprob, compression_ratio), the utterance energy
+and a list of known hallucinations.
+
+Known phrases are only dropped when some other signal is weak, so a
+caller who clearly says "thank you" still gets an answer.
+"""
+
+import re
+from typing import Any, Dict, FrozenSet, Iterable, Optional
+
+import numpy as np
+
+# Phrases Whisper produces on silence/noise (normalized: lowercase, no punctuation)
+KNOWN_HALLUCINATIONS: FrozenSet[str] = frozenset({
+    "you",
+    "thank you",
+    "thanks",
+    "thank you very much",
+    "thanks for watching",
+    "thank you for watching",
+    "please subscribe",
+    "subtitles by the amaraorg community",
+    "bye",
+    "the end",
+    "so",
+    "uh",
+    "um",
+    "hmm",
+})
+
+_PUNCT_RE = re.compile(r"[^\w\s']")
+_TAG_RE = re.compile(r"^\s*[\[\(\*].*[\]\)\*]\s*$")  # [BLANK_AUDIO], (music), *cough*
+
+
+def _normalize(text: str) -> str:
+    return " ".join(_PUNCT_RE.sub("", text.lower()).split())
+
+
+def rms_dbfs(pcm: np.ndarray) -> float:
+    """RMS level of int16 audio in dBFS (-inf for digital silence)"""
+    if len(pcm) == 0:
+        return float("-inf")
+    rms = np.sqrt(np.mean(pcm.astype(np.float64) ** 2))
+    if rms <= 0:
+        return float("-inf")
+    return 20 * np.log10(rms / 32768.0)
+
+
+class TranscriptFilter:
+    """
+    Decides whether a turn-end transcript is worth answering.
+
+    Usage:
+        reason = transcript_filter.rejection_reason(result, pcm_16khz)
+        if reason:
+            transcript_filter.record_drop(reason)
+    """
+
+    def __init__(
+        self,
+        no_speech_threshold: float = 0.6,
+        logprob_threshold: float = -1.0,
+        compression_ratio_threshold: float = 2.4,
+        min_rms_dbfs: float = -50.0,
+        hallucination_no_speech: float = 0.2,
+        hallucination_logprob: float = -0.5,
+        hallucination_rms_dbfs: float = -40.0,
+        hallucinations: Optional[Iterable[str]] = None,
+    ):
+        """
+        Args:
+            no_speech_threshold: Drop when no_speech_prob exceeds this AND
+                avg_logprob < logprob_threshold (Whisper's own silence rule)
+            logprob_threshold: See above
+            compression_ratio_threshold: Drop repetitive decodes above this
+            min_rms_dbfs: Drop utterances quieter than this outright
+            hallucination_no_speech: Known phrase dropped above this no_speech_prob
+            hallucination_logprob: Known phrase dropped below this avg_logprob
+            hallucination_rms_dbfs: Known phrase dropped below this level
+            hallucinations: Phrase list (default KNOWN_HALLUCINATIONS)
+        """
+        self.no_speech_threshold = no_speech_threshold
+        self.logprob_threshold = logprob_threshold
+        self.compression_ratio_threshold = compression_ratio_threshold
+        self.min_rms_dbfs = min_rms_dbfs
+        self.hallucination_no_speech = hallucination_no_speech
+        self.hallucination_logprob = hallucination_logprob
+        self.hallucination_rms_dbfs = hallucination_rms_dbfs
+        if hallucinations is None:
+            self.hallucinations = KNOWN_HALLUCINATIONS
+        else:
+            self.hallucinations = frozenset(_normalize(h) for h in hallucinations)
+
+        # Counters (totals since startup)
+        self.passed = 0
+        self.dropped: Dict[str, int] = {}
+
+    def rejection_reason(self, result: Dict[str, Any], pcm_16khz: np.ndarray) -> Optional[str]:
+        """
+        Check a transcribe_utterance() result.
+
+        Returns:
+            None if the transcript should be answered, else a short reason
+            ("empty", "tag", "quiet", "no_speech", "repetitive", "hallucination")
+        """
+        text = result.get("text", "")
+        normalized = _normalize(text)
+        if not normalized:
+            return "empty"
+        if _TAG_RE.match(text):
+            return "tag"
+
+        level = rms_dbfs(pcm_16khz)
+        if level < self.min_rms_dbfs:
+            return "quiet"
+
+        no_speech = result.get("no_speech_prob", 0.0)
+        logprob = result.get("avg_logprob", 0.0)
+        if no_speech > self.no_speech_threshold and logprob < self.logprob_threshold:
+            return "no_speech"
+        if result.get("compression_ratio", 0.0) > self.compression_ratio_threshold:
+            return "repetitive"
+
+        if normalized in self.hallucinations and (
+            no_speech > self.hallucination_no_speech
+            or logprob < self.hallucination_logprob
+            or level < self.hallucination_rms_dbfs
+        ):
+            return "hallucination"
+
+        return None
+
+    def record_pass(self):
+        self.passed += 1
+
+    def record_drop(self, reason: str):
+        self.dropped[reason] = self.dropped.get(reason, 0) + 1
+
+    @property
+    def dropped_total(self) -> int:
+        """Each drop is one LLM generation (and its TTS) not spent"""
+        return sum(self.dropped.values())
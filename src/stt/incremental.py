@@ -0,0 +1,151 @@
+"""
+Incremental transcription of long utterances.
+
+A caller who keeps talking would otherwise be transcribed in one blocking
+decode when they stop, so turn-end latency grows with utterance length.
+IncrementalTranscriber feeds the utterance to a per-call
+OnlineASRProcessor while speech is still going on, letting its segment
+trimming (chunk_completed_segment) commit text and drop decoded audio.
+At turn end only the untrimmed tail is decoded.
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .whisper_online import OnlineASRProcessor
+
+logger = logging.getLogger(__name__)
+
+
+class _CallLanguageASR:
+    """Shared ASR seen through one call's language (OnlineASRProcessor can't pass one)."""
+
+    def __init__(self, asr):
+        self.asr = asr
+        self.language: Optional[str] = None
+
+    def __getattr__(self, name):
+        return getattr(self.asr, name)
+
+    def transcribe(self, audio, init_prompt=""):
+        if self.language is None:
+            return self.asr.transcribe(audio, init_prompt=init_prompt)
+        return self.asr.transcribe(audio, init_prompt=init_prompt, language=self.language)
+
+
+class IncrementalTranscriber:
+    """
+    Per-call streaming decode of one long utterance (shared ASR model).
+
+    advance() and finish() block on Whisper and must run in a worker
+    thread, one at a time per call.
+    """
+
+    SAMPLING_RATE = 16000
+
+    def __init__(self, asr, buffer_trimming_s: float = 10.0, max_buffer_s: float = 30.0):
+        """
+        Args:
+            asr: Loaded ASR backend (e.g. STTProcessor.asr), shared across calls
+            buffer_trimming_s: Trim completed segments once the buffer is longer
+            max_buffer_s: Hard cap on buffered audio; past it the current
+                hypothesis is committed and the buffer restarted
+        """
+        self._asr = _CallLanguageASR(asr)
+        self.online = OnlineASRProcessor(self._asr, buffer_trimming=("segment", buffer_trimming_s))
+        self.max_buffer_s = max_buffer_s
+        self.texts: List[str] = []
+        self.audio_seconds = 0.0
+        self.active = False
+
+    @property
+    def language(self) -> Optional[str]:
+        """Language for this call's decodes ("auto" = detect, None = model default)"""
+        return self._asr.language
+
+    @language.setter
+    def language(self, language: Optional[str]):
+        self._asr.language = language
+
+    @property
+    def text(self) -> str:
+        """Text committed so far for the current utterance"""
+        return "".join(self.texts).strip()
+
+    def advance(self, pcm_16khz: np.ndarray):
+        """Add speech audio and decode/commit what LocalAgreement confirms."""
+        self.active = True
+        self.online.insert_audio_chunk(pcm_16khz.astype(np.float32) / 32768.0)
+        self.audio_seconds += len(pcm_16khz) / self.SAMPLING_RATE
+
+        _, _, text = self.online.process_iter()
+        if text:
+            self.texts.append(text)
+
+        if len(self.online.audio_buffer) / self.SAMPLING_RATE > self.max_buffer_s:
+            self._force_trim()
+
+    def _force_trim(self):
+        """Commit the unconfirmed hypothesis and restart the audio buffer."""
+        _, _, text = self.online.finish()
+        if text:
+            self.texts.append(text)
+        # Keep committed words so the prompt still carries the context
+        commited = self.online.commited
+        self.online.init(offset=self.online.buffer_time_offset)
+        self.online.commited = commited
+        logger.debug(f"Incremental STT buffer hit {self.max_buffer_s}s cap, restarted")
+
+    def finish(self, tail_pcm_16khz: np.ndarray) -> Dict[str, Any]:
+        """
+        Decode the remaining audio and return the whole utterance.
+
+        Returns the same shape as STTProcessor.transcribe_utterance(); the
+        per-segment confidence fields are not available here and are neutral.
+        decode_ms covers only the turn-end work.
+        """
+        start = time.perf_counter()
+        cpu_start = time.process_time()
+
+        if len(tail_pcm_16khz):
+            self.online.insert_audio_chunk(tail_pcm_16khz.astype(np.float32) / 32768.0)
+            self.audio_seconds += len(tail_pcm_16khz) / self.SAMPLING_RATE
+        if len(self.online.audio_buffer):
+            _, _, text = self.online.process_iter()
+            if text:
+                self.texts.append(text)
+        _, _, text = self.online.finish()
+        if text:
+            self.texts.append(text)
+
+        result = {
+            "type": "final",
+            "text": self.text,
+            "avg_logprob": 0.0,
+            "no_speech_prob": 0.0,
+            "compression_ratio": 0.0,
+            "language": (
+                self._asr.original_language if self._asr.language in (None, "auto")
+                else self._asr.language
+            ),
+            "language_probability": 1.0,
+            "duration": self.audio_seconds,
+            "decode_ms": (time.perf_counter() - start) * 1000,
+            "cpu_ms": (time.process_time() - cpu_start) * 1000,
+            "profile": "streaming_partial",
+            "model": "accurate",
+            "escalated": False,
+            "incremental": True,
+        }
+        self.reset()
+        return result
+
+    def reset(self):
+        """Forget the current utterance (keeps the shared model)."""
+        self.online.init()
+        self.texts = []
+        self.audio_seconds = 0.0
+        self.active = False
@@ -0,0 +1,87 @@
+"""
+Per-call spoken-language state.
+
+With STT_LANGUAGE=auto every decode would pay Whisper's language
+detection. LanguageLock detects once, on the first utterance long enough
+to be reliable, and pins that language for the rest of the call. If the
+pinned decodes turn unconfident for consecutive turns (the caller
+switched language, or the first guess was wrong), it unlocks so the next
+turn detects again.
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+AUTO = "auto"
+
+
+class LanguageLock:
+    """
+    Tracks which language to decode a call's turns in.
+
+    Usage:
+        language = lock.language_for_turn()  # code, or "auto" to detect
+        result = router.transcribe_utterance(audio, language=language)
+        lock.observe(result)
+    """
+
+    def __init__(
+        self,
+        default: str = AUTO,
+        min_detect_s: float = 1.5,
+        lock_probability: float = 0.8,
+        redetect_logprob: float = -1.0,
+        redetect_after: int = 2,
+    ):
+        """
+        Args:
+            default: Fixed language code, or "auto" to detect per call
+            min_detect_s: Shortest utterance whose detection may lock
+            lock_probability: Detection confidence required to lock
+            redetect_logprob: Pinned decodes below this avg_logprob count as unsure
+            redetect_after: Consecutive unsure turns before unlocking
+        """
+        self.fixed = default != AUTO
+        self.language: Optional[str] = None if default == AUTO else default
+        self.min_detect_s = min_detect_s
+        self.lock_probability = lock_probability
+        self.redetect_logprob = redetect_logprob
+        self.redetect_after = redetect_after
+        self._unsure_turns = 0
+
+        # Stats
+        self.detect_turns = 0
+        self.pinned_turns = 0
+
+    def language_for_turn(self) -> str:
+        """Language code to decode with, or "auto" to detect."""
+        return self.language or AUTO
+
+    def observe(self, result: Dict[str, Any]):
+        """Update state from a transcribe_utterance() result."""
+        if self.language is None:
+            self.detect_turns += 1
+            if (result.get("duration", 0.0) >= self.min_detect_s
+                    and result.get("language")
+                    and result.get("language_probability", 0.0) >= self.lock_probability):
+                self.language = result["language"]
+                self._unsure_turns = 0
+                logger.info(
+                    f"Locked call language to {self.language} "
+                    f"(p={result['language_probability']:.2f})"
+                )
+            return
+
+        self.pinned_turns += 1
+        if self.fixed:
+            return
+        if result.get("avg_logprob", 0.0) < self.redetect_logprob:
+            self._unsure_turns += 1
+            if self._unsure_turns >= self.redetect_after:
+                logger.info(f"Unlocking call language {self.language} after {self._unsure_turns} unsure turns")
+                self.language = None
+                self._unsure_turns = 0
+        else:
+            self._unsure_turns = 0
@@ -8,10 +8,52 @@ Provides real-time streaming transcription with sub-200ms latency using:
 
 from .whisper_online import FasterWhisperASR, OnlineASRProcessor
 import numpy as np
-from typing import Dict, Any, Generator
+from typing import Dict, Any, Generator, Optional
+import logging
 import sys
+import time
 import platform
 
+logger = logging.getLogger(__name__)
+
+
+# Named faster-whisper decode settings, chosen per call site.
+#
+# - turn_final_fast: whole VAD-bounded utterance at end of turn. Only the text
+#   is used, so greedy decoding without timestamps, no temperature fallback
+#   and no internal VAD (our VAD already trimmed the audio).
+# - streaming_partial: OnlineASRProcessor re-decodes the growing buffer every
+#   iteration and LocalAgreement needs word timestamps; greedy keeps each
+#   re-decode cheap since unstable words get re-decoded anyway.
+# - accurate: upstream whisper_streaming defaults plus the standard
+#   temperature fallback, for offline/quality paths.
+TRANSCRIPTION_PROFILES: Dict[str, Dict[str, Any]] = {
+    "turn_final_fast": {
+        "beam_size": 1,
+        "word_timestamps": False,
+        "without_timestamps": True,
+        "temperature": 0.0,
+        "condition_on_previous_text": False,
+        "vad_filter": False,
+    },
+    "streaming_partial": {
+        "beam_size": 1,
+        "word_timestamps": True,
+        "without_timestamps": False,
+        "temperature": 0.0,
+        "condition_on_previous_text": True,
+        "vad_filter": False,
+    },
+    "accurate": {
+        "beam_size": 5,
+        "word_timestamps": True,
+        "without_timestamps": False,
+        "temperature": (0.0, 0.2, 0.4, 0.6, 0.8, 1.0),
+        "condition_on_previous_text": True,
+        "vad_filter": False,
+    },
+}
+
 
 class CustomFasterWhisperASR(FasterWhisperASR):
     """
@@ -23,9 +65,13 @@ class CustomFasterWhisperASR(FasterWhisperASR):
     """
 
     def __init__(self, lan, modelsize=None, cache_dir=None, model_dir=None,
-                 device="cpu", compute_type="int8", logfile=sys.stderr):
+                 device="cpu", compute_type="int8", logfile=sys.stderr,
+                 profile: str = "streaming_partial"):
+        if profile not in TRANSCRIPTION_PROFILES:
+            raise ValueError(f"Unknown transcription profile: {profile}")
         self.device = device
         self.compute_type = compute_type
+        self.profile = profile
         super().__init__(lan, modelsize, cache_dir, model_dir, logfile)
 
     def load_model(self, modelsize=None, cache_dir=None, model_dir=None):
@@ -48,6 +94,37 @@ class CustomFasterWhisperASR(FasterWhisperASR):
         )
         return model
 
+    def transcribe_with_info(self, audio, init_prompt="", profile: Optional[str] = None,
+                             language: Optional[str] = None):
+        """
+        Decode audio with a named profile.
+
+        Returns (segments, info). Options set through use_vad() or
+        set_translate_task() still apply on top of the profile.
+        language overrides the model's language for this decode
+        ("auto" = detect); None keeps the configured one.
+        """
+        options = dict(TRANSCRIPTION_PROFILES[profile or self.profile])
+        options.update(self.transcribe_kargs)
+        if language is None:
+            language = self.original_language
+        elif language == "auto":
+            language = None
+        segments, info = self.model.transcribe(
+            audio,
+            language=language,
+            initial_prompt=init_prompt or None,
+            **options
+        )
+        # segments is lazy: decoding happens here
+        return list(segments), info
+
+    def transcribe(self, audio, init_prompt="", profile: Optional[str] = None,
+                   language: Optional[str] = None):
+        """Used by OnlineASRProcessor; defaults to this instance's profile"""
+        segments, _ = self.transcribe_with_info(audio, init_prompt, profile, language)
+        return segments
+
 
 class STTProcessor:
     """
@@ -107,6 +184,77 @@ class STTProcessor:
         # Initialize online processor with LocalAgreement policy
         self.online = OnlineASRProcessor(self.asr)
 
+    def transcribe_utterance(
+        self,
+        pcm_16khz: np.ndarray,
+        profile: str = "turn_final_fast",
+        language: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Transcribe one complete utterance in a single decode.
+
+        Used at turn end, where the VAD has already bounded the audio and
+        only the text is needed. Does not touch the streaming state.
+
+        Args:
+            pcm_16khz: numpy array of int16 audio samples at 16kHz
+            profile: Key of TRANSCRIPTION_PROFILES
+            language: Language code, "auto" to detect, None for the default
+
+        Returns:
+            dict: Final transcript with structure:
+                {
+                    "type": "final",
+                    "text": str,
+                    "avg_logprob": float,        # duration-weighted over segments
+                    "no_speech_prob": float,     # max over segments
+                    "compression_ratio": float,  # max over segments
+                    "language": str,
+                    "language_probability": float,
+                    "duration": float,           # audio seconds
+                    "decode_ms": float,
+                    "cpu_ms": float,             # process CPU time (all threads)
+                    "profile": str
+                }
+        """
+        audio_float = pcm_16khz.astype(np.float32) / 32768.0
+
+        start = time.perf_counter()
+        cpu_start = time.process_time()
+        segments, info = self.asr.transcribe_with_info(
+            audio_float, profile=profile, language=language
+        )
+        decode_ms = (time.perf_counter() - start) * 1000
+        cpu_ms = (time.process_time() - cpu_start) * 1000
+
+        text = "".join(s.text for s in segments).strip()
+        total = sum(max(s.end - s.start, 0.0) for s in segments)
+        if segments and total > 0:
+            avg_logprob = sum(s.avg_logprob * max(s.end - s.start, 0.0) for s in segments) / total
+        elif segments:
+            avg_logprob = sum(s.avg_logprob for s in segments) / len(segments)
+        else:
+            avg_logprob = 0.0
+        duration = len(pcm_16khz) / 16000
+
+        logger.debug(
+            f"Decoded {duration:.2f}s with profile {profile} in {decode_ms:.0f}ms"
+        )
+
+        return {
+            "type": "final",
+            "text": text,
+            "avg_logprob": avg_logprob,
+            "no_speech_prob": max((s.no_speech_prob for s in segments), default=0.0),
+            "compression_ratio": max((s.compression_ratio for s in segments), default=0.0),
+            "language": info.language,
+            "language_probability": info.language_probability,
+            "duration": duration,
+            "decode_ms": decode_ms,
+            "cpu_ms": cpu_ms,
+            "profile": profile
+        }
+
     def process_audio_chunk(
         self,
         pcm_16khz: np.ndarray
@@ -0,0 +1,111 @@
+"""
+Model cascade for turn-end transcription.
+
+Most caller turns are short ("yes", "no", a name or a number) and a tiny
+Whisper model transcribes them well at a fraction of the cost. STTRouter
+decodes with the fast model first and escalates to the larger model only
+when the utterance is long or the fast decode is not confident.
+
+Both STTProcessor instances are loaded once and shared across calls.
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from .processor import STTProcessor
+
+logger = logging.getLogger(__name__)
+
+
+class STTRouter:
+    """
+    Routes each utterance to a fast (tiny) or accurate (base+) model.
+
+    Routing:
+    - duration > max_fast_duration_s: accurate model only
+    - otherwise fast model; escalate to accurate if the fast decode's
+      avg_logprob < escalate_logprob
+    """
+
+    def __init__(
+        self,
+        accurate: STTProcessor,
+        fast: Optional[STTProcessor] = None,
+        max_fast_duration_s: float = 2.0,
+        escalate_logprob: float = -0.8,
+    ):
+        """
+        Args:
+            accurate: Processor for long or low-confidence utterances
+            fast: Processor tried first for short utterances (None = no cascade)
+            max_fast_duration_s: Longest utterance sent to the fast model
+            escalate_logprob: Fast-model avg_logprob below which we re-decode
+        """
+        self.accurate = accurate
+        self.fast = fast
+        self.max_fast_duration_s = max_fast_duration_s
+        self.escalate_logprob = escalate_logprob
+
+        # Stats (totals since startup)
+        self.turns = 0
+        self.fast_turns = 0
+        self.escalations = 0
+        self.decode_ms_total = 0.0
+        self.cpu_ms_total = 0.0
+
+    def transcribe_utterance(
+        self,
+        pcm_16khz: np.ndarray,
+        profile: str = "turn_final_fast",
+        language: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Transcribe one utterance through the cascade.
+
+        Returns the STTProcessor.transcribe_utterance() dict of the model
+        that produced the text, with decode_ms/cpu_ms covering both decodes
+        when escalated, plus "model" ("fast" or "accurate") and "escalated".
+        """
+        duration = len(pcm_16khz) / 16000
+        first = None
+
+        if self.fast is not None and duration <= self.max_fast_duration_s:
+            first = self.fast.transcribe_utterance(pcm_16khz, profile, language)
+            if first["avg_logprob"] >= self.escalate_logprob:
+                result = dict(first, model="fast", escalated=False)
+                self._record(result)
+                return result
+            logger.debug(
+                f"Escalating {duration:.2f}s utterance "
+                f"(avg_logprob {first['avg_logprob']:.2f}): {first['text']!r}"
+            )
+
+        result = self.accurate.transcribe_utterance(pcm_16khz, profile, language)
+        result = dict(result, model="accurate", escalated=first is not None)
+        if first is not None:
+            result["decode_ms"] += first["decode_ms"]
+            result["cpu_ms"] += first["cpu_ms"]
+        self._record(result)
+        return result
+
+    def _record(self, result: Dict[str, Any]):
+        self.turns += 1
+        if result["model"] == "fast":
+            self.fast_turns += 1
+        if result["escalated"]:
+            self.escalations += 1
+        self.decode_ms_total += result["decode_ms"]
+        self.cpu_ms_total += result["cpu_ms"]
+
+    def get_stats(self) -> Dict[str, float]:
+        """Totals and per-turn averages for /metrics"""
+        turns = self.turns or 1
+        return {
+            "turns": self.turns,
+            "fast_turns": self.fast_turns,
+            "escalations": self.escalations,
+            "avg_decode_ms": self.decode_ms_total / turns,
+            "avg_cpu_ms": self.cpu_ms_total / turns,
+        }
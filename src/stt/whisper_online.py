@@ -2,6 +2,7 @@
 import sys
 import numpy as np
 import librosa
+from collections import deque
 from functools import lru_cache
 import time
 import logging
@@ -359,9 +360,11 @@ class OpenaiApiASR(ASRBase):
 class HypothesisBuffer:
 
     def __init__(self, logfile=sys.stderr):
-        self.commited_in_buffer = []
-        self.buffer = []
-        self.new = []
+        # deques: words are consumed from the front (flush, pop_commited), so
+        # list.pop(0) would make each commit O(n) in the buffered words
+        self.commited_in_buffer = deque()
+        self.buffer = deque()
+        self.new = deque()
 
         self.last_commited_time = 0
         self.last_commited_word = None
@@ -372,23 +375,22 @@ class HypothesisBuffer:
         # compare self.commited_in_buffer and new. It inserts only the words in new that extend the commited_in_buffer, it means they are roughly behind last_commited_time and new in content
         # the new tail is added to self.new
         
-        new = [(a+offset,b+offset,t) for a,b,t in new]
-        self.new = [(a,b,t) for a,b,t in new if a > self.last_commited_time-0.1]
+        threshold = self.last_commited_time-0.1
+        self.new = deque((a+offset,b+offset,t) for a,b,t in new if a+offset > threshold)
 
         if len(self.new) >= 1:
             a,b,t = self.new[0]
             if abs(a - self.last_commited_time) < 1:
                 if self.commited_in_buffer:
                     # it's going to search for 1, 2, ..., 5 consecutive words (n-grams) that are identical in commited and new. If they are, they're dropped.
+                    # words are compared pairwise instead of joining both n-grams into strings
                     cn = len(self.commited_in_buffer)
                     nn = len(self.new)
                     for i in range(1,min(min(cn,nn),5)+1):  # 5 is the maximum 
-                        c = " ".join([self.commited_in_buffer[-j][2] for j in range(1,i+1)][::-1])
-                        tail = " ".join(self.new[j-1][2] for j in range(1,i+1))
-                        if c == tail:
+                        if all(self.commited_in_buffer[k-i][2] == self.new[k][2] for k in range(i)):
                             words = []
                             for j in range(i):
-                                words.append(repr(self.new.pop(0)))
+                                words.append(repr(self.new.popleft()))
                             words_msg = " ".join(words)
                             logger.debug(f"removing last {i} words: {words_msg}")
                             break
@@ -407,21 +409,21 @@ class HypothesisBuffer:
                 commit.append((na,nb,nt))
                 self.last_commited_word = nt
                 self.last_commited_time = nb
-                self.buffer.pop(0)
-                self.new.pop(0)
+                self.buffer.popleft()
+                self.new.popleft()
             else:
                 break
         self.buffer = self.new
-        self.new = []
+        self.new = deque()
         self.commited_in_buffer.extend(commit)
         return commit
 
     def pop_commited(self, time):
         while self.commited_in_buffer and self.commited_in_buffer[0][1] <= time:
-            self.commited_in_buffer.pop(0)
+            self.commited_in_buffer.popleft()
 
     def complete(self):
-        return self.buffer
+        return list(self.buffer)
 
 class OnlineASRProcessor:
 
@@ -444,7 +446,9 @@ class OnlineASRProcessor:
 
     def init(self, offset=None):
         """run this when starting or restarting processing"""
-        self.audio_buffer = np.array([],dtype=np.float32)
+        # Empty window into one second of backing storage (see audio_buffer)
+        self._audio = np.empty(self.SAMPLING_RATE, dtype=np.float32)
+        self._audio_beg = self._audio_end = 0
         self.transcript_buffer = HypothesisBuffer(logfile=self.logfile)
         self.buffer_time_offset = 0
         if offset is not None:
@@ -452,23 +456,58 @@ class OnlineASRProcessor:
         self.transcript_buffer.last_commited_time = self.buffer_time_offset
         self.commited = []
 
+    # The audio buffer is a window [_audio_beg, _audio_end) into a growable
+    # backing array: appends are amortized O(chunk) and trimming the front
+    # (chunk_at) just moves _audio_beg, instead of np.append / slicing copying
+    # the whole buffer every time.
+
+    @property
+    def audio_buffer(self):
+        return self._audio[self._audio_beg:self._audio_end]
+
+    @audio_buffer.setter
+    def audio_buffer(self, audio):
+        self._audio = np.asarray(audio, dtype=np.float32)
+        if self._audio.base is not None:
+            self._audio = self._audio.copy()
+        self._audio_beg = 0
+        self._audio_end = len(self._audio)
+
     def insert_audio_chunk(self, audio):
-        self.audio_buffer = np.append(self.audio_buffer, audio)
+        n = len(audio)
+        if self._audio_end + n > len(self._audio):
+            size = self._audio_end - self._audio_beg
+            needed = size + n
+            if needed > len(self._audio) // 2:
+                # grow geometrically
+                storage = np.empty(max(2 * needed, self.SAMPLING_RATE), dtype=np.float32)
+                storage[:size] = self._audio[self._audio_beg:self._audio_end]
+                self._audio = storage
+            else:
+                # compact: at least half the capacity becomes free
+                self._audio[:size] = self._audio[self._audio_beg:self._audio_end]
+            self._audio_beg = 0
+            self._audio_end = size
+        self._audio[self._audio_end:self._audio_end + n] = audio
+        self._audio_end += n
 
     def prompt(self):
         """Returns a tuple: (prompt, context), where "prompt" is a 200-character suffix of commited text that is inside of the scrolled away part of audio buffer. 
         "context" is the commited text that is inside the audio buffer. It is transcribed again and skipped. It is returned only for debugging and logging reasons.
+
+        Both are built by walking back from the end of self.commited, so the cost is bounded by the
+        words inside the audio buffer plus the 200-character prompt, not by the length of the call.
         """
         k = max(0,len(self.commited)-1)
         while k > 0 and self.commited[k-1][1] > self.buffer_time_offset:
             k -= 1
 
-        p = self.commited[:k]
-        p = [t for _,_,t in p]
         prompt = []
         l = 0
-        while p and l < 200:  # 200 characters prompt size
-            x = p.pop(-1)
+        i = k
+        while i > 0 and l < 200:  # 200 characters prompt size
+            i -= 1
+            x = self.commited[i][2]
             l += len(x)+1
             prompt.append(x)
         non_prompt = self.commited[k:]
@@ -480,10 +519,12 @@ class OnlineASRProcessor:
         The non-emty text is confirmed (committed) partial transcript.
         """
 
+        debug = logger.isEnabledFor(logging.DEBUG)
         prompt, non_prompt = self.prompt()
-        logger.debug(f"PROMPT: {prompt}")
-        logger.debug(f"CONTEXT: {non_prompt}")
-        logger.debug(f"transcribing {len(self.audio_buffer)/self.SAMPLING_RATE:2.2f} seconds from {self.buffer_time_offset:2.2f}")
+        if debug:
+            logger.debug(f"PROMPT: {prompt}")
+            logger.debug(f"CONTEXT: {non_prompt}")
+            logger.debug(f"transcribing {len(self.audio_buffer)/self.SAMPLING_RATE:2.2f} seconds from {self.buffer_time_offset:2.2f}")
         res = self.asr.transcribe(self.audio_buffer, init_prompt=prompt)
 
         # transform to [(beg,end,"word1"), ...]
@@ -492,10 +533,11 @@ class OnlineASRProcessor:
         self.transcript_buffer.insert(tsw, self.buffer_time_offset)
         o = self.transcript_buffer.flush()
         self.commited.extend(o)
-        completed = self.to_flush(o)
-        logger.debug(f">>>>COMPLETE NOW: {completed}")
-        the_rest = self.to_flush(self.transcript_buffer.complete())
-        logger.debug(f"INCOMPLETE: {the_rest}")
+        if debug:
+            completed = self.to_flush(o)
+            logger.debug(f">>>>COMPLETE NOW: {completed}")
+            the_rest = self.to_flush(self.transcript_buffer.complete())
+            logger.debug(f"INCOMPLETE: {the_rest}")
 
         # there is a newly confirmed text
 
@@ -571,7 +613,12 @@ class OnlineASRProcessor:
         """
         self.transcript_buffer.pop_commited(time)
         cut_seconds = time - self.buffer_time_offset
-        self.audio_buffer = self.audio_buffer[int(cut_seconds*self.SAMPLING_RATE):]
+        # same semantics as audio_buffer[cut:], without copying the remainder
+        size = self._audio_end - self._audio_beg
+        cut = int(cut_seconds*self.SAMPLING_RATE)
+        if cut < 0:
+            cut = max(0, size + cut)
+        self._audio_beg += min(cut, size)
         self.buffer_time_offset = time
 
     def words_to_sentences(self, words):
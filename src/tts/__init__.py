@@ -1,3 +1,6 @@
+from .cache import AudioCache
 from .client import TTSClient
+from .filler import LatencyFiller
+from .phrase_bank import PhraseBank
 
-__all__ = ["TTSClient"]
+__all__ = ["AudioCache", "LatencyFiller", "PhraseBank", "TTSClient"]
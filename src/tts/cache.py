@@ -0,0 +1,150 @@
+"""
+Cache of synthesized Twilio-ready audio with single-flight synthesis.
+
+The same sentences are synthesized over and over: FILLER_RESPONSE, stock
+phrases of scripted campaigns, common short answers. AudioCache keeps
+the final base64 mu-law frames per (engine, voice, rate, volume, text)
+within a memory budget, evicting least recently used entries.
+
+Concurrent misses for one key share a single synthesis (a "flight"). The
+synthesis runs in its own task and every caller reads frames from it as
+they are produced, so no caller waits for the whole sentence and a
+caller that stops listening (barge-in) does not cancel it for the
+others. A completed flight is stored in the cache.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+AudioKey = Tuple[str, str, str, str, str]
+
+
+class _Flight:
+    """One in-flight synthesis and the frames it has produced so far."""
+
+    def __init__(self):
+        self.payloads: List[str] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self._changed = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+
+    def notify(self):
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def follow(self) -> AsyncIterator[str]:
+        sent = 0
+        while True:
+            while sent < len(self.payloads):
+                yield self.payloads[sent]
+                sent += 1
+            if self.error is not None:
+                raise self.error
+            if self.done:
+                return
+            await self._changed.wait()
+
+
+class AudioCache:
+    """
+    LRU cache of payload lists under a byte budget, with single-flight misses.
+
+    Usage:
+        async for payload in cache.fetch(key, lambda: synthesize(text)):
+            ...
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Args:
+            max_bytes: Budget for cached payloads (base64 characters);
+                a single entry larger than this is never stored
+        """
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[AudioKey, List[str]]" = OrderedDict()
+        self.flights: Dict[AudioKey, _Flight] = {}
+        self.bytes_held = 0
+
+        # Counters (totals since startup)
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+        self.evictions = 0
+
+    def get(self, key: AudioKey) -> Optional[List[str]]:
+        payloads = self.entries.get(key)
+        if payloads is not None:
+            self.entries.move_to_end(key)
+        return payloads
+
+    def put(self, key: AudioKey, payloads: List[str]):
+        size = sum(len(p) for p in payloads)
+        if size > self.max_bytes:
+            return
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.bytes_held -= sum(len(p) for p in old)
+        self.entries[key] = payloads
+        self.bytes_held += size
+        while self.bytes_held > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.bytes_held -= sum(len(p) for p in evicted)
+            self.evictions += 1
+
+    async def fetch(self, key: AudioKey,
+                    synthesize: Callable[[], AsyncIterator[str]]) -> AsyncIterator[str]:
+        """Yield the key's payloads: from the cache, an in-flight synthesis, or a new one."""
+        payloads = self.get(key)
+        if payloads is not None:
+            self.hits += 1
+            for payload in payloads:
+                yield payload
+            return
+
+        flight = self.flights.get(key)
+        if flight is not None:
+            self.shared += 1
+        else:
+            self.misses += 1
+            flight = _Flight()
+            self.flights[key] = flight
+            flight.task = asyncio.create_task(self._run(key, flight, synthesize))
+        async for payload in flight.follow():
+            yield payload
+
+    async def _run(self, key: AudioKey, flight: _Flight,
+                   synthesize: Callable[[], AsyncIterator[str]]):
+        try:
+            async for payload in synthesize():
+                flight.payloads.append(payload)
+                flight.notify()
+            if flight.payloads:
+                self.put(key, flight.payloads)
+            flight.done = True
+        except asyncio.CancelledError:
+            flight.error = RuntimeError("TTS synthesis cancelled")
+            raise
+        except Exception as e:
+            logger.warning(f"TTS synthesis failed: {e}")
+            flight.error = e
+        finally:
+            self.flights.pop(key, None)
+            flight.notify()
+
+    def get_stats(self) -> Dict[str, float]:
+        """Hit rate and memory held for /metrics"""
+        lookups = self.hits + self.misses + self.shared
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "shared": self.shared,
+            "hit_rate": (self.hits + self.shared) / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "bytes_held": self.bytes_held,
+        }
@@ -0,0 +1,75 @@
+"""
+Latency-masking filler for responses whose first audio is late.
+
+When the LLM's first token is slow the caller hears silence until the
+first sentence is synthesized. LatencyFiller is armed at turn end: if
+the response has queued no audio after delay_s, it queues a short
+precomputed backchannel ("Mm-hmm.", "Let me check.") so the caller
+knows they were heard.
+
+The response awaits settle() before its first frame. A filler that has
+not started is dropped; one that has started is queued whole first, so
+the answer follows it back to back instead of interleaving with it or
+cutting it off.
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, List, Optional
+
+
+class LatencyFiller:
+    """
+    One armed filler per response.
+
+    Usage:
+        filler = LatencyFiller(streamer.queue_audio, payloads, delay_s=0.8)
+        filler.start()
+        ...
+        await filler.settle()        # before the response's first frame
+        ...
+        filler.cancel()              # response ended or interrupted
+    """
+
+    def __init__(self, queue_audio: Callable[[str], Awaitable[None]], payloads: List[str],
+                 delay_s: float):
+        """
+        Args:
+            queue_audio: Queues one payload for playback
+            payloads: Precomputed audio of the filler phrase
+            delay_s: Silence allowed before the filler plays
+        """
+        self.queue_audio = queue_audio
+        self.payloads = payloads
+        self.delay_s = max(0.0, delay_s)
+        self.task: Optional[asyncio.Task] = None
+        # monotonic time the filler's first frame was queued
+        self.started_at: Optional[float] = None
+
+    def start(self):
+        self.task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        await asyncio.sleep(self.delay_s)
+        self.started_at = time.monotonic()
+        for payload in self.payloads:
+            await self.queue_audio(payload)
+
+    @property
+    def played(self) -> bool:
+        return self.started_at is not None
+
+    async def settle(self):
+        """Drop the filler if it has not started, else wait until it is fully queued."""
+        if self.task is None:
+            return
+        if not self.played:
+            self.task.cancel()
+        # asyncio.wait does not raise the filler's cancellation into the caller
+        await asyncio.wait({self.task})
+        if not self.task.cancelled():
+            self.task.exception()  # retrieved; a failed filler must not fail the response
+
+    def cancel(self):
+        if self.task is not None:
+            self.task.cancel()
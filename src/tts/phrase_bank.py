@@ -0,0 +1,214 @@
+"""
+Prebuilt phrase bank: stock phrases rendered once, memory-mapped at startup.
+
+The call greeting and a handful of stock phrases are spoken on nearly
+every call. Building the bank renders them ahead of time into one file
+of 20ms mu-law frames (frames.ulaw) plus an index (index.json) holding
+the voice they were rendered with and each phrase's frame range:
+
+    python -m src.tts.phrase_bank --out data/phrase_bank [--phrases phrases.json]
+
+PhraseBank maps the frame file read-only with np.memmap: nothing is
+copied at load, pages are read on first use and worker processes share
+them through the page cache. TTSStream serves any text found in the bank
+(same engine, voice, rate and volume) from it instead of synthesizing.
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from src.tts.cache import AudioKey
+
+logger = logging.getLogger(__name__)
+
+# One Twilio frame: 20ms of 8kHz mu-law, one byte per sample
+FRAME_BYTES = 160
+FRAMES_FILE = "frames.ulaw"
+INDEX_FILE = "index.json"
+INDEX_VERSION = 1
+
+
+class PhraseBank:
+    """
+    Read-only frames of prebuilt phrases, by name or by TTS cache key.
+
+    Usage:
+        bank = PhraseBank.load("data/phrase_bank")
+        for payload in bank.payloads("greeting"):
+            await streamer.queue_audio(payload)
+    """
+
+    def __init__(self, frames: np.ndarray, voice: Tuple[str, str, str, str],
+                 phrases: Dict[str, Tuple[str, int, int]]):
+        """
+        Args:
+            frames: (n, FRAME_BYTES) uint8 mu-law frames (a memmap when loaded)
+            voice: (engine, voice, rate, volume) the phrases were rendered with
+            phrases: name → (text, first frame, frame count)
+        """
+        self.frames = frames
+        self.voice = voice
+        self.phrases = phrases
+        self._ranges: Dict[AudioKey, Tuple[int, int]] = {
+            voice + (text.strip(),): (start, count)
+            for text, start, count in phrases.values()
+        }
+
+        # Counters (totals since startup)
+        self.hits = 0
+        self.frames_served = 0
+
+    @classmethod
+    def load(cls, path) -> "PhraseBank":
+        """
+        Map a built bank directory.
+
+        Raises:
+            OSError: Files missing or unreadable
+            ValueError: Index of another version, or not matching the frame file
+        """
+        directory = Path(path)
+        index = json.loads((directory / INDEX_FILE).read_text())
+        if index.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported phrase bank version: {index.get('version')}")
+        frame_count = index["frame_count"]
+        frames_path = directory / FRAMES_FILE
+        if frames_path.stat().st_size != frame_count * FRAME_BYTES:
+            raise ValueError(f"{frames_path} does not match {INDEX_FILE} (rebuild the bank)")
+        if frame_count:
+            frames = np.memmap(frames_path, dtype=np.uint8, mode="r",
+                               shape=(frame_count, FRAME_BYTES))
+        else:
+            # mmap cannot map an empty file
+            frames = np.zeros((0, FRAME_BYTES), dtype=np.uint8)
+        voice = tuple(index["voice"][k] for k in ("engine", "voice", "rate", "volume"))
+        phrases = {
+            name: (entry["text"], entry["start"], entry["frames"])
+            for name, entry in index["phrases"].items()
+        }
+        return cls(frames, voice, phrases)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.phrases
+
+    def text(self, name: str) -> Optional[str]:
+        entry = self.phrases.get(name)
+        return entry[0] if entry else None
+
+    def payloads(self, name: str) -> Iterator[str]:
+        """Base64 payloads of a phrase by name (nothing if absent)."""
+        entry = self.phrases.get(name)
+        if entry is None:
+            return iter(())
+        _, start, count = entry
+        return self._encode(start, count)
+
+    def payloads_for(self, key: AudioKey) -> Optional[Iterator[str]]:
+        """Payloads for a TTS cache key, or None if the bank lacks that exact audio."""
+        frame_range = self._ranges.get(key)
+        if frame_range is None:
+            return None
+        return self._encode(*frame_range)
+
+    def _encode(self, start: int, count: int) -> Iterator[str]:
+        self.hits += 1
+        for i in range(start, start + count):
+            self.frames_served += 1
+            yield base64.b64encode(self.frames[i]).decode("ascii")
+
+    def get_stats(self) -> Dict[str, int]:
+        """Size and use of the bank for /metrics"""
+        return {
+            "phrases": len(self.phrases),
+            "bytes_mapped": self.frames.size,
+            "hits": self.hits,
+            "frames_served": self.frames_served,
+        }
+
+
+async def build_phrase_bank(path, phrases: Dict[str, str], tts_stream) -> PhraseBank:
+    """
+    Render phrases (name → text) with tts_stream into a bank directory.
+
+    Files are written next to the old ones and renamed over them, so a
+    running worker keeps its mapping of the previous build; the index goes
+    last and load() rejects a frame file it does not describe.
+    """
+    directory = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    frames_tmp = directory / (FRAMES_FILE + ".tmp")
+    entries = {}
+    start = 0
+    with open(frames_tmp, "wb") as f:
+        for name, text in phrases.items():
+            count = 0
+            async for payload in tts_stream.generate(text):
+                f.write(base64.b64decode(payload))
+                count += 1
+            entries[name] = {"text": text, "start": start, "frames": count}
+            start += count
+            logger.info(f"Rendered phrase {name!r}: {count * 0.02:.2f}s")
+
+    engine, voice, rate, volume = tts_stream.cache_key("")[:4]
+    index = {
+        "version": INDEX_VERSION,
+        "frame_bytes": FRAME_BYTES,
+        "frame_count": start,
+        "voice": {"engine": engine, "voice": voice, "rate": rate, "volume": volume},
+        "phrases": entries,
+    }
+    index_tmp = directory / (INDEX_FILE + ".tmp")
+    index_tmp.write_text(json.dumps(index, indent=2))
+    os.replace(frames_tmp, directory / FRAMES_FILE)
+    os.replace(index_tmp, directory / INDEX_FILE)
+    return PhraseBank.load(directory)
+
+
+def configured_phrases() -> Dict[str, str]:
+    """Phrases the server speaks from the bank when configured."""
+    from src.config import settings
+
+    phrases = {}
+    if settings.call_greeting:
+        phrases["greeting"] = settings.call_greeting
+    fillers = [p.strip() for p in settings.latency_filler_phrases.split("|") if p.strip()]
+    for i, text in enumerate(fillers):
+        phrases[f"filler-{i}"] = text
+    return phrases
+
+
+def main(argv=None):
+    from src.config import settings
+    from src.tts.stream import TTSStream
+
+    parser = argparse.ArgumentParser(
+        description="Pre-render stock phrases into a memory-mapped phrase bank."
+    )
+    parser.add_argument("--out", default=settings.phrase_bank_path or "data/phrase_bank",
+                        help="Bank directory (PHRASE_BANK_PATH)")
+    parser.add_argument("--phrases", help="JSON file of extra phrases: {\"name\": \"text\"}")
+    args = parser.parse_args(argv)
+
+    phrases = configured_phrases()
+    if args.phrases:
+        phrases.update(json.loads(Path(args.phrases).read_text()))
+    if not phrases:
+        parser.error("nothing to render: set CALL_GREETING, LATENCY_FILLER_PHRASES or pass --phrases")
+
+    logging.basicConfig(level=logging.INFO)
+    # Same voice as the server's shared TTSStream, so its lookups match
+    bank = asyncio.run(build_phrase_bank(args.out, phrases, TTSStream()))
+    stats = bank.get_stats()
+    print(f"{args.out}: {stats['phrases']} phrases, {stats['bytes_mapped']} bytes")
+
+
+if __name__ == "__main__":
+    main()
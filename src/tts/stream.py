@@ -8,13 +8,15 @@ Yields base64 payloads ready for AudioStreamer.queue_audio().
 """
 
 import logging
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, List, Optional
 
 import numpy as np
 import librosa
 
+from src.tts.cache import AudioCache, AudioKey
 from src.tts.client import TTSClient
 from src.tts.config import TTSConfig
+from src.tts.phrase_bank import PhraseBank
 from src.audio.conversion import pcm_to_mulaw
 
 import base64
@@ -56,13 +58,46 @@ class TTSStream:
 
     Produces payloads ready to send to Twilio via AudioStreamer.
     Each payload is one 20ms chunk of base64-encoded mu-law audio.
-    Routes to edge-tts (CPU) or CSM (GPU) based on config.
+    Routes to edge-tts (CPU) or CSM (GPU) based on config. With an
+    AudioCache, generate() replays or shares synthesis of repeated text;
+    text prebuilt in a PhraseBank is read from its frames.
     """
 
-    def __init__(self, config: Optional[TTSConfig] = None):
+    def __init__(self, config: Optional[TTSConfig] = None, cache: Optional[AudioCache] = None,
+                 phrase_bank: Optional[PhraseBank] = None):
         config = config or TTSConfig()
         self.tts_client = create_tts_client(config)
         self.config = config
+        self.cache = cache if self.replayable else None
+        self.phrase_bank = phrase_bank
+
+    @property
+    def replayable(self) -> bool:
+        """
+        Whether synthesized audio may be replayed in another context.
+
+        CSM conditions each utterance on the call's recent speech, which no
+        cache key captures, so its audio is never cached or replayed.
+        """
+        return self.config.engine != "csm"
+
+    def cache_key(self, text: str) -> AudioKey:
+        """(engine, voice, rate, volume, text) — everything that changes the audio"""
+        voice = self.config.voice
+        if self.config.engine == "csm":
+            voice = f"speaker-{self.config.csm_speaker_id}"
+        return (self.config.engine, voice, self.config.rate, self.config.volume, text.strip())
+
+    def precomputed(self, text: str) -> Optional[List[str]]:
+        """Payloads for text from the phrase bank or the audio cache; never synthesizes."""
+        key = self.cache_key(text)
+        if self.phrase_bank is not None:
+            prebuilt = self.phrase_bank.payloads_for(key)
+            if prebuilt is not None:
+                return list(prebuilt)
+        if self.cache is not None:
+            return self.cache.get(key)
+        return None
 
     async def generate(self, text: str) -> AsyncGenerator[str, None]:
         """
@@ -74,6 +109,20 @@ class TTSStream:
         Yields:
             str: Base64-encoded mu-law audio payloads (20ms chunks)
         """
+        if self.phrase_bank is not None:
+            prebuilt = self.phrase_bank.payloads_for(self.cache_key(text))
+            if prebuilt is not None:
+                for payload in prebuilt:
+                    yield payload
+                return
+        if self.cache is None or not text.strip():
+            async for payload in self._synthesize(text):
+                yield payload
+            return
+        async for payload in self.cache.fetch(self.cache_key(text), lambda: self._synthesize(text)):
+            yield payload
+
+    async def _synthesize(self, text: str) -> AsyncGenerator[str, None]:
         async for pcm_chunk in self.tts_client.synthesize(text):
             for payload in self._pcm_to_twilio_payloads(pcm_chunk):
                 yield payload
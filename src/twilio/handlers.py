@@ -2,14 +2,29 @@ import json
 import base64
 import logging
 import asyncio
-from typing import Dict, Optional
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Set
+import numpy as np
 from fastapi import WebSocket
-from src.audio.buffers import AudioStreamer
+from src.config import settings
+from src.audio.buffers import AudioStreamer, UtteranceCapture
+from src.audio.echo import EchoGate
 from src.state.manager import CallStateManager
 from src.stt.processor import STTProcessor
+from src.stt.router import STTRouter
+from src.stt.filters import TranscriptFilter
+from src.stt.incremental import IncrementalTranscriber
+from src.stt.language import LanguageLock
+from src.stt.backchannel import BackchannelClassifier
 from src.vad.detector import VADDetector
+from src.llm.cascade import LLMCascade, ReadAhead, continuation_messages
 from src.llm.client import LLMClient
 from src.llm.conversation import ConversationManager
+from src.llm.response_cache import ResponseCache
+from src.tts.cache import AudioCache
+from src.tts.filler import LatencyFiller
+from src.tts.phrase_bank import PhraseBank
 from src.tts.stream import TTSStream
 from src.audio.conversion import mulaw_to_pcm
 from src.audio.resampling import resample_8k_to_16k
@@ -17,6 +32,22 @@ from src.audio.resampling import resample_8k_to_16k
 logger = logging.getLogger(__name__)
 
 
+class PendingBargeIn:
+    """Caller speech over a paused response, not yet classified."""
+
+    def __init__(self, speech_started_at: float, preroll: np.ndarray, sample_rate: int):
+        self.paused_at = time.monotonic()
+        self.speech_started_at = speech_started_at
+        # Silence since the overlap's last voiced frame (the VAD's own
+        # counter still holds the idle silence before an early onset)
+        self.silence_ms = 0.0
+        self.capture = UtteranceCapture(
+            sample_rate=sample_rate,
+            trailing_padding_ms=settings.vad_trailing_padding_ms
+        )
+        self.capture.start(preroll)
+
+
 class ConnectionManager:
     def __init__(self):
         self.active_connections: Dict[str, WebSocket] = {}
@@ -25,19 +56,56 @@ class ConnectionManager:
 
         # STT processor (shared across calls for model reuse)
         self.stt_processor = None
+        self.stt_router = None
+
+        # Post-STT noise/hallucination gate (shared, counters only)
+        self.transcript_filter = TranscriptFilter(
+            min_rms_dbfs=settings.stt_filter_min_rms_dbfs
+        )
+
+        # Spoken TTS totals, to price the responses the filter avoided
+        self.tts_seconds_total = 0.0
+        self.tts_responses_total = 0
 
         # VAD instances per call (need separate state per caller)
         self.vad_detectors: Dict[str, VADDetector] = {}
 
+        # VAD energy-gate totals from finished calls (live calls summed on read)
+        self.vad_windows_total = 0
+        self.vad_model_calls_total = 0
+
         # LLM client (shared, stateless connection pool)
         self.llm_client = None
 
+        # Small-model opener of the two-tier cascade (None unless configured)
+        self.llm_cascade: Optional[LLMCascade] = None
+
+        # Spoken responses to common turns (shared across calls)
+        self.response_cache = ResponseCache(
+            max_entries=settings.response_cache_max_entries,
+            ttl_s=settings.response_cache_ttl_s,
+            max_words=settings.response_cache_max_words,
+            opt_outs=[t for t in settings.response_cache_opt_outs.split(",") if t.strip()]
+        )
+
+        # Fire-and-forget tasks (prefix warm-ups); referenced until done
+        self.background_tasks = set()
+
+        # Partial-transcript prefill per call: in-flight request and how
+        # much of the current turn's committed text it covered
+        self.prefill_tasks: Dict[str, asyncio.Task] = {}
+        self.prefilled_chars: Dict[str, int] = {}
+        self.partial_prefills_total = 0
+
         # Conversation managers per call (per-call state)
         self.conversations: Dict[str, ConversationManager] = {}
 
         # TTS stream (shared, stateless)
         self.tts_stream = None
 
+        # Prebuilt phrase audio, memory-mapped (pages shared across workers)
+        self.phrase_bank: Optional[PhraseBank] = None
+
         # stream_sid → call_sid mapping for media handler lookups
         self.stream_to_call: Dict[str, str] = {}
 
@@ -46,44 +114,305 @@ class ConnectionManager:
         self.is_responding: Dict[str, bool] = {}
         self.response_tasks: Dict[str, asyncio.Task] = {}
 
-        # Speech audio buffers for batch STT (per stream)
-        self.speech_buffers: Dict[str, list] = {}
+        # Streamer frame count ahead of each response's first frame, and
+        # turns merged into an unanswered one (duplicate generations avoided)
+        self.response_audio_marks: Dict[str, int] = {}
+        self.coalesced_turns_total = 0
+
+        # Armed latency fillers per call, and turn-end -> first audio latency:
+        # perceived (any audio, filler included) vs the response's own
+        self.latency_fillers: Dict[str, LatencyFiller] = {}
+        self.latency_fillers_total = 0
+        self.perceived_latencies_ms: Deque[float] = deque(maxlen=1000)
+        self.response_latencies_ms: Deque[float] = deque(maxlen=1000)
+
+        # Barge-in stop latency: first caller speech frame -> last AI audio frame
+        self.barge_in_latencies_ms: Deque[float] = deque(maxlen=1000)
+        self.barge_ins_total = 0
+
+        # Echo gates per call; suppressed/accepted totals from finished calls
+        self.echo_gates: Dict[str, EchoGate] = {}
+        # Calls whose current VAD segment was suppressed as echo: not a turn
+        self.echo_segments: Set[str] = set()
+        self.echo_suppressed_total = 0
+        self.echo_accepted_total = 0
+
+        # Barge-ins with playback paused while the overlap is classified
+        self.pending_barge_ins: Dict[str, PendingBargeIn] = {}
+        self.backchannel_classifier = BackchannelClassifier(
+            max_speech_ms=settings.backchannel_max_speech_ms
+        )
+
+        # Utterance capture for batch STT (per stream)
+        self.speech_buffers: Dict[str, UtteranceCapture] = {}
+
+        # Incremental STT of long utterances (per stream) and its in-flight step
+        self.stt_transcribers: Dict[str, IncrementalTranscriber] = {}
+        self.stt_tasks: Dict[str, asyncio.Task] = {}
+
+        # Spoken language per call; turn totals from finished calls
+        self.language_locks: Dict[str, LanguageLock] = {}
+        self.language_detect_turns_total = 0
+        self.language_pinned_turns_total = 0
 
     def get_stt_processor(self):
         """Get or create shared STT processor"""
         if self.stt_processor is None:
             self.stt_processor = STTProcessor(
-                model_size="base.en",
-                language="en"
+                model_size=settings.stt_model,
+                language=settings.stt_language
             )
         return self.stt_processor
 
+    def get_stt_router(self) -> STTRouter:
+        """Get or create shared STT cascade (fast model + shared processor)"""
+        if self.stt_router is None:
+            fast = None
+            if settings.stt_fast_model and settings.stt_fast_model != settings.stt_model:
+                fast = STTProcessor(
+                    model_size=settings.stt_fast_model,
+                    language=settings.stt_language
+                )
+            self.stt_router = STTRouter(
+                accurate=self.get_stt_processor(),
+                fast=fast,
+                max_fast_duration_s=settings.stt_fast_max_duration_s,
+                escalate_logprob=settings.stt_escalate_logprob
+            )
+        return self.stt_router
+
     def get_llm_client(self) -> LLMClient:
         """Get or create shared LLM client"""
         if self.llm_client is None:
             self.llm_client = LLMClient()
         return self.llm_client
 
+    def get_llm_cascade(self) -> Optional[LLMCascade]:
+        """Get or create the cascade's small-model opener (None unless configured)"""
+        if (self.llm_cascade is None and settings.llm_cascade_enabled
+                and settings.llm_cascade_base_url and settings.llm_cascade_model):
+            self.llm_cascade = LLMCascade(
+                LLMClient(
+                    base_url=settings.llm_cascade_base_url,
+                    model=settings.llm_cascade_model,
+                    max_tokens=settings.llm_cascade_opener_max_tokens,
+                ),
+                min_words=settings.llm_cascade_min_words,
+                min_ttft_s=settings.llm_cascade_min_ttft_ms / 1000,
+                timeout_s=settings.llm_cascade_opener_timeout_ms / 1000,
+            )
+        return self.llm_cascade
+
+    def _new_conversation(self) -> ConversationManager:
+        return ConversationManager(
+            max_history_messages=settings.llm_max_history_messages,
+            trim_batch=settings.llm_history_trim_batch
+        )
+
     def get_conversation(self, stream_sid: str) -> ConversationManager:
         """Get or create conversation manager for this call"""
         if stream_sid not in self.conversations:
-            self.conversations[stream_sid] = ConversationManager()
+            self.conversations[stream_sid] = self._new_conversation()
         return self.conversations[stream_sid]
 
+    def warm_llm_prefix(self, stream_sid: Optional[str] = None):
+        """
+        Prefill the prompt prefix of a call (or of any new call, at dial time).
+
+        Fire-and-forget: the first turn's request then starts with messages
+        already in vLLM's prefix cache and skips the system prompt prefill.
+        """
+        if not settings.llm_prefix_warming_enabled:
+            return
+        conversation = self.get_conversation(stream_sid) if stream_sid else self._new_conversation()
+        task = asyncio.create_task(
+            self.get_llm_client().warm_prefix(conversation.get_warmup_messages(), call_id=stream_sid)
+        )
+        self.background_tasks.add(task)
+        task.add_done_callback(self.background_tasks.discard)
+
     def get_vad_detector(self, stream_sid: str) -> VADDetector:
         """Get or create VAD detector for this call"""
         if stream_sid not in self.vad_detectors:
             self.vad_detectors[stream_sid] = VADDetector(
                 threshold=0.5,
                 min_silence_ms=550,
-                min_speech_ms=250
+                min_speech_ms=250,
+                prefix_padding_ms=settings.vad_prefix_padding_ms,
+                sampling_rate=settings.vad_sample_rate
             )
         return self.vad_detectors[stream_sid]
 
+    def get_speech_capture(self, stream_sid: str) -> UtteranceCapture:
+        """Get or create the utterance capture buffer for this call"""
+        if stream_sid not in self.speech_buffers:
+            self.speech_buffers[stream_sid] = UtteranceCapture(
+                sample_rate=settings.vad_sample_rate,
+                trailing_padding_ms=settings.vad_trailing_padding_ms,
+                max_seconds=settings.stt_max_buffer_s
+            )
+        return self.speech_buffers[stream_sid]
+
+    def get_incremental_transcriber(self, stream_sid: str) -> IncrementalTranscriber:
+        """Get or create this call's incremental transcriber (shares the STT model)"""
+        if stream_sid not in self.stt_transcribers:
+            self.stt_transcribers[stream_sid] = IncrementalTranscriber(
+                self.get_stt_processor().asr,
+                buffer_trimming_s=settings.stt_incremental_trim_s,
+                max_buffer_s=settings.stt_max_buffer_s
+            )
+        return self.stt_transcribers[stream_sid]
+
+    def get_language_lock(self, stream_sid: str) -> LanguageLock:
+        """Get or create this call's language state"""
+        if stream_sid not in self.language_locks:
+            self.language_locks[stream_sid] = LanguageLock(
+                default=settings.stt_language,
+                min_detect_s=settings.stt_language_min_detect_s,
+                lock_probability=settings.stt_language_lock_probability
+            )
+        return self.language_locks[stream_sid]
+
+    def release_language_lock(self, stream_sid: str):
+        """Drop a call's language state, folding its turn counts into the totals."""
+        lock = self.language_locks.pop(stream_sid, None)
+        if lock is not None:
+            self.language_detect_turns_total += lock.detect_turns
+            self.language_pinned_turns_total += lock.pinned_turns
+
+    def get_language_stats(self) -> Dict[str, int]:
+        """Turns decoded with language detection vs a pinned language."""
+        detect = self.language_detect_turns_total
+        pinned = self.language_pinned_turns_total
+        for lock in self.language_locks.values():
+            detect += lock.detect_turns
+            pinned += lock.pinned_turns
+        return {"detect_turns": detect, "pinned_turns": pinned}
+
+    def release_vad_detector(self, stream_sid: str):
+        """Drop a call's VAD detector, folding its gate stats into the totals."""
+        detector = self.vad_detectors.pop(stream_sid, None)
+        if detector is not None:
+            self.vad_windows_total += detector.windows_processed
+            self.vad_model_calls_total += detector.model_calls
+
+    def get_vad_stats(self) -> Dict[str, int]:
+        """VAD windows seen vs Silero calls made, across finished and live calls."""
+        windows = self.vad_windows_total
+        model_calls = self.vad_model_calls_total
+        for detector in self.vad_detectors.values():
+            windows += detector.windows_processed
+            model_calls += detector.model_calls
+        return {"windows": windows, "model_calls": model_calls}
+
+    def record_tts_response(self, seconds: float):
+        """Account the TTS audio queued for one completed response."""
+        self.tts_seconds_total += seconds
+        self.tts_responses_total += 1
+
+    def get_transcript_filter_stats(self) -> Dict[str, float]:
+        """Dropped transcripts, and the LLM calls / TTS seconds they would have cost."""
+        dropped = self.transcript_filter.dropped_total
+        avg_tts = (
+            self.tts_seconds_total / self.tts_responses_total
+            if self.tts_responses_total else 0.0
+        )
+        return {
+            "passed": self.transcript_filter.passed,
+            "dropped": dropped,
+            "llm_calls_saved": dropped,
+            "tts_seconds_saved": dropped * avg_tts,
+        }
+
+    def get_echo_gate(self, stream_sid: str) -> EchoGate:
+        """Get or create this call's echo gate"""
+        if stream_sid not in self.echo_gates:
+            self.echo_gates[stream_sid] = EchoGate(
+                max_delay_ms=settings.echo_gate_max_delay_ms,
+                correlation_threshold=settings.echo_gate_correlation
+            )
+        return self.echo_gates[stream_sid]
+
+    def release_echo_gate(self, stream_sid: str):
+        """Drop a call's echo gate, folding its counters into the totals."""
+        gate = self.echo_gates.pop(stream_sid, None)
+        if gate is not None:
+            self.echo_suppressed_total += gate.suppressed
+            self.echo_accepted_total += gate.accepted
+
+    def get_echo_stats(self) -> Dict[str, int]:
+        """Barge-in candidates suppressed as echo vs accepted, all calls."""
+        suppressed = self.echo_suppressed_total
+        accepted = self.echo_accepted_total
+        for gate in self.echo_gates.values():
+            suppressed += gate.suppressed
+            accepted += gate.accepted
+        return {"suppressed": suppressed, "accepted": accepted}
+
+    def get_backchannel_stats(self) -> Dict[str, float]:
+        """Paused barge-ins resumed as backchannels vs committed as interrupts."""
+        classifier = self.backchannel_classifier
+        avg_tts = (
+            self.tts_seconds_total / self.tts_responses_total
+            if self.tts_responses_total else 0.0
+        )
+        return {
+            "resumed": classifier.resumed,
+            "committed": classifier.committed,
+            "regenerations_saved": classifier.resumed,
+            "tts_seconds_saved": classifier.resumed * avg_tts,
+        }
+
+    def record_barge_in_latency(self, latency_ms: float):
+        self.barge_ins_total += 1
+        self.barge_in_latencies_ms.append(latency_ms)
+        if latency_ms > settings.barge_in_target_p95_ms:
+            logger.warning(
+                f"Barge-in stop latency {latency_ms:.0f}ms over "
+                f"{settings.barge_in_target_p95_ms}ms target"
+            )
+
+    def record_turn_latency(self, perceived_ms: float, response_ms: float):
+        self.perceived_latencies_ms.append(perceived_ms)
+        self.response_latencies_ms.append(response_ms)
+
+    def get_turn_latency_stats(self) -> Dict[str, float]:
+        """Turn end to first audio: perceived (fillers count) and response percentiles"""
+        stats = {"fillers": self.latency_fillers_total}
+        for name, latencies in (("perceived", self.perceived_latencies_ms),
+                                ("response", self.response_latencies_ms)):
+            samples = sorted(latencies)
+            stats[f"{name}_p50_ms"] = samples[int(0.50 * (len(samples) - 1))] if samples else 0.0
+            stats[f"{name}_p95_ms"] = samples[int(0.95 * (len(samples) - 1))] if samples else 0.0
+        return stats
+
+    def get_barge_in_stats(self) -> Dict[str, float]:
+        """Count and p50/p95 of recent barge-in stop latencies (ms)."""
+        samples = sorted(self.barge_in_latencies_ms)
+        if not samples:
+            return {"count": self.barge_ins_total, "p50_ms": 0.0, "p95_ms": 0.0}
+        return {
+            "count": self.barge_ins_total,
+            "p50_ms": samples[int(0.50 * (len(samples) - 1))],
+            "p95_ms": samples[int(0.95 * (len(samples) - 1))],
+        }
+
+    def load_phrase_bank(self) -> Optional[PhraseBank]:
+        """Map the prebuilt phrase bank (startup); a missing or stale bank is skipped"""
+        if settings.phrase_bank_path and self.phrase_bank is None:
+            try:
+                self.phrase_bank = PhraseBank.load(settings.phrase_bank_path)
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Phrase bank {settings.phrase_bank_path!r} not loaded: {e}")
+        return self.phrase_bank
+
     def get_tts_stream(self) -> TTSStream:
-        """Get or create shared TTS stream"""
+        """Get or create shared TTS stream (with the shared audio cache and phrase bank)"""
         if self.tts_stream is None:
-            self.tts_stream = TTSStream()
+            cache = None
+            if settings.tts_cache_enabled:
+                cache = AudioCache(max_bytes=int(settings.tts_cache_max_mb * 1024 * 1024))
+            self.tts_stream = TTSStream(cache=cache, phrase_bank=self.phrase_bank)
         return self.tts_stream
 
     def get_interrupt_event(self, stream_sid: str) -> asyncio.Event:
@@ -101,6 +430,9 @@ class ConnectionManager:
 
         # Create and start AudioStreamer
         streamer = AudioStreamer(websocket, stream_sid)
+        if settings.echo_gate_enabled:
+            # Streamer feeds the gate every frame it sends (echo reference)
+            streamer.echo_gate = self.get_echo_gate(stream_sid)
         await streamer.start()
         self.streamers[call_sid] = streamer
 
@@ -160,25 +492,147 @@ async def handle_start(websocket: WebSocket, data: dict):
 
     await manager.connect(call_sid, stream_sid, websocket)
 
+    if settings.call_greeting:
+        _start_greeting(stream_sid)
+
+    # The caller's first turn is seconds away; get the prompt prefix cached
+    manager.warm_llm_prefix(stream_sid)
+
 
 FILLER_RESPONSE = "Sorry, give me just a moment."
 
+# Cancel message for a response whose user turn was merged into the next one
+_COALESCED = "coalesced"
+
+
+def _start_greeting(stream_sid: str):
+    """Speak CALL_GREETING as the call's first response (barge-in cancels it)."""
+    call_sid = manager.stream_to_call.get(stream_sid)
+    streamer = manager.get_streamer(call_sid) if call_sid else None
+    if streamer is None:
+        return
+    manager.response_audio_marks[stream_sid] = (
+        streamer.audio_frames_sent + streamer.outbound_queue.qsize()
+    )
+    manager.response_tasks[stream_sid] = asyncio.create_task(
+        _speak_greeting(stream_sid, streamer)
+    )
+
+
+async def _speak_greeting(stream_sid: str, streamer: AudioStreamer):
+    """
+    Queue the greeting's audio and record it as the first assistant message.
+
+    With the greeting in the phrase bank its frames come straight from the
+    memory map, so the caller hears us before any LLM or TTS work.
+    """
+    greeting = settings.call_greeting
+    conversation = manager.get_conversation(stream_sid)
+    manager.set_responding(stream_sid, True)
+    try:
+        async for audio_payload in manager.get_tts_stream().generate(greeting):
+            await streamer.queue_audio(audio_payload)
+        conversation.add_assistant_message(greeting)
+        logger.info(f"[{stream_sid}] Greeting queued")
+    except asyncio.CancelledError:
+        if _response_audio_played(stream_sid):
+            conversation.add_assistant_message_partial(greeting)
+        logger.info(f"[{stream_sid}] Greeting cancelled")
+    except Exception as e:
+        logger.error(f"[{stream_sid}] Greeting error: {e}")
+    finally:
+        current = manager.response_tasks.get(stream_sid)
+        if current is None or current is asyncio.current_task():
+            manager.set_responding(stream_sid, False)
+            manager.response_tasks.pop(stream_sid, None)
+
 
-async def _generate_response(stream_sid: str, user_text: str):
+def _payload_seconds(payload: str) -> float:
+    """Duration of a base64 8kHz mu-law payload (1 byte per sample)."""
+    return len(payload) * 3 / 4 / 8000
+
+
+def _arm_latency_filler(stream_sid: str, streamer: AudioStreamer, tts_stream: TTSStream,
+                        turn_ended_at: float) -> Optional[LatencyFiller]:
+    """
+    Arm a filler for this response if a filler phrase has precomputed audio.
+
+    Phrases rotate with the turn count so consecutive slow turns do not
+    repeat the same one.
+    """
+    phrases = [p.strip() for p in settings.latency_filler_phrases.split("|") if p.strip()]
+    turn = manager.get_conversation(stream_sid).get_turn_count()
+    for i in range(len(phrases)):
+        payloads = tts_stream.precomputed(phrases[(turn + i) % len(phrases)])
+        if payloads:
+            break
+    else:
+        return None
+
+    queued = 0
+
+    async def queue_filler_audio(audio_payload: str):
+        nonlocal queued
+        if not queued:
+            manager.latency_fillers_total += 1
+            logger.info(f"[{stream_sid}] Response audio late — playing filler")
+        queued += 1
+        # Filler frames are not the response's: a turn can still coalesce into it
+        manager.response_audio_marks[stream_sid] = manager.response_audio_marks.get(stream_sid, 0) + 1
+        await streamer.queue_audio(audio_payload)
+
+    delay_s = turn_ended_at + settings.latency_filler_delay_ms / 1000 - time.monotonic()
+    filler = LatencyFiller(queue_filler_audio, payloads, delay_s)
+    filler.start()
+    manager.latency_fillers[stream_sid] = filler
+    return filler
+
+
+def _cancel_latency_filler(stream_sid: str):
+    """Stop an armed or playing filler (before its queued frames are cleared)."""
+    filler = manager.latency_fillers.pop(stream_sid, None)
+    if filler is not None:
+        filler.cancel()
+
+
+async def _generate_response(stream_sid: str, user_text: str,
+                             turn_ended_at: Optional[float] = None):
     """
     Generate AI response (LLM → TTS → audio queue) as a cancellable task.
 
     Tracks which sentences have been sent to TTS (spoken_index) so that on
     barge-in cancellation, only the spoken portion is saved to history.
     Includes error recovery: LLM failures trigger a filler response via TTS.
+    If no audio is queued LATENCY_FILLER_DELAY_MS after turn_ended_at
+    (monotonic; default now), a precomputed backchannel plays first.
+    With the cascade configured, a routed turn opens with the small
+    model's clause and the large model continues it.
     """
     conversation = manager.get_conversation(stream_sid)
     llm_client = manager.get_llm_client()
     messages = conversation.get_messages()
+    turn_ended_at = turn_ended_at if turn_ended_at is not None else time.monotonic()
 
     response_tokens = []
     spoken_index = 0
+    tts_seconds = 0.0
     sentence_endings = {".", "!", "?", "\n"}
+    filler = None
+    continuation = None
+    first_audio = True
+
+    async def queue_audio(audio_payload: str):
+        nonlocal first_audio
+        if first_audio:
+            first_audio = False
+            if filler is not None:
+                # A filler that started is queued whole ahead of the answer
+                await filler.settle()
+            now = time.monotonic()
+            perceived_at = filler.started_at if filler is not None and filler.played else now
+            manager.record_turn_latency((perceived_at - turn_ended_at) * 1000,
+                                        (now - turn_ended_at) * 1000)
+        await streamer.queue_audio(audio_payload)
 
     manager.set_responding(stream_sid, True)
     try:
@@ -186,62 +640,127 @@ async def _generate_response(stream_sid: str, user_text: str):
         call_sid = manager.stream_to_call.get(stream_sid)
         streamer = manager.get_streamer(call_sid) if call_sid else None
         tts_stream = manager.get_tts_stream() if streamer else None
-
-        sentence_buffer = ""
-        try:
-            async for token in llm_client.generate_streaming(messages):
-                response_tokens.append(token)
-                sentence_buffer += token
-
-                # Send complete sentences to TTS immediately
-                if tts_stream and any(
-                    sentence_buffer.rstrip().endswith(end) for end in sentence_endings
-                ):
-                    sentence_text = sentence_buffer.strip()
-                    if sentence_text:
-                        try:
-                            async for audio_payload in tts_stream.generate(sentence_text):
-                                await streamer.queue_audio(audio_payload)
-                            # Mark this sentence as spoken
-                            spoken_index = len("".join(response_tokens))
-                        except Exception as e:
-                            logger.warning(f"[{stream_sid}] TTS error for sentence, skipping: {e}")
-                    sentence_buffer = ""
-        except asyncio.CancelledError:
-            raise  # Re-raise for outer handler
-        except Exception as e:
-            # LLM error — send filler response if nothing spoken yet
-            logger.error(f"[{stream_sid}] LLM error: {e}")
-            if spoken_index == 0 and streamer and tts_stream:
+        if tts_stream and settings.latency_filler_enabled:
+            filler = _arm_latency_filler(stream_sid, streamer, tts_stream, turn_ended_at)
+
+        cache_key = None
+        if settings.response_cache_enabled and tts_stream and tts_stream.replayable:
+            cache_key = manager.response_cache.key_for(messages)
+        cached = manager.response_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            # Pre-synthesized answer to a common turn: no LLM, no TTS
+            logger.info(f"[{stream_sid}] Response cache hit")
+            response_tokens.append(cached.text)
+            for end, payloads in cached.segments:
+                for audio_payload in payloads:
+                    await queue_audio(audio_payload)
+                    tts_seconds += _payload_seconds(audio_payload)
+                spoken_index = end
+        else:
+            # Per-sentence audio for the response cache; None once anything failed
+            segments = []
+            sentence_buffer = ""
+
+            async def speak(text: str, what: str = "sentence"):
+                """Synthesize text into the audio queue, then mark it spoken."""
+                nonlocal spoken_index, tts_seconds, segments
+                payloads = []
                 try:
-                    async for audio_payload in tts_stream.generate(FILLER_RESPONSE):
-                        await streamer.queue_audio(audio_payload)
-                    logger.info(f"[{stream_sid}] Sent filler response after LLM error")
-                except Exception as tts_err:
-                    logger.error(f"[{stream_sid}] Filler TTS also failed: {tts_err}")
-            return
+                    async for audio_payload in tts_stream.generate(text):
+                        await queue_audio(audio_payload)
+                        tts_seconds += _payload_seconds(audio_payload)
+                        payloads.append(audio_payload)
+                    spoken_index = len("".join(response_tokens))
+                    if segments is not None:
+                        segments.append((spoken_index, payloads))
+                except Exception as e:
+                    segments = None
+                    logger.warning(f"[{stream_sid}] TTS error for {what}, skipping: {e}")
 
-        # Flush remaining sentence buffer
-        if sentence_buffer.strip() and tts_stream and streamer:
             try:
-                async for audio_payload in tts_stream.generate(sentence_buffer.strip()):
-                    await streamer.queue_audio(audio_payload)
-                spoken_index = len("".join(response_tokens))
+                opener = ""
+                cascade = manager.get_llm_cascade() if tts_stream else None
+                if cascade is not None and cascade.should_route(messages, llm_client):
+                    # The large model starts on the plain turn at once, so a
+                    # late or unusable opener costs no time. A usable one
+                    # replaces it with a continuation of the opener (whose
+                    # prefix that request has begun to prefill); the
+                    # replaced request is counted as wasted.
+                    continuation = ReadAhead(
+                        llm_client.generate_streaming(messages, call_id=stream_sid)
+                    )
+                    opener = await cascade.opener(messages, call_id=stream_sid)
+                    if opener:
+                        continuation.cancel()
+                        cascade.replaced += 1
+                        continuation = ReadAhead(llm_client.generate_streaming(
+                            continuation_messages(messages, opener), call_id=stream_sid,
+                            continue_final_message=True,
+                        ))
+                if continuation is not None:
+                    tokens = continuation
+                else:
+                    tokens = llm_client.generate_streaming(messages, call_id=stream_sid)
+                if opener:
+                    # The large model works on the continuation while the
+                    # small model's opener is spoken
+                    response_tokens.append(opener)
+                    await speak(opener, "cascade opener")
+
+                async for token in tokens:
+                    if opener and len(response_tokens) == 1 and not token[0].isspace():
+                        # The opener ends on a clause boundary: a new word follows
+                        token = " " + token
+                    response_tokens.append(token)
+                    sentence_buffer += token
+
+                    # Send complete sentences to TTS immediately
+                    if tts_stream and any(
+                        sentence_buffer.rstrip().endswith(end) for end in sentence_endings
+                    ):
+                        sentence_text = sentence_buffer.strip()
+                        if sentence_text:
+                            await speak(sentence_text)
+                        sentence_buffer = ""
+            except asyncio.CancelledError:
+                raise  # Re-raise for outer handler
             except Exception as e:
-                logger.warning(f"[{stream_sid}] TTS error for final sentence, skipping: {e}")
+                # LLM error — send filler response if nothing spoken yet
+                logger.error(f"[{stream_sid}] LLM error: {e}")
+                if spoken_index == 0 and streamer and tts_stream:
+                    try:
+                        async for audio_payload in tts_stream.generate(FILLER_RESPONSE):
+                            await queue_audio(audio_payload)
+                        logger.info(f"[{stream_sid}] Sent filler response after LLM error")
+                    except Exception as tts_err:
+                        logger.error(f"[{stream_sid}] Filler TTS also failed: {tts_err}")
+                return
+
+            # Flush remaining sentence buffer
+            if sentence_buffer.strip() and tts_stream and streamer:
+                await speak(sentence_buffer.strip(), "final sentence")
+
+            if cache_key and segments:
+                manager.response_cache.put(cache_key, "".join(response_tokens), segments)
 
         response_text = "".join(response_tokens)
         logger.info(f"[{stream_sid}] AI response: {response_text}")
 
         # Full response spoken — save to history
         conversation.add_assistant_message(response_text)
+        if tts_seconds:
+            manager.record_tts_response(tts_seconds)
 
         logger.info(
             f"[{stream_sid}] Turn {conversation.get_turn_count()}: "
             f"User='{user_text[:50]}' AI='{response_text[:50]}'"
         )
 
-    except asyncio.CancelledError:
+    except asyncio.CancelledError as e:
+        if e.args and e.args[0] == _COALESCED:
+            # Nothing was heard and the user turn is being answered anew
+            logger.info(f"[{stream_sid}] Response cancelled (turn coalesced)")
+            return
         # Barge-in interrupted us — save only what was spoken
         response_text = "".join(response_tokens)
         spoken_text = response_text[:spoken_index] if response_text else ""
@@ -254,34 +773,47 @@ async def _generate_response(stream_sid: str, user_text: str):
     except Exception as e:
         logger.error(f"[{stream_sid}] Response error: {e}")
     finally:
-        manager.set_responding(stream_sid, False)
-        manager.response_tasks.pop(stream_sid, None)
-
-
-async def _handle_interrupt(websocket: WebSocket, stream_sid: str):
+        if continuation is not None:
+            continuation.cancel()
+        if filler is not None:
+            filler.cancel()
+            if manager.latency_fillers.get(stream_sid) is filler:
+                manager.latency_fillers.pop(stream_sid, None)
+        # Cancellation is not awaited on barge-in, so a newer response may
+        # already own this stream's slot by the time we unwind
+        current = manager.response_tasks.get(stream_sid)
+        if current is None or current is asyncio.current_task():
+            manager.set_responding(stream_sid, False)
+            manager.response_tasks.pop(stream_sid, None)
+
+
+async def _handle_interrupt(websocket: WebSocket, stream_sid: str,
+                            speech_started_at: Optional[float] = None):
     """
-    Handle a barge-in interrupt: cancel in-flight generation, clear audio, resume listening.
+    Handle a barge-in interrupt: stop outbound audio first, then cancel generation.
 
-    1. Cancel the active response task (LLM + TTS)
-    2. Clear the outbound audio queue
-    3. Send Twilio 'clear' message to flush server-side audio buffer
+    1. Drop the outbound audio queue (never yields, so no queued frame can
+       go out after this point)
+    2. Cancel the response task (LLM + TTS) without waiting for it — it
+       unwinds on its own and saves the spoken part to history
+    3. Send Twilio 'clear' to flush audio already buffered at Twilio
     4. Reset interrupt event and responding flag
-    """
-    # Cancel the active response task
-    task = manager.response_tasks.get(stream_sid)
-    if task and not task.done():
-        task.cancel()
-        try:
-            await task
-        except asyncio.CancelledError:
-            pass
 
-    # Clear the audio queue
+    Args:
+        speech_started_at: monotonic time of the caller's first speech frame;
+            used to record stop latency against the streamer's last audio frame
+    """
     call_sid = manager.stream_to_call.get(stream_sid)
     streamer = manager.get_streamer(call_sid) if call_sid else None
+    _cancel_latency_filler(stream_sid)
     if streamer:
         await streamer.clear_queue()
 
+    # Cancel generation; the task's own CancelledError handler does the rest
+    task = manager.response_tasks.pop(stream_sid, None)
+    if task and not task.done():
+        task.cancel()
+
     # Send Twilio 'clear' message to flush server-side audio buffer
     try:
         clear_msg = json.dumps({"event": "clear", "streamSid": stream_sid})
@@ -294,23 +826,181 @@ async def _handle_interrupt(websocket: WebSocket, stream_sid: str):
     interrupt_event.clear()
     manager.set_responding(stream_sid, False)
 
-    # Reset VAD for the new utterance
-    vad_detector = manager.get_vad_detector(stream_sid)
-    vad_detector.reset()
+    # The VAD is deliberately not reset: the speech that triggered the
+    # barge-in is the start of the caller's next utterance and is already
+    # being captured — resetting would drop its onset
+
+    if streamer and speech_started_at is not None:
+        # A frame may still be mid-send; read the streamer after it settles
+        asyncio.get_running_loop().call_later(
+            0.05, _record_stop_latency, streamer, speech_started_at
+        )
 
     logger.info(f"[{stream_sid}] Interrupt handled — cleared queue, cancelled generation")
 
 
+def _response_audio_played(stream_sid: str) -> bool:
+    """Whether any frame of the current response has gone out to the caller."""
+    call_sid = manager.stream_to_call.get(stream_sid)
+    streamer = manager.get_streamer(call_sid) if call_sid else None
+    if streamer is None:
+        return False
+    return streamer.audio_frames_sent > manager.response_audio_marks.get(stream_sid, 0)
+
+
+async def _coalesce_turn(stream_sid: str) -> bool:
+    """
+    Cancel the in-flight response if none of its audio has played yet.
+
+    The caller paused past the turn-end silence and kept talking; answering
+    the first half would start two LLM/TTS pipelines racing to the same
+    streamer. Returns True if a response was cancelled.
+    """
+    task = manager.response_tasks.get(stream_sid)
+    if task is None or task.done() or _response_audio_played(stream_sid):
+        return False
+    manager.response_tasks.pop(stream_sid, None)
+    _cancel_latency_filler(stream_sid)
+    call_sid = manager.stream_to_call.get(stream_sid)
+    streamer = manager.get_streamer(call_sid) if call_sid else None
+    if streamer:
+        # Only this response's unplayed frames (or the filler's) can be queued
+        await streamer.clear_queue()
+    task.cancel(_COALESCED)
+    return True
+
+
+def _barge_in_is_echo(stream_sid: str, echo_gate: Optional[EchoGate]) -> bool:
+    """Our own TTS leaking back into the inbound track must not cancel the response."""
+    if echo_gate is None:
+        return False
+    if echo_gate.check_candidate():
+        logger.debug(
+            f"[{stream_sid}] Barge-in suppressed as echo "
+            f"(corr={echo_gate.last_correlation:.2f})"
+        )
+        return True
+    return False
+
+
+def _pause_for_barge_in(stream_sid: str, streamer: AudioStreamer,
+                        vad_detector: VADDetector, speech_started_at: float):
+    """Hold the unspoken audio while the overlapping speech is classified."""
+    streamer.pause()
+    manager.pending_barge_ins[stream_sid] = PendingBargeIn(
+        speech_started_at, vad_detector.get_prefix_buffer(), vad_detector.sampling_rate
+    )
+    logger.info(f"[{stream_sid}] Playback paused for barge-in")
+
+
+async def _resolve_barge_in(websocket: WebSocket, stream_sid: str, pending: PendingBargeIn,
+                            vad_result: dict, vad_audio: np.ndarray,
+                            vad_detector: VADDetector) -> bool:
+    """
+    Decide a paused barge-in once its outcome is known.
+
+    - Overlap speech past BACKCHANNEL_MAX_SPEECH_MS, or a pause longer than
+      BACKCHANNEL_MAX_PAUSE_MS: interrupt without transcribing.
+    - Overlap ended (BACKCHANNEL_END_SILENCE_MS of silence since its last
+      voiced frame): transcribe it with the fast profile; a backchannel
+      resumes the queued audio and is dropped as a turn, anything else
+      interrupts.
+    - An early onset stays pending while it lasts; if it fades without
+      the VAD confirming speech it was noise: playback resumes, nothing
+      is transcribed and no backchannel is counted.
+
+    Returns:
+        True if playback resumed and this frame needs no further processing
+    """
+    pending.capture.append(vad_audio)
+    classifier = manager.backchannel_classifier
+    paused_ms = (time.monotonic() - pending.paused_at) * 1000
+    speech_ms = vad_result["speech_duration_ms"]
+    sampling_rate = vad_detector.sampling_rate
+    if vad_result["is_speech"] or vad_result["onset_ms"] > 0:
+        pending.silence_ms = 0.0
+    else:
+        pending.silence_ms += len(vad_audio) / sampling_rate * 1000
+
+    if speech_ms > classifier.max_speech_ms or paused_ms > settings.backchannel_max_pause_ms:
+        await _commit_barge_in(websocket, stream_sid, pending)
+        return False
+    if pending.silence_ms < settings.backchannel_end_silence_ms:
+        return False
+
+    if speech_ms == 0:
+        # The onset faded before the VAD confirmed it: noise, not a reply.
+        # The VAD and capture hold nothing of it, so they are left alone.
+        _resume_after_overlap(stream_sid)
+        logger.info(f"[{stream_sid}] Unconfirmed onset faded — resumed playback after {paused_ms:.0f}ms")
+        return True
+
+    audio = pending.capture.finish(
+        trailing_silence_samples=int(pending.silence_ms * sampling_rate / 1000)
+    )
+    text = ""
+    if len(audio):
+        if sampling_rate == 8000:
+            audio = resample_8k_to_16k(audio)
+        result = await asyncio.to_thread(
+            manager.get_stt_router().transcribe_utterance, audio, "turn_final_fast",
+            manager.get_language_lock(stream_sid).language_for_turn()
+        )
+        text = result["text"]
+
+    if not classifier.is_backchannel(text, speech_ms):
+        logger.info(f"[{stream_sid}] Overlap is an interruption: {text!r}")
+        await _commit_barge_in(websocket, stream_sid, pending)
+        return False
+
+    _resume_after_overlap(stream_sid)
+    # The acknowledgement is not a turn: forget it and listen afresh
+    manager.get_speech_capture(stream_sid).discard()
+    vad_detector.reset()
+    classifier.record_resume()
+    logger.info(f"[{stream_sid}] Backchannel {text!r} — resumed playback after {paused_ms:.0f}ms")
+    return True
+
+
+def _resume_after_overlap(stream_sid: str):
+    """Play the held audio again; the overlap did not take the turn."""
+    manager.pending_barge_ins.pop(stream_sid, None)
+    call_sid = manager.stream_to_call.get(stream_sid)
+    streamer = manager.get_streamer(call_sid) if call_sid else None
+    if streamer:
+        streamer.resume()
+    manager.get_interrupt_event(stream_sid).clear()
+
+
+async def _commit_barge_in(websocket: WebSocket, stream_sid: str, pending: PendingBargeIn):
+    """The overlap takes the turn: drop the paused audio and cancel the response."""
+    manager.pending_barge_ins.pop(stream_sid, None)
+    manager.backchannel_classifier.record_commit()
+    await _handle_interrupt(websocket, stream_sid, pending.speech_started_at)
+
+
+def _record_stop_latency(streamer: AudioStreamer, speech_started_at: float):
+    """Stop latency = last outbound audio frame - first caller speech frame."""
+    last_sent = streamer.last_audio_sent_at
+    latency_ms = 0.0
+    if last_sent is not None:
+        latency_ms = max(0.0, (last_sent - speech_started_at) * 1000)
+    manager.record_barge_in_latency(latency_ms)
+    logger.info(f"[{streamer.stream_sid}] Barge-in stop latency {latency_ms:.0f}ms")
+
+
 async def handle_media(websocket: WebSocket, data: dict):
     """
     Process incoming audio through full conversation pipeline.
 
     Flow:
     1. Decode base64 mu-law from Twilio
-    2. Convert mu-law → PCM 8kHz → 16kHz for STT/VAD
-    3. Run VAD to detect speech/silence
-    4. If speech during AI response → barge-in detected
-    5. Feed audio to STT if speech detected
+    2. Convert mu-law → PCM 8kHz
+    3. Run VAD (natively at 8kHz) to detect speech/silence
+    4. If speech during AI response → barge-in detected: pause playback,
+       then resume it for a backchannel or interrupt the response
+    5. Capture the utterance (pre-roll + pauses) while the VAD is in speech;
+       trim trailing silence and upsample to 16kHz only at turn end for STT
     6. On turn complete: spawn cancellable LLM → TTS response task
     """
     media_data = data.get("media", {})
@@ -347,27 +1037,33 @@ async def handle_media(websocket: WebSocket, data: dict):
 
     pcm_8khz = mulaw_to_pcm(audio_mulaw)
     if debug_audio:
-        import numpy as np
         logger.info(f"[{stream_sid}] PCM 8kHz: len={len(pcm_8khz)}, dtype={pcm_8khz.dtype}, min={pcm_8khz.min()}, max={pcm_8khz.max()}, rms={np.sqrt(np.mean(pcm_8khz.astype(np.float64)**2)):.1f}")
 
-    pcm_16khz = resample_8k_to_16k(pcm_8khz)
-    if debug_audio:
-        logger.info(f"[{stream_sid}] PCM 16kHz: len={len(pcm_16khz)}, dtype={pcm_16khz.dtype}, min={pcm_16khz.min()}, max={pcm_16khz.max()}, rms={np.sqrt(np.mean(pcm_16khz.astype(np.float64)**2)):.1f}")
-
     # Get processors
-    stt_processor = manager.get_stt_processor()
     vad_detector = manager.get_vad_detector(stream_sid)
+    echo_gate = manager.echo_gates.get(stream_sid)
+    if echo_gate is not None:
+        echo_gate.push_inbound(pcm_8khz)
+
+    # VAD runs on native 8kHz audio by default — upsampling adds no
+    # information and doubles Silero's work. 16kHz is only produced for
+    # captured speech on its way to Whisper.
+    if vad_detector.sampling_rate == 8000:
+        vad_audio = pcm_8khz
+    else:
+        vad_audio = resample_8k_to_16k(pcm_8khz)
+        if debug_audio:
+            logger.info(f"[{stream_sid}] PCM 16kHz: len={len(vad_audio)}, dtype={vad_audio.dtype}, min={vad_audio.min()}, max={vad_audio.max()}, rms={np.sqrt(np.mean(vad_audio.astype(np.float64)**2)):.1f}")
 
     # Run VAD on chunk
-    vad_result = vad_detector.process_chunk(pcm_16khz)
+    vad_result = vad_detector.process_chunk(vad_audio)
 
     # Debug: log VAD state periodically (every ~5s = 250 chunks at 20ms)
     if not hasattr(handle_media, '_debug_counter'):
         handle_media._debug_counter = {}
     handle_media._debug_counter[stream_sid] = handle_media._debug_counter.get(stream_sid, 0) + 1
     if handle_media._debug_counter[stream_sid] % 250 == 1:
-        import numpy as np
-        rms = np.sqrt(np.mean(pcm_16khz.astype(np.float64)**2))
+        rms = np.sqrt(np.mean(vad_audio.astype(np.float64)**2))
         # Also check byte distribution of this chunk
         from collections import Counter
         byte_counts = Counter(audio_mulaw)
@@ -378,71 +1074,264 @@ async def handle_media(websocket: WebSocket, data: dict):
             f"speaking={vad_detector.is_speaking}, "
             f"silence={vad_result['silence_duration_ms']:.0f}ms, "
             f"speech_dur={vad_result['speech_duration_ms']:.0f}ms, "
-            f"rms={rms:.0f}, min={pcm_16khz.min()}, max={pcm_16khz.max()}, "
+            f"rms={rms:.0f}, min={vad_audio.min()}, max={vad_audio.max()}, "
             f"unique_mulaw_vals={unique_bytes}"
         )
 
-    # Barge-in detection: user speaking while AI is responding
-    if vad_result["is_speech"] and manager.is_responding.get(stream_sid, False):
+    # Barge-in detection: user speaking while AI is responding. A confident
+    # onset may trigger before the VAD confirms speech (min_onset_ms).
+    early_onset = (
+        settings.barge_in_early_onset_ms > 0
+        and vad_result["onset_ms"] >= settings.barge_in_early_onset_ms
+        and vad_result["speech_probability"] >= settings.barge_in_early_threshold
+    )
+    candidate = (vad_result["is_speech"] or early_onset) and manager.is_responding.get(stream_sid, False)
+    pending = manager.pending_barge_ins.get(stream_sid)
+    if pending is not None:
+        # Playback is paused: wait for the overlap to end, then resume or interrupt
+        if await _resolve_barge_in(websocket, stream_sid, pending, vad_result, vad_audio, vad_detector):
+            return
+    elif candidate:
         interrupt_event = manager.get_interrupt_event(stream_sid)
-        if not interrupt_event.is_set():
+        if not interrupt_event.is_set() and _barge_in_is_echo(stream_sid, echo_gate):
+            manager.echo_segments.add(stream_sid)
+        elif not interrupt_event.is_set():
+            # Caller speech over the echo: the segment is a real turn
+            manager.echo_segments.discard(stream_sid)
             interrupt_event.set()
-            logger.info(f"[{stream_sid}] Barge-in detected — user interrupting AI")
-            await _handle_interrupt(websocket, stream_sid)
-
-    if vad_result["is_speech"]:
-        # Buffer speech audio for batch transcription on turn-complete
-        # (Whisper is too slow on CPU to run per-chunk)
-        if stream_sid not in manager.speech_buffers:
-            manager.speech_buffers[stream_sid] = []
-        manager.speech_buffers[stream_sid].append(pcm_16khz)
+            # Arrival time of the first voiced frame of this onset/segment
+            voiced_ms = vad_result["onset_ms"] or vad_result["speech_duration_ms"]
+            speech_started_at = time.monotonic() - voiced_ms / 1000
+            logger.info(
+                f"[{stream_sid}] Barge-in detected — user interrupting AI"
+                f"{' (early onset)' if early_onset and not vad_result['is_speech'] else ''}"
+            )
+            call_sid = manager.stream_to_call.get(stream_sid)
+            streamer = manager.get_streamer(call_sid) if call_sid else None
+            if settings.backchannel_enabled and streamer is not None:
+                _pause_for_barge_in(stream_sid, streamer, vad_detector, speech_started_at)
+            else:
+                await _handle_interrupt(websocket, stream_sid, speech_started_at)
+    elif echo_gate is not None:
+        echo_gate.end_candidate()
+
+    # Utterance capture follows the VAD speaking state, not per-chunk speech
+    # flags: it starts with the pre-roll on onset and keeps the caller's
+    # pauses, so Whisper sees the utterance as it was spoken
+    capture = manager.get_speech_capture(stream_sid)
+    if vad_result["speech_start"]:
+        capture.start(vad_detector.get_prefix_buffer())
+    else:
+        capture.append(vad_audio)
+    if vad_result["speech_aborted"]:
+        capture.discard()
+    elif (capture.active and not vad_result["turn_complete"] and settings.stt_incremental_after_s > 0
+            and stream_sid not in manager.echo_segments):
+        _maybe_advance_incremental(stream_sid, capture, vad_detector.sampling_rate)
+
+    if not vad_detector.is_speaking and not vad_result["onset_ms"]:
+        # Idle (segment aborted or onset faded): the next one starts unjudged
+        manager.echo_segments.discard(stream_sid)
+    elif vad_result["turn_complete"] and stream_sid in manager.echo_segments:
+        # Our own TTS leaking back: transcribing it would answer ourselves
+        logger.info(f"[{stream_sid}] Segment suppressed as echo, dropped as a turn")
+        await _discard_echo_segment(stream_sid, capture)
+        vad_detector.reset()
+        return
 
     # Check for turn complete
     if vad_result["turn_complete"]:
+        turn_ended_at = time.monotonic()
         logger.info(f"[{stream_sid}] Turn complete after {vad_result['silence_duration_ms']}ms silence")
 
-        # Transcribe all buffered speech audio at once
-        speech_chunks = manager.speech_buffers.pop(stream_sid, [])
-        if speech_chunks:
-            import numpy as np
-            full_audio = np.concatenate(speech_chunks)
+        # Trailing silence = VAD-confirmed silence + samples not yet windowed
+        trailing_silence = (
+            int(vad_result["silence_duration_ms"] * vad_detector.sampling_rate / 1000)
+            + len(vad_detector.accum_buffer)
+        )
+        if capture.dropped_samples:
+            logger.warning(
+                f"[{stream_sid}] Utterance exceeded {settings.stt_max_buffer_s}s cap, "
+                f"dropped {capture.dropped_samples / capture.sample_rate:.1f}s of audio"
+            )
+        full_audio = capture.finish(trailing_silence_samples=trailing_silence)
+        if len(full_audio) and vad_detector.sampling_rate == 8000:
+            full_audio = resample_8k_to_16k(full_audio)
+
+        language_lock = manager.get_language_lock(stream_sid)
+        transcriber = manager.stt_transcribers.get(stream_sid)
+        manager.prefilled_chars.pop(stream_sid, None)
+        if transcriber is not None and transcriber.active:
+            # Long utterance: everything but the tail was decoded while the
+            # caller was talking, so turn-end work stays bounded
+            inflight = manager.stt_tasks.pop(stream_sid, None)
+            if inflight is not None:
+                try:
+                    await inflight
+                except Exception as e:
+                    logger.warning(f"[{stream_sid}] Incremental STT step failed: {e}")
+            result = await asyncio.to_thread(transcriber.finish, full_audio)
+            logger.info(
+                f"[{stream_sid}] STT decode {result['decode_ms']:.0f}ms "
+                f"for tail of {result['duration']:.1f}s utterance (incremental)"
+            )
+            user_text = result["text"]
+        elif len(full_audio):
             logger.info(f"[{stream_sid}] Transcribing {len(full_audio)} samples ({len(full_audio)/16000:.1f}s)")
 
-            def batch_transcribe():
-                audio_float = full_audio.astype(np.float32) / 32768.0
-                stt_processor.online.insert_audio_chunk(audio_float)
-                beg, end, text = stt_processor.online.finish()
-                stt_processor.online.init()
-                return text
-
-            user_text = await asyncio.to_thread(batch_transcribe)
+            # One decode of the whole utterance with the cheapest profile:
+            # the turn-end path only needs the text. Short turns go to the
+            # fast model first.
+            stt_router = manager.get_stt_router()
+            result = await asyncio.to_thread(
+                stt_router.transcribe_utterance, full_audio, "turn_final_fast",
+                language_lock.language_for_turn()
+            )
+            logger.info(
+                f"[{stream_sid}] STT decode {result['decode_ms']:.0f}ms "
+                f"for {result['duration']:.1f}s ({result['profile']}, {result['model']}"
+                f"{', escalated' if result['escalated'] else ''})"
+            )
+            user_text = result["text"]
         else:
             user_text = ""
+        if user_text:
+            language_lock.observe(result)
         logger.info(f"[{stream_sid}] User said: {user_text}")
 
+        # Drop noise and Whisper hallucinations before they cost an LLM
+        # generation and TTS. Incremental results carry no confidences.
+        if (user_text and user_text.strip() and settings.stt_filter_enabled
+                and not result.get("incremental")):
+            reason = manager.transcript_filter.rejection_reason(result, full_audio)
+            if reason:
+                manager.transcript_filter.record_drop(reason)
+                logger.info(f"[{stream_sid}] Dropped transcript ({reason}): {user_text!r}")
+                user_text = ""
+            else:
+                manager.transcript_filter.record_pass()
+
         if user_text and user_text.strip():
             conversation = manager.get_conversation(stream_sid)
-            conversation.add_user_message(user_text)
-
-            # Spawn response as cancellable task
-            task = asyncio.create_task(_generate_response(stream_sid, user_text))
+            if settings.turn_coalescing_enabled and await _coalesce_turn(stream_sid):
+                logger.info(f"[{stream_sid}] Coalescing turn into unplayed response")
+            previous = manager.response_tasks.get(stream_sid)
+            if previous is not None and not previous.done():
+                # A turn taken over a response that is still playing (no
+                # barge-in fired): two pipelines must never share the
+                # streamer, so that response ends here, and saves what was
+                # spoken before this turn is added
+                logger.info(f"[{stream_sid}] New turn over a live response, interrupting it")
+                await _handle_interrupt(websocket, stream_sid)
+                await asyncio.wait([previous])
+            # An unanswered user turn (coalesced, or cancelled before any
+            # reply was spoken) is extended rather than followed by another
+            if settings.turn_coalescing_enabled and conversation.extend_user_message(user_text):
+                user_text = conversation.history[-1]["content"]
+                manager.coalesced_turns_total += 1
+            else:
+                conversation.add_user_message(user_text)
+
+            # Spawn response as cancellable task; frames already sent or
+            # queued belong to earlier responses
+            call_sid = manager.stream_to_call.get(stream_sid)
+            streamer = manager.get_streamer(call_sid) if call_sid else None
+            if streamer is not None:
+                manager.response_audio_marks[stream_sid] = (
+                    streamer.audio_frames_sent + streamer.outbound_queue.qsize()
+                )
+            task = asyncio.create_task(_generate_response(stream_sid, user_text, turn_ended_at))
             manager.response_tasks[stream_sid] = task
 
         # Reset VAD for next turn
         vad_detector.reset()
 
 
+async def _discard_echo_segment(stream_sid: str, capture: UtteranceCapture):
+    """Forget a segment suppressed as echo: its audio and any partial decode."""
+    manager.echo_segments.discard(stream_sid)
+    capture.discard()
+    inflight = manager.stt_tasks.pop(stream_sid, None)
+    if inflight is not None:
+        # The decode runs in a thread: let it finish before resetting its state
+        await asyncio.gather(inflight, return_exceptions=True)
+    transcriber = manager.stt_transcribers.get(stream_sid)
+    if transcriber is not None and transcriber.active:
+        transcriber.reset()
+    manager.prefilled_chars.pop(stream_sid, None)
+
+
+def _maybe_advance_incremental(stream_sid: str, capture: UtteranceCapture, sampling_rate: int):
+    """
+    Hand a long utterance's audio to the call's incremental transcriber.
+
+    Starts once the utterance passes STT_INCREMENTAL_AFTER_S, then every
+    STT_INCREMENTAL_STEP_S of new audio. At most one decode step runs per
+    call; audio keeps accumulating in the capture while it does.
+    """
+    transcriber = manager.stt_transcribers.get(stream_sid)
+    started = transcriber is not None and transcriber.active
+    threshold = settings.stt_incremental_step_s if started else settings.stt_incremental_after_s
+    if capture.duration_s < threshold:
+        return
+    inflight = manager.stt_tasks.get(stream_sid)
+    if inflight is not None and not inflight.done():
+        return
+
+    transcriber = manager.get_incremental_transcriber(stream_sid)
+    transcriber.language = manager.get_language_lock(stream_sid).language_for_turn()
+    audio = capture.drain()
+    if sampling_rate == 8000:
+        audio = resample_8k_to_16k(audio)
+    transcriber.active = True
+    manager.stt_tasks[stream_sid] = asyncio.create_task(
+        _advance_incremental(stream_sid, transcriber, audio)
+    )
+
+
+async def _advance_incremental(stream_sid: str, transcriber: IncrementalTranscriber,
+                               audio: np.ndarray):
+    """One incremental decode step, then prefill the words it committed."""
+    await asyncio.to_thread(transcriber.advance, audio)
+    if settings.llm_partial_prefill_enabled:
+        _prefill_partial(stream_sid, transcriber.text)
+
+
+def _prefill_partial(stream_sid: str, committed_text: str):
+    """
+    Send the conversation plus the caller's committed words as a max_tokens=1
+    request, so the turn-end request finds its prefix in vLLM's KV cache.
+
+    Skipped while a previous prefill is in flight or until the committed
+    text grew by LLM_PARTIAL_PREFILL_MIN_CHARS.
+    """
+    covered = manager.prefilled_chars.get(stream_sid, 0)
+    if len(committed_text) - covered < settings.llm_partial_prefill_min_chars:
+        return
+    inflight = manager.prefill_tasks.get(stream_sid)
+    if inflight is not None and not inflight.done():
+        return
+    messages = manager.get_conversation(stream_sid).get_partial_messages(committed_text)
+    manager.prefilled_chars[stream_sid] = len(committed_text)
+    manager.prefill_tasks[stream_sid] = asyncio.create_task(
+        manager.get_llm_client().warm_prefix(messages, call_id=stream_sid)
+    )
+    manager.partial_prefills_total += 1
+
+
 async def handle_stop(websocket: WebSocket, data: dict):
     """Handle 'stop' event - stream ending"""
     stop_data = data.get("stop", {})
     call_sid = stop_data.get("callSid")
     stream_sid = stop_data.get("streamSid")
 
-    # Cancel any in-flight response task
+    # Cancel any in-flight response task, and the call's other background work
     if stream_sid:
-        task = manager.response_tasks.pop(stream_sid, None)
-        if task and not task.done():
-            task.cancel()
+        _cancel_latency_filler(stream_sid)
+        for tasks in (manager.response_tasks, manager.stt_tasks, manager.prefill_tasks):
+            task = tasks.pop(stream_sid, None)
+            if task and not task.done():
+                task.cancel()
 
     # Update state
     await state_manager.on_stop(call_sid)
@@ -454,7 +1343,17 @@ async def handle_stop(websocket: WebSocket, data: dict):
 
     # Cleanup per-call state
     if stream_sid:
-        manager.vad_detectors.pop(stream_sid, None)
+        manager.release_vad_detector(stream_sid)
+        manager.speech_buffers.pop(stream_sid, None)
+        manager.stt_transcribers.pop(stream_sid, None)
+        manager.release_language_lock(stream_sid)
+        manager.release_echo_gate(stream_sid)
+        manager.echo_segments.discard(stream_sid)
+        manager.pending_barge_ins.pop(stream_sid, None)
+        manager.response_audio_marks.pop(stream_sid, None)
+        manager.prefilled_chars.pop(stream_sid, None)
+        if manager.llm_client is not None:
+            manager.llm_client.forget_call(stream_sid)
         manager.conversations.pop(stream_sid, None)
         manager.stream_to_call.pop(stream_sid, None)
         manager.interrupt_events.pop(stream_sid, None)
@@ -2,6 +2,17 @@ import torch
 import numpy as np
 from typing import Optional, Dict
 
+from src.audio.buffers import AudioRing
+
+# Floor for the adaptive noise estimate (mean-square of int16 samples).
+# RMS 10 ≈ -70 dBFS — well below any real line noise, keeps the gate finite
+# when the caller is muted and the line is digitally silent.
+_GATE_MIN_FLOOR = 100.0
+
+# Consecutive skipped windows after which Silero's recurrent state is reset
+# before the next model call (its context is stale after a long gap).
+_GATE_STATE_RESET_WINDOWS = 10
+
 
 class VADDetector:
     def __init__(
@@ -10,18 +21,48 @@ class VADDetector:
         min_silence_ms: int = 550,
         min_speech_ms: int = 250,
         prefix_padding_ms: int = 300,
-        sampling_rate: int = 16000
+        offset_threshold: Optional[float] = None,
+        min_onset_ms: int = 96,
+        sampling_rate: int = 16000,
+        energy_gate: bool = True,
+        gate_margin_db: float = 6.0,
+        gate_hangover_ms: int = 300,
+        gate_warmup_ms: int = 500,
+        duty_cycle_after_ms: int = 2000,
+        duty_cycle_interval: int = 3,
+        duty_cycle_margin_db: float = 15.0,
     ):
         """
         Initialize VAD detector with Silero VAD.
 
         Args:
-            threshold: Speech detection threshold 0-1 (higher = require louder audio)
+            threshold: Onset threshold 0-1 — probability needed to enter speech
             min_silence_ms: Silence duration before turn complete (default 550ms per research)
-            min_speech_ms: Minimum speech duration to avoid false positives
+            min_speech_ms: Minimum speech duration to avoid false positives;
+                shorter segments followed by min_silence_ms are discarded
             prefix_padding_ms: Audio to include before speech starts (avoid clipped words)
+            offset_threshold: Probability below which ongoing speech counts as
+                silence (hysteresis; default threshold - 0.15)
+            min_onset_ms: Consecutive above-threshold audio required before
+                speech is confirmed — single blips never count as speech
             sampling_rate: Must be 8000 or 16000 (Silero VAD requirement)
+            energy_gate: Skip Silero inference on windows clearly below the
+                adaptive noise floor (and on exact digital silence)
+            gate_margin_db: Windows quieter than noise floor + margin are gated
+            gate_hangover_ms: Keep running the model this long after the last
+                speech window so onsets/offsets are never clipped by the gate
+            gate_warmup_ms: Run the model on every window at call start while
+                the noise floor is still being learned
+            duty_cycle_after_ms: After this much continuous non-speech, windows
+                that pass the gate only narrowly are sampled, not all modelled
+            duty_cycle_interval: During long silences, run the model on every
+                Nth narrowly-passing window
+            duty_cycle_margin_db: Windows louder than floor + this margin always
+                run the model, even while duty-cycling (likely speech onset)
         """
+        if sampling_rate not in (8000, 16000):
+            raise ValueError(f"Silero VAD supports 8000 or 16000 Hz, got {sampling_rate}")
+
         # Load Silero VAD via torch.hub (forced CPU inference)
         self.model, utils = torch.hub.load(
             repo_or_dir='snakers4/silero-vad',
@@ -36,6 +77,10 @@ class VADDetector:
 
         # Configuration
         self.threshold = threshold
+        self.offset_threshold = (
+            offset_threshold if offset_threshold is not None else max(0.0, threshold - 0.15)
+        )
+        self.min_onset_ms = min_onset_ms
         self.min_silence_ms = min_silence_ms
         self.min_speech_ms = min_speech_ms
         self.prefix_padding_ms = prefix_padding_ms
@@ -45,30 +90,57 @@ class VADDetector:
         self.is_speaking = False
         self.silence_duration_ms = 0
         self.speech_duration_ms = 0
+        self.onset_duration_ms = 0
 
-        # Prefix padding buffer (rolling buffer of last 300ms)
-        self.prefix_buffer = []
-        self.prefix_buffer_max = int(prefix_padding_ms / 20)  # 20ms chunks
+        # Pre-roll ring: prefix padding plus the onset confirmation window, so
+        # the exported pre-roll starts prefix_padding_ms before the first
+        # voiced window rather than before the (later) confirmed onset
+        preroll_ms = prefix_padding_ms + min_onset_ms
+        self.prefix_buffer = AudioRing(int(preroll_ms * sampling_rate / 1000))
 
-        # Accumulation buffer for short chunks (Silero needs >= 512 samples at 16kHz)
-        self.min_samples = 512
+        # Accumulation buffer for short chunks (Silero windows: 512 samples at
+        # 16kHz, 256 at 8kHz — both 32ms, so turn timing is rate-independent)
+        self.min_samples = 512 if sampling_rate == 16000 else 256
         self.accum_buffer = np.array([], dtype=np.int16)
 
+        # Energy gate (cheap cascade stage in front of Silero)
+        self.energy_gate = energy_gate
+        self.gate_margin = 10 ** (gate_margin_db / 10)
+        self.duty_cycle_margin = 10 ** (duty_cycle_margin_db / 10)
+        self.gate_hangover_ms = gate_hangover_ms
+        self.duty_cycle_after_ms = duty_cycle_after_ms
+        self.duty_cycle_interval = max(1, duty_cycle_interval)
+        self.noise_floor = _GATE_MIN_FLOOR
+        self._floor_initialized = False
+        self._gate_warmup_left_ms = gate_warmup_ms
+        self._gate_hangover_left_ms = 0.0
+        self._nonspeech_ms = 0.0
+        self._duty_cycle_count = 0
+        self._skipped_run = 0
+        self._last_prob = 0.0
+
+        # Gate statistics (per call, survive reset() between turns)
+        self.windows_processed = 0
+        self.model_calls = 0
+
     def process_chunk(self, audio_chunk: np.ndarray) -> Dict[str, any]:
         """
         Process audio chunk and detect speech/silence transitions.
 
         Args:
-            audio_chunk: PCM 16kHz int16 numpy array (typically 20-30ms)
+            audio_chunk: PCM int16 numpy array at self.sampling_rate (typically 20-30ms)
 
         Returns:
             dict: {
-                "is_speech": bool,
+                "is_speech": bool,        # confirmed speech in this chunk
                 "turn_complete": bool,
-                "speech_probability": float
+                "speech_probability": float,
+                "speech_start": bool,     # onset confirmed — fetch pre-roll now
+                "speech_aborted": bool,   # too-short segment dropped
+                "onset_ms": float         # voiced audio in a not-yet-confirmed onset
             }
         """
-        # Accumulate chunks — Silero requires exactly 512 samples at 16kHz
+        # Accumulate chunks — Silero requires exactly one window (512 @ 16kHz, 256 @ 8kHz)
         self.accum_buffer = np.concatenate([self.accum_buffer, audio_chunk])
         if len(self.accum_buffer) < self.min_samples:
             return {
@@ -76,72 +148,204 @@ class VADDetector:
                 "turn_complete": False,
                 "speech_probability": 0.0,
                 "silence_duration_ms": self.silence_duration_ms,
-                "speech_duration_ms": self.speech_duration_ms
+                "speech_duration_ms": self.speech_duration_ms,
+                "speech_start": False,
+                "speech_aborted": False,
+                "onset_ms": self.onset_duration_ms,
             }
 
         # Process all complete 512-sample windows, keep remainder
+        # Edge flags are sticky across windows so a chunk spanning several
+        # windows never hides an onset or turn end in a non-final window
         last_result = None
+        flags = {"turn_complete": False, "speech_start": False, "speech_aborted": False}
         while len(self.accum_buffer) >= self.min_samples:
             window = self.accum_buffer[:self.min_samples]
             self.accum_buffer = self.accum_buffer[self.min_samples:]
 
-            audio_float = window.astype(np.float32) / 32768.0
-            audio_tensor = torch.from_numpy(audio_float)
-            speech_prob = self.model(audio_tensor, self.sampling_rate).item()
+            speech_prob = self._gated_probability(window)
 
             last_result = self._update_state(window, speech_prob)
+            for key in flags:
+                flags[key] = flags[key] or last_result[key]
 
+        last_result.update(flags)
         return last_result
 
-    def _update_state(self, audio_chunk: np.ndarray, speech_prob: float) -> Dict[str, any]:
-        """Update VAD state for a single 512-sample window."""
-        is_speech = speech_prob > self.threshold
+    def _run_model(self, window: np.ndarray) -> float:
+        """Run Silero on one window and return the speech probability."""
+        if self._skipped_run >= _GATE_STATE_RESET_WINDOWS and hasattr(self.model, "reset_states"):
+            self.model.reset_states()
+        self._skipped_run = 0
+        self.model_calls += 1
 
-        # Update prefix buffer (always maintain last 300ms)
-        self.prefix_buffer.append(audio_chunk)
-        if len(self.prefix_buffer) > self.prefix_buffer_max:
-            self.prefix_buffer.pop(0)
+        audio_float = window.astype(np.float32) / 32768.0
+        audio_tensor = torch.from_numpy(audio_float)
+        return self.model(audio_tensor, self.sampling_rate).item()
 
-        # Track speech/silence durations
-        chunk_duration_ms = len(audio_chunk) / self.sampling_rate * 1000
+    def _gated_probability(self, window: np.ndarray) -> float:
+        """
+        Energy-gate cascade: decide whether this window needs Silero at all.
 
-        if is_speech:
-            self.speech_duration_ms += chunk_duration_ms
-            self.silence_duration_ms = 0
+        Exact digital silence (muted caller, all-0xFF mu-law) and windows
+        below noise floor + margin are scored 0.0 without inference. During
+        long silences, windows that only narrowly clear the gate are
+        duty-cycled. While speaking, in hangover, or warming up, every
+        window goes to the model.
+        """
+        self.windows_processed += 1
+        window_ms = len(window) / self.sampling_rate * 1000
+
+        if not self.energy_gate:
+            return self._run_model(window)
+
+        # Digital silence never needs the model, and says nothing about line noise
+        if not window.any():
+            self._skipped_run += 1
+            self._nonspeech_ms += window_ms
+            self._gate_hangover_left_ms = max(0.0, self._gate_hangover_left_ms - window_ms)
+            return 0.0
+
+        samples = window.astype(np.float32)
+        energy = float(np.dot(samples, samples)) / len(samples)
+
+        force_model = (
+            self.is_speaking
+            or self._gate_hangover_left_ms > 0
+            or self._gate_warmup_left_ms > 0
+        )
+        self._gate_warmup_left_ms = max(0.0, self._gate_warmup_left_ms - window_ms)
+        self._gate_hangover_left_ms = max(0.0, self._gate_hangover_left_ms - window_ms)
+
+        run_model = True
+        if not force_model:
+            if energy < self.noise_floor * self.gate_margin:
+                run_model = False
+            elif (self._nonspeech_ms >= self.duty_cycle_after_ms
+                  and energy < self.noise_floor * self.duty_cycle_margin):
+                self._duty_cycle_count += 1
+                run_model = self._duty_cycle_count % self.duty_cycle_interval == 0
+
+        if run_model:
+            speech_prob = self._run_model(window)
+        else:
+            self._skipped_run += 1
+            # Below the gate → silence; duty-cycled → carry the last verdict
+            speech_prob = 0.0 if energy < self.noise_floor * self.gate_margin else self._last_prob
+        self._last_prob = speech_prob
+
+        if speech_prob > self.threshold:
+            self._gate_hangover_left_ms = self.gate_hangover_ms
+            self._nonspeech_ms = 0.0
+            self._duty_cycle_count = 0
+        else:
+            self._nonspeech_ms += window_ms
             if not self.is_speaking:
-                self.is_speaking = True
+                self._update_noise_floor(energy, window_ms)
+
+        return speech_prob
+
+    def _update_noise_floor(self, energy: float, window_ms: float):
+        """Track the line noise floor: fall quickly, rise slowly (~6 dB/s)."""
+        if not self._floor_initialized:
+            # First non-speech window seeds the estimate directly
+            self._floor_initialized = True
+            self.noise_floor = energy
+        elif energy < self.noise_floor:
+            self.noise_floor = 0.7 * self.noise_floor + 0.3 * energy
+        else:
+            rise = 10 ** (0.6 * window_ms / 1000)
+            self.noise_floor = min(energy, self.noise_floor * rise)
+        self.noise_floor = max(self.noise_floor, _GATE_MIN_FLOOR)
+
+    @property
+    def model_skip_ratio(self) -> float:
+        """Fraction of VAD windows that were scored without running Silero."""
+        if self.windows_processed == 0:
+            return 0.0
+        return 1.0 - self.model_calls / self.windows_processed
+
+    def _update_state(self, audio_chunk: np.ndarray, speech_prob: float) -> Dict[str, any]:
+        """
+        Advance the hysteresis state machine by one Silero window.
+
+        Idle → speaking needs min_onset_ms of audio above `threshold`;
+        speaking → silence needs the probability to drop below
+        `offset_threshold`. A speaking segment shorter than min_speech_ms
+        that is followed by min_silence_ms of silence is discarded.
+        """
+        self.prefix_buffer.write(audio_chunk)
+        chunk_duration_ms = len(audio_chunk) / self.sampling_rate * 1000
+
+        speech_start = False
+        speech_aborted = False
+
+        if self.is_speaking:
+            voiced = speech_prob >= self.offset_threshold
+            if voiced:
+                self.speech_duration_ms += chunk_duration_ms
+                self.silence_duration_ms = 0
+            else:
+                self.silence_duration_ms += chunk_duration_ms
         else:
-            self.silence_duration_ms += chunk_duration_ms
+            voiced = speech_prob > self.threshold
+            if voiced:
+                self.onset_duration_ms += chunk_duration_ms
+                if self.onset_duration_ms >= self.min_onset_ms:
+                    self.is_speaking = True
+                    speech_start = True
+                    self.speech_duration_ms += self.onset_duration_ms
+                    self.silence_duration_ms = 0
+                    self.onset_duration_ms = 0
+            else:
+                self.onset_duration_ms = 0
+                self.silence_duration_ms += chunk_duration_ms
 
         # Check for turn completion
         turn_complete = False
         if self.is_speaking and self.silence_duration_ms >= self.min_silence_ms:
             if self.speech_duration_ms >= self.min_speech_ms:
                 turn_complete = True
+            else:
+                # Too short to be a turn (cough, click) — back to idle
+                self.is_speaking = False
+                self.speech_duration_ms = 0
+                speech_aborted = True
 
         return {
-            "is_speech": is_speech,
+            "is_speech": self.is_speaking and voiced,
             "turn_complete": turn_complete,
             "speech_probability": speech_prob,
             "silence_duration_ms": self.silence_duration_ms,
-            "speech_duration_ms": self.speech_duration_ms
+            "speech_duration_ms": self.speech_duration_ms,
+            "speech_start": speech_start,
+            "speech_aborted": speech_aborted,
+            "onset_ms": self.onset_duration_ms,
         }
 
     def get_prefix_buffer(self) -> np.ndarray:
         """
-        Get prefix padding buffer (audio before speech started).
+        Get pre-roll audio for a new utterance.
+
+        Returns the last prefix_padding_ms (+ onset) of processed audio plus
+        any samples still waiting for a full window, i.e. everything up to
+        the most recent chunk. Call on "speech_start" to seed the capture.
 
         Returns:
-            np.ndarray: Concatenated audio chunks from prefix buffer
+            np.ndarray: int16 audio, oldest sample first
         """
-        if not self.prefix_buffer:
-            return np.array([], dtype=np.int16)
-        return np.concatenate(self.prefix_buffer)
+        return np.concatenate([self.prefix_buffer.read(), self.accum_buffer])
 
     def reset(self):
-        """Reset VAD state for next turn."""
+        """
+        Reset VAD state for next turn.
+
+        The noise floor, gate stats and pre-roll ring are kept: the ring is a
+        continuous history, so the next utterance's pre-roll may legitimately
+        reach back across the reset.
+        """
         self.is_speaking = False
         self.silence_duration_ms = 0
         self.speech_duration_ms = 0
-        self.prefix_buffer = []
+        self.onset_duration_ms = 0
         self.accum_buffer = np.array([], dtype=np.int16)
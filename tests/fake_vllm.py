@@ -0,0 +1,157 @@
+"""
+In-process stand-in for a vLLM OpenAI-compatible server.
+
+Serves /v1/chat/completions through an httpx.MockTransport (pass
+FakeVLLM().http_client() to LLMClient) and models the part of vLLM that
+dominates time-to-first-token: automatic prefix caching. The messages
+are rendered to a prompt string, split into fixed-size blocks, and only
+blocks not already cached pay prefill time before the first token.
+
+Several instances can stand in for a replica set: cluster_http_client()
+routes each request to the FakeVLLM registered for its host.
+"""
+
+import asyncio
+import json
+import random
+from typing import Any, Dict, List, Mapping
+
+import httpx
+
+
+def render_prompt(messages: List[Dict[str, str]], continue_final: bool = False) -> str:
+    """
+    Chat-template stand-in: one tagged span per message plus the generation prompt.
+
+    With continue_final the last message is left open instead (vLLM's
+    continue_final_message / add_generation_prompt=False).
+    """
+    if continue_final:
+        last = messages[-1]
+        return render_prompt(messages[:-1])[:-len("<assistant>")] + f"<{last['role']}>{last['content']}"
+    return "".join(f"<{m['role']}>{m['content']}</{m['role']}>" for m in messages) + "<assistant>"
+
+
+class FakeVLLM:
+    """
+    Fake chat completions endpoint with a block-level prefix cache.
+
+    Every request is recorded in .requests with how many prompt chars were
+    served from cache and how many were prefilled.
+    """
+
+    def __init__(self, prefill_s_per_char: float = 0.0001, block_chars: int = 64,
+                 reply: str = "Sure, I can help with that.", delay_s: float = 0.0,
+                 fail: bool = False, tail_prob: float = 0.0, tail_delay_s: float = 0.0,
+                 seed: int = 0):
+        """
+        Args:
+            prefill_s_per_char: Prefill cost of each uncached prompt char
+            block_chars: Prefix-cache block size
+            reply: Text generated (split into word tokens)
+            delay_s: Fixed queueing delay before prefill (a slow replica)
+            fail: Answer every request with HTTP 500 (after delay_s)
+            tail_prob: Chance a request is stuck for tail_delay_s extra
+                (a long batch, GC pause...) — the latency tail hedging cuts
+            tail_delay_s: Extra delay of a tail request
+            seed: Seed for the tail draws
+        """
+        self.prefill_s_per_char = prefill_s_per_char
+        self.block_chars = block_chars
+        self.reply = reply
+        self.delay_s = delay_s
+        self.fail = fail
+        self.tail_prob = tail_prob
+        self.tail_delay_s = tail_delay_s
+        self.rng = random.Random(seed)
+        self.cancelled = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cache = set()
+        self.requests: List[Dict[str, Any]] = []
+
+    def http_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handle))
+
+    def _prefill(self, prompt: str) -> int:
+        """Cache the prompt's full blocks; return the chars that needed prefill."""
+        blocks = len(prompt) // self.block_chars
+        cached = 0
+        while cached < blocks and prompt[:(cached + 1) * self.block_chars] in self.cache:
+            cached += 1
+        for i in range(blocks):
+            self.cache.add(prompt[:(i + 1) * self.block_chars])
+        return len(prompt) - cached * self.block_chars
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            return await self._respond(request)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+
+    async def _respond(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if self.fail:
+            self.requests.append({"messages": body["messages"], "failed": True})
+            await asyncio.sleep(self.delay_s)
+            return httpx.Response(500, json={"error": {"message": "replica down"}})
+        continue_final = bool(body.get("continue_final_message"))
+        prompt = render_prompt(body["messages"], continue_final)
+        prefill_chars = self._prefill(prompt)
+        self.requests.append({
+            "messages": body["messages"],
+            "continue_final_message": continue_final,
+            "max_tokens": body.get("max_tokens"),
+            "stream": bool(body.get("stream")),
+            "prompt_chars": len(prompt),
+            "prefill_chars": prefill_chars,
+        })
+        tail = self.tail_delay_s if self.rng.random() < self.tail_prob else 0.0
+        await asyncio.sleep(self.delay_s + tail + prefill_chars * self.prefill_s_per_char)
+
+        words = self.reply.split(" ")
+        if body.get("max_tokens") is not None:
+            words = words[:body["max_tokens"]]
+        tokens = [w if i == 0 else " " + w for i, w in enumerate(words)]
+
+        if not body.get("stream"):
+            return httpx.Response(200, json={
+                "id": "cmpl-fake",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body["model"],
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "".join(tokens)},
+                    "finish_reason": "length",
+                }],
+            })
+
+        events = []
+        for token in tokens:
+            chunk = {
+                "id": "cmpl-fake",
+                "object": "chat.completion.chunk",
+                "created": 0,
+                "model": body["model"],
+                "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}],
+            }
+            events.append(f"data: {json.dumps(chunk)}\n\n")
+        events.append("data: [DONE]\n\n")
+        return httpx.Response(
+            200,
+            headers={"content-type": "text/event-stream"},
+            content="".join(events).encode(),
+        )
+
+
+def cluster_http_client(servers: Mapping[str, FakeVLLM]) -> httpx.AsyncClient:
+    """One client for several stand-ins, routed by host ("http://<host>/v1")."""
+    async def route(request: httpx.Request) -> httpx.Response:
+        return await servers[request.url.host].handle(request)
+    return httpx.AsyncClient(transport=httpx.MockTransport(route))
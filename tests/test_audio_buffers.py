@@ -0,0 +1,104 @@
+"""Tests for utterance capture and the outbound streamer (src/audio/buffers.py)."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+from src.audio.buffers import AudioStreamer, UtteranceCapture
+
+
+def test_utterance_capture_keeps_preroll_and_pauses():
+    """UtteranceCapture keeps pre-roll and internal pauses, trims the tail"""
+    capture = UtteranceCapture(sample_rate=8000, trailing_padding_ms=100)
+    preroll = np.full(800, 1, dtype=np.int16)
+    speech = np.full(1600, 2, dtype=np.int16)
+    pause = np.zeros(1600, dtype=np.int16)
+    tail = np.zeros(4000, dtype=np.int16)
+
+    capture.append(np.full(160, 7, dtype=np.int16))  # idle: ignored
+    capture.start(preroll)
+    for chunk in (speech, pause, speech, tail):
+        capture.append(chunk)
+
+    audio = capture.finish(trailing_silence_samples=len(tail))
+
+    # 100ms (800 samples) of the 4000-sample silent tail is kept as padding
+    assert len(audio) == 800 + 1600 + 1600 + 1600 + 800
+    assert audio[0] == 1
+    assert not capture.active
+
+
+def test_utterance_capture_discard():
+    """Aborted utterances leave nothing behind"""
+    capture = UtteranceCapture()
+    capture.start(np.ones(100, dtype=np.int16))
+    capture.discard()
+
+    assert not capture.active
+    assert len(capture.finish()) == 0
+
+
+def test_utterance_capture_drain_keeps_utterance_active():
+    """drain() hands off audio so far; later audio still reaches finish()"""
+    capture = UtteranceCapture(sample_rate=8000, trailing_padding_ms=0)
+    capture.start(np.full(800, 1, dtype=np.int16))
+    capture.append(np.full(800, 2, dtype=np.int16))
+
+    drained = capture.drain()
+    capture.append(np.full(800, 3, dtype=np.int16))
+
+    assert len(drained) == 1600
+    assert capture.active
+    assert list(np.unique(capture.finish())) == [3]
+
+
+def test_utterance_capture_hard_cap():
+    """Past max_seconds the oldest audio is dropped"""
+    capture = UtteranceCapture(sample_rate=8000, max_seconds=1.0)
+    capture.start(np.array([], dtype=np.int16))
+    for k in range(100):
+        capture.append(np.full(160, k, dtype=np.int16))
+
+    assert capture.num_samples <= 8000
+    assert capture.dropped_samples == 100 * 160 - capture.num_samples
+    assert capture.finish()[-1] == 99
+
+
+@pytest.mark.asyncio
+async def test_streamer_pause_holds_queued_audio():
+    """While paused the streamer sends silence and keeps its queue"""
+    websocket = AsyncMock()
+    streamer = AudioStreamer(websocket, "stream_pause")
+    await streamer.queue_audio("AAAA")
+    streamer.pause()
+    await streamer.start()
+    await asyncio.sleep(0.05)
+
+    assert streamer.outbound_queue.qsize() == 1
+    assert streamer.last_audio_sent_at is None
+    sent = [json.loads(c.args[0])["media"]["payload"] for c in websocket.send_text.call_args_list]
+    assert sent and "AAAA" not in sent
+
+    streamer.resume()
+    await asyncio.sleep(0.05)
+    await streamer.stop()
+    assert streamer.outbound_queue.empty()
+    assert streamer.last_audio_sent_at is not None
+
+
+@pytest.mark.asyncio
+async def test_queue_audio_waits_while_paused():
+    """Producers block on a paused streamer instead of dropping audio"""
+    streamer = AudioStreamer(AsyncMock(), "stream_pause_wait")
+    streamer.pause()
+    put = asyncio.create_task(streamer.queue_audio("AAAA"))
+    await asyncio.sleep(0.01)
+    assert not put.done()
+
+    # Clearing (interrupt) ends the pause
+    await streamer.clear_queue()
+    await put
+    assert not streamer.paused
+    assert streamer.outbound_queue.qsize() == 1
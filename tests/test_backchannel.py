@@ -0,0 +1,41 @@
+"""Tests for backchannel classification (src/stt/backchannel.py)."""
+
+from src.stt.backchannel import BackchannelClassifier
+
+
+def test_acknowledgements_are_backchannels():
+    """Short acknowledgements, in any spelling or combination, resume playback"""
+    c = BackchannelClassifier()
+    for text in ("Uh-huh.", "mm-hmm", "Right.", "Yeah, okay.", "Got it!", "OK", "mm hmm right"):
+        assert c.is_backchannel(text, 400), text
+
+
+def test_real_interruptions_are_not_backchannels():
+    """Anything with content beyond an acknowledgement takes the turn"""
+    c = BackchannelClassifier()
+    for text in ("Wait", "No, that's wrong", "Yeah but what about Tuesday", "right now please"):
+        assert not c.is_backchannel(text, 400), text
+
+
+def test_long_overlap_is_never_a_backchannel():
+    """Overlap speech past max_speech_ms interrupts whatever it says"""
+    c = BackchannelClassifier(max_speech_ms=800)
+    assert not c.is_backchannel("yeah", 900)
+
+
+def test_empty_overlap_resumes():
+    """Noise that transcribes to nothing does not cancel the response"""
+    c = BackchannelClassifier()
+    assert c.is_backchannel("", 0)
+    assert c.is_backchannel(" ... ", 300)
+
+
+def test_custom_phrases_and_counters():
+    c = BackchannelClassifier(phrases=["Ja", "Genau"])
+    assert c.is_backchannel("Ja, genau.", 500)
+    assert not c.is_backchannel("yeah", 500)
+
+    c.record_resume()
+    c.record_commit()
+    c.record_resume()
+    assert (c.resumed, c.committed) == (2, 1)
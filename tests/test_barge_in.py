@@ -1,6 +1,7 @@
 """Tests for barge-in detection infrastructure (Phase 5 Plan 01)."""
 
 import asyncio
+import numpy as np
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -80,7 +81,11 @@ class TestBargeInDetection:
             "speech_probability": 0.9,
             "silence_duration_ms": 0,
             "speech_duration_ms": 100,
+            "speech_start": False,
+            "speech_aborted": False,
+            "onset_ms": 0,
         }
+        mock_vad.sampling_rate = 8000
         manager.vad_detectors[stream_sid] = mock_vad
 
         # Mock STT
@@ -93,11 +98,10 @@ class TestBargeInDetection:
         payload = base64.b64encode(b"\x00" * 160).decode()
         data = {"media": {"payload": payload}, "streamSid": stream_sid}
 
-        with patch("src.twilio.handlers.mulaw_to_pcm", return_value=b"\x00" * 320), \
+        with patch("src.twilio.handlers.mulaw_to_pcm", return_value=np.zeros(160, dtype=np.int16)), \
              patch("src.twilio.handlers.resample_8k_to_16k") as mock_resample, \
              patch("src.twilio.handlers.asyncio.to_thread", side_effect=_fake_to_thread), \
              patch("src.twilio.handlers._handle_interrupt", new_callable=AsyncMock) as mock_interrupt:
-            import numpy as np
             mock_resample.return_value = np.zeros(512, dtype=np.int16)
             await handle_media(AsyncMock(), data)
 
@@ -131,7 +135,11 @@ class TestBargeInDetection:
             "speech_probability": 0.9,
             "silence_duration_ms": 0,
             "speech_duration_ms": 100,
+            "speech_start": False,
+            "speech_aborted": False,
+            "onset_ms": 0,
         }
+        mock_vad.sampling_rate = 8000
         manager.vad_detectors[stream_sid] = mock_vad
 
         mock_stt = MagicMock()
@@ -142,10 +150,9 @@ class TestBargeInDetection:
         payload = base64.b64encode(b"\x00" * 160).decode()
         data = {"media": {"payload": payload}, "streamSid": stream_sid}
 
-        with patch("src.twilio.handlers.mulaw_to_pcm", return_value=b"\x00" * 320), \
+        with patch("src.twilio.handlers.mulaw_to_pcm", return_value=np.zeros(160, dtype=np.int16)), \
              patch("src.twilio.handlers.resample_8k_to_16k") as mock_resample, \
              patch("src.twilio.handlers.asyncio.to_thread", side_effect=_fake_to_thread):
-            import numpy as np
             mock_resample.return_value = np.zeros(512, dtype=np.int16)
             await handle_media(AsyncMock(), data)
 
@@ -157,6 +164,329 @@ class TestBargeInDetection:
         manager.interrupt_events.pop(stream_sid, None)
         manager.stt_processor = None
 
+    @pytest.mark.asyncio
+    async def test_early_onset_triggers_barge_in(self):
+        """A confident onset interrupts before the VAD confirms speech."""
+        from src.twilio.handlers import manager, handle_media
+
+        stream_sid = "test_stream_early"
+
+        manager.is_responding[stream_sid] = True
+        manager.get_interrupt_event(stream_sid)
+
+        mock_vad = MagicMock()
+        mock_vad.process_chunk.return_value = {
+            "is_speech": False,
+            "turn_complete": False,
+            "speech_probability": 0.95,
+            "silence_duration_ms": 0,
+            "speech_duration_ms": 0,
+            "speech_start": False,
+            "speech_aborted": False,
+            "onset_ms": 32,
+        }
+        mock_vad.sampling_rate = 8000
+        manager.vad_detectors[stream_sid] = mock_vad
+
+        import base64
+        payload = base64.b64encode(b"\x00" * 160).decode()
+        data = {"media": {"payload": payload}, "streamSid": stream_sid}
+
+        with patch("src.twilio.handlers.mulaw_to_pcm", return_value=np.zeros(160, dtype=np.int16)), \
+             patch("src.twilio.handlers._handle_interrupt", new_callable=AsyncMock) as mock_interrupt:
+            await handle_media(AsyncMock(), data)
+
+        mock_interrupt.assert_awaited_once()
+        # Speech start is back-dated by the onset already heard
+        assert mock_interrupt.call_args[0][2] is not None
+
+        # Cleanup
+        manager.vad_detectors.pop(stream_sid, None)
+        manager.is_responding.pop(stream_sid, None)
+        manager.interrupt_events.pop(stream_sid, None)
+        manager.speech_buffers.pop(stream_sid, None)
+
+    @pytest.mark.asyncio
+    async def test_echo_does_not_trigger_barge_in(self):
+        """Speech explained by our own outbound audio is not an interrupt."""
+        from src.twilio.handlers import manager, handle_media
+
+        stream_sid = "test_stream_echo"
+
+        manager.is_responding[stream_sid] = True
+        event = manager.get_interrupt_event(stream_sid)
+
+        mock_vad = MagicMock()
+        mock_vad.process_chunk.return_value = {
+            "is_speech": True,
+            "turn_complete": False,
+            "speech_probability": 0.9,
+            "silence_duration_ms": 0,
+            "speech_duration_ms": 100,
+            "speech_start": False,
+            "speech_aborted": False,
+            "onset_ms": 0,
+        }
+        mock_vad.sampling_rate = 8000
+        manager.vad_detectors[stream_sid] = mock_vad
+
+        gate = MagicMock()
+        gate.check_candidate.return_value = True
+        gate.last_correlation = 0.95
+        manager.echo_gates[stream_sid] = gate
+
+        import base64
+        payload = base64.b64encode(b"\x00" * 160).decode()
+        data = {"media": {"payload": payload}, "streamSid": stream_sid}
+
+        with patch("src.twilio.handlers.mulaw_to_pcm", return_value=np.zeros(160, dtype=np.int16)), \
+             patch("src.twilio.handlers._handle_interrupt", new_callable=AsyncMock) as mock_interrupt:
+            await handle_media(AsyncMock(), data)
+
+        mock_interrupt.assert_not_awaited()
+        assert not event.is_set()
+        gate.push_inbound.assert_called_once()
+
+        # Cleanup
+        manager.vad_detectors.pop(stream_sid, None)
+        manager.is_responding.pop(stream_sid, None)
+        manager.interrupt_events.pop(stream_sid, None)
+        manager.echo_gates.pop(stream_sid, None)
+        manager.echo_segments.discard(stream_sid)
+        manager.speech_buffers.pop(stream_sid, None)
+
+    @pytest.mark.asyncio
+    async def test_echo_segment_is_not_a_turn(self):
+        """A segment suppressed as echo is dropped at turn end, not transcribed and answered."""
+        from src.audio.buffers import UtteranceCapture
+        from src.twilio.handlers import manager, handle_media
+
+        stream_sid = "test_stream_echo_turn"
+        manager.is_responding[stream_sid] = True
+        frame = {
+            "is_speech": True, "turn_complete": False, "speech_probability": 0.9,
+            "silence_duration_ms": 0, "speech_duration_ms": 800, "speech_start": False,
+            "speech_aborted": False, "onset_ms": 0,
+        }
+        mock_vad = MagicMock()
+        mock_vad.is_speaking = True
+        mock_vad.sampling_rate = 8000
+        mock_vad.accum_buffer = np.array([], dtype=np.int16)
+        mock_vad.process_chunk.side_effect = [
+            frame, {**frame, "is_speech": False, "turn_complete": True, "silence_duration_ms": 600},
+        ]
+        manager.vad_detectors[stream_sid] = mock_vad
+        gate = MagicMock()
+        gate.check_candidate.return_value = True
+        gate.last_correlation = 0.95
+        manager.echo_gates[stream_sid] = gate
+        capture = UtteranceCapture()
+        capture.start(np.full(8000, 3000, dtype=np.int16))
+        manager.speech_buffers[stream_sid] = capture
+        router = MagicMock()
+        manager.stt_router = router
+
+        import base64
+        data = {"media": {"payload": base64.b64encode(b"\x00" * 160).decode()}, "streamSid": stream_sid}
+        with patch("src.twilio.handlers.mulaw_to_pcm", return_value=np.zeros(160, dtype=np.int16)), \
+             patch("src.twilio.handlers._generate_response", new_callable=AsyncMock) as mock_generate:
+            await handle_media(AsyncMock(), data)
+            assert stream_sid in manager.echo_segments
+            await handle_media(AsyncMock(), data)
+
+        router.transcribe_utterance.assert_not_called()
+        mock_generate.assert_not_called()
+        assert not capture.active
+        assert stream_sid not in manager.echo_segments
+        mock_vad.reset.assert_called_once()
+
+        for d in (manager.vad_detectors, manager.is_responding, manager.interrupt_events,
+                  manager.echo_gates, manager.speech_buffers):
+            d.pop(stream_sid, None)
+        manager.stt_router = None
+
+class TestBackchannel:
+    """Barge-ins pause playback; backchannels resume it, anything else interrupts."""
+
+    def _media(self, stream_sid):
+        import base64
+        payload = base64.b64encode(b"\x00" * 160).decode()
+        return {"media": {"payload": payload}, "streamSid": stream_sid}
+
+    def _vad(self, **overrides):
+        mock_vad = MagicMock()
+        result = {
+            "is_speech": True,
+            "turn_complete": False,
+            "speech_probability": 0.9,
+            "silence_duration_ms": 0,
+            "speech_duration_ms": 300,
+            "speech_start": False,
+            "speech_aborted": False,
+            "onset_ms": 0,
+        }
+        result.update(overrides)
+        mock_vad.process_chunk.return_value = result
+        mock_vad.sampling_rate = 8000
+        mock_vad.get_prefix_buffer.return_value = np.zeros(800, dtype=np.int16)
+        return mock_vad
+
+    def _setup(self, stream_sid, call_sid):
+        from src.twilio.handlers import manager
+        manager.is_responding[stream_sid] = True
+        manager.stream_to_call[stream_sid] = call_sid
+        streamer = MagicMock()
+        manager.streamers[call_sid] = streamer
+        return streamer
+
+    def _cleanup(self, stream_sid, call_sid):
+        from src.twilio.handlers import manager
+        for d in (manager.vad_detectors, manager.is_responding, manager.interrupt_events,
+                  manager.speech_buffers, manager.stream_to_call, manager.pending_barge_ins):
+            d.pop(stream_sid, None)
+        manager.streamers.pop(call_sid, None)
+        manager.stt_router = None
+
+    @pytest.mark.asyncio
+    async def test_barge_in_pauses_instead_of_interrupting(self):
+        from src.twilio.handlers import manager, handle_media
+
+        stream_sid, call_sid = "test_bc_pause", "call_bc_pause"
+        streamer = self._setup(stream_sid, call_sid)
+        manager.vad_detectors[stream_sid] = self._vad()
+
+        with patch("src.twilio.handlers.mulaw_to_pcm", return_value=np.zeros(160, dtype=np.int16)), \
+             patch("src.twilio.handlers._handle_interrupt", new_callable=AsyncMock) as mock_interrupt:
+            await handle_media(AsyncMock(), self._media(stream_sid))
+
+        streamer.pause.assert_called_once()
+        mock_interrupt.assert_not_awaited()
+        assert stream_sid in manager.pending_barge_ins
+
+        self._cleanup(stream_sid, call_sid)
+
+    @pytest.mark.asyncio
+    async def test_backchannel_resumes_playback(self):
+        from src.twilio.handlers import manager, handle_media, PendingBargeIn
+
+        stream_sid, call_sid = "test_bc_resume", "call_bc_resume"
+        streamer = self._setup(stream_sid, call_sid)
+        mock_vad = self._vad(is_speech=False, silence_duration_ms=260, speech_duration_ms=300)
+        manager.vad_detectors[stream_sid] = mock_vad
+        manager.get_interrupt_event(stream_sid).set()
+        pending = PendingBargeIn(0.0, np.ones(800, dtype=np.int16), 8000)
+        pending.silence_ms = 240  # this frame ends the overlap
+        manager.pending_barge_ins[stream_sid] = pending
+        router = MagicMock()
+        router.transcribe_utterance.return_value = {"text": "Uh-huh."}
+        manager.stt_router = router
+        resumed = manager.backchannel_classifier.resumed
+
+        with patch("src.twilio.handlers.mulaw_to_pcm", return_value=np.zeros(160, dtype=np.int16)), \
+             patch("src.twilio.handlers.asyncio.to_thread", side_effect=_fake_to_thread), \
+             patch("src.twilio.handlers._handle_interrupt", new_callable=AsyncMock) as mock_interrupt:
+            await handle_media(AsyncMock(), self._media(stream_sid))
+
+        mock_interrupt.assert_not_awaited()
+        router.transcribe_utterance.assert_called_once()
+        streamer.resume.assert_called_once()
+        mock_vad.reset.assert_called_once()
+        assert stream_sid not in manager.pending_barge_ins
+        assert not manager.get_interrupt_event(stream_sid).is_set()
+        assert manager.backchannel_classifier.resumed == resumed + 1
+        assert manager.get_backchannel_stats()["regenerations_saved"] == resumed + 1
+
+        self._cleanup(stream_sid, call_sid)
+
+    @pytest.mark.asyncio
+    async def test_real_interruption_commits(self):
+        from src.twilio.handlers import manager, handle_media, PendingBargeIn
+
+        stream_sid, call_sid = "test_bc_commit", "call_bc_commit"
+        streamer = self._setup(stream_sid, call_sid)
+        manager.vad_detectors[stream_sid] = self._vad(is_speech=False, silence_duration_ms=260)
+        pending = PendingBargeIn(123.0, np.ones(800, dtype=np.int16), 8000)
+        pending.silence_ms = 240
+        manager.pending_barge_ins[stream_sid] = pending
+        router = MagicMock()
+        router.transcribe_utterance.return_value = {"text": "Wait, stop."}
+        manager.stt_router = router
+
+        with patch("src.twilio.handlers.mulaw_to_pcm", return_value=np.zeros(160, dtype=np.int16)), \
+             patch("src.twilio.handlers.asyncio.to_thread", side_effect=_fake_to_thread), \
+             patch("src.twilio.handlers._handle_interrupt", new_callable=AsyncMock) as mock_interrupt:
+            await handle_media(AsyncMock(), self._media(stream_sid))
+
+        mock_interrupt.assert_awaited_once()
+        assert mock_interrupt.call_args[0][2] == 123.0
+        streamer.resume.assert_not_called()
+        assert stream_sid not in manager.pending_barge_ins
+
+        self._cleanup(stream_sid, call_sid)
+
+    @pytest.mark.asyncio
+    async def test_early_onset_stays_paused_until_it_fades(self):
+        """The idle silence before an early onset does not end the overlap."""
+        from src.twilio.handlers import manager, handle_media
+
+        stream_sid, call_sid = "test_bc_onset", "call_bc_onset"
+        streamer = self._setup(stream_sid, call_sid)
+        # Onset not yet confirmed; the VAD's counter is the silence before it
+        onset = self._vad(is_speech=False, speech_duration_ms=0, silence_duration_ms=2000,
+                          onset_ms=64, speech_probability=0.95)
+        manager.vad_detectors[stream_sid] = onset
+        router = MagicMock()
+        manager.stt_router = router
+        resumed = manager.backchannel_classifier.resumed
+
+        with patch("src.twilio.handlers.mulaw_to_pcm", return_value=np.zeros(160, dtype=np.int16)), \
+             patch("src.twilio.handlers._handle_interrupt", new_callable=AsyncMock) as mock_interrupt, \
+             patch.multiple("src.twilio.handlers.settings", barge_in_early_onset_ms=48,
+                            barge_in_early_threshold=0.8):
+            for _ in range(3):
+                await handle_media(AsyncMock(), self._media(stream_sid))
+            streamer.pause.assert_called_once()
+            streamer.resume.assert_not_called()
+            assert stream_sid in manager.pending_barge_ins
+
+            # The onset fades without the VAD confirming it
+            onset.process_chunk.return_value.update(onset_ms=0, speech_probability=0.1)
+            for _ in range(13):  # 260ms
+                await handle_media(AsyncMock(), self._media(stream_sid))
+
+        mock_interrupt.assert_not_awaited()
+        router.transcribe_utterance.assert_not_called()
+        streamer.resume.assert_called_once()
+        onset.reset.assert_not_called()
+        assert stream_sid not in manager.pending_barge_ins
+        assert manager.backchannel_classifier.resumed == resumed
+
+        self._cleanup(stream_sid, call_sid)
+
+    @pytest.mark.asyncio
+    async def test_long_overlap_commits_without_transcribing(self):
+        from src.twilio.handlers import manager, handle_media, PendingBargeIn
+
+        stream_sid, call_sid = "test_bc_long", "call_bc_long"
+        self._setup(stream_sid, call_sid)
+        manager.vad_detectors[stream_sid] = self._vad(speech_duration_ms=1200)
+        manager.pending_barge_ins[stream_sid] = PendingBargeIn(0.0, np.ones(800, dtype=np.int16), 8000)
+        router = MagicMock()
+        manager.stt_router = router
+
+        with patch("src.twilio.handlers.mulaw_to_pcm", return_value=np.zeros(160, dtype=np.int16)), \
+             patch("src.twilio.handlers._handle_interrupt", new_callable=AsyncMock) as mock_interrupt:
+            await handle_media(AsyncMock(), self._media(stream_sid))
+
+        mock_interrupt.assert_awaited_once()
+        router.transcribe_utterance.assert_not_called()
+
+        self._cleanup(stream_sid, call_sid)
+
+
+class TestBargeInCleanup:
+    """Per-call barge-in state is released on stop."""
+
     @pytest.mark.asyncio
     async def test_interrupt_event_cleanup_on_stop(self):
         """Interrupt state is cleaned up when call stops."""
@@ -200,7 +530,7 @@ class TestResponseTask:
 
         mock_llm = AsyncMock()
 
-        async def mock_generate(messages):
+        async def mock_generate(messages, **kwargs):
             # Verify responding is True during generation
             assert manager.is_responding.get(stream_sid) is True
             yield "Hello!"
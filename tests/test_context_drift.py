@@ -102,7 +102,7 @@ class TestContextDriftInResponse:
         manager.tts_stream = mock_tts
 
         # LLM generates 3 sentences, cancel after first sentence is spoken
-        async def slow_llm(messages):
+        async def slow_llm(messages, **kwargs):
             yield "First sentence. "
             yield "Second sentence. "
             await asyncio.sleep(10)  # Will be cancelled during this wait
@@ -156,7 +156,7 @@ class TestContextDriftInResponse:
         manager.stream_to_call[stream_sid] = call_sid
         manager.streamers[call_sid] = None  # Skip TTS
 
-        async def mock_generate(messages):
+        async def mock_generate(messages, **kwargs):
             yield "Hi there!"
 
         mock_llm = AsyncMock()
@@ -209,7 +209,7 @@ class TestErrorRecovery:
         manager.tts_stream = mock_tts
 
         # LLM raises an error
-        async def failing_llm(messages):
+        async def failing_llm(messages, **kwargs):
             raise ConnectionError("LLM timeout")
             yield  # Make it an async generator
 
@@ -261,7 +261,7 @@ class TestErrorRecovery:
         manager.tts_stream = mock_tts
 
         # LLM succeeds
-        async def mock_generate(messages):
+        async def mock_generate(messages, **kwargs):
             yield "Hello there."
 
         mock_llm = AsyncMock()
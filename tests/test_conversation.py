@@ -89,3 +89,62 @@ def test_reset_clears_history():
     assert cm.system_prompt is not None
     messages = cm.get_messages()
     assert len(messages) == 1  # Just system prompt
+
+
+def test_extend_user_message_merges_unanswered_turn():
+    """Test: extend_user_message() merges into an unanswered user turn only"""
+    cm = ConversationManager()
+    assert not cm.extend_user_message("hello")  # nothing to merge into
+
+    cm.add_user_message("I'd like to book a table")
+    assert cm.extend_user_message("for four people")
+    assert cm.history == [{"role": "user", "content": "I'd like to book a table for four people"}]
+
+    cm.add_assistant_message("Sure, what time?")
+    assert not cm.extend_user_message("at eight")
+    assert cm.get_turn_count() == 1
+
+
+def _prefix_rewrites(cm, turns):
+    """Turns whose request does not start with the previous request's bytes."""
+    import json
+    rewrites = 0
+    previous = None
+    for turn in range(turns):
+        cm.add_user_message(f"question {turn}")
+        request = json.dumps(cm.get_messages())[:-1]  # open-ended list
+        if previous is not None and not request.startswith(previous):
+            rewrites += 1
+        previous = request
+        cm.add_assistant_message(f"answer {turn}")
+    return rewrites
+
+
+def test_messages_are_prefix_stable_across_turns():
+    """Test: requests extend the previous one byte for byte until a batch trim"""
+    assert _prefix_rewrites(ConversationManager(max_history_messages=6, trim_batch=4), 10) == 4
+    # Trimming one message at a time rewrites the prefix on every turn past the limit
+    assert _prefix_rewrites(ConversationManager(max_history_messages=6), 10) == 7
+    assert _prefix_rewrites(ConversationManager(max_history_messages=100, trim_batch=4), 10) == 0
+
+
+def test_warmup_messages_end_with_empty_user_turn():
+    """Test: warm-up covers the system prompt up to where the caller's text goes"""
+    cm = ConversationManager()
+    warmup = cm.get_warmup_messages()
+    assert warmup[:-1] == cm.get_messages()
+    assert warmup[-1] == {"role": "user", "content": ""}
+
+
+def test_partial_messages_preview_the_next_request():
+    """Test: get_partial_messages() matches the request the final text will produce"""
+    cm = ConversationManager()
+    cm.add_user_message("Hi")
+    cm.add_assistant_message("Hello!")
+    assert cm.get_partial_messages(" I need to ")[-1] == {"role": "user", "content": "I need to"}
+
+    # Unanswered user turn: the final text will be merged into it
+    cm.add_user_message("Book a table")
+    partial = cm.get_partial_messages("for four")
+    assert partial[-1] == {"role": "user", "content": "Book a table for four"}
+    assert cm.history[-1]["content"] == "Book a table"  # history untouched
@@ -0,0 +1,69 @@
+"""Tests for echo-aware barge-in gating (src/audio/echo.py)."""
+
+import numpy as np
+from src.audio.echo import EchoGate
+from src.audio.buffers import AudioRing
+
+
+def _feed(gate, outbound, inbound):
+    for i in range(0, len(outbound), 160):
+        gate.push_outbound(outbound[i:i + 160])
+        gate.push_inbound(inbound[i:i + 160])
+
+
+def _signals(seed=0, seconds=1.5, delay_s=0.2, echo_gain=0.3):
+    rng = np.random.default_rng(seed)
+    out = rng.normal(0, 4000, int(8000 * seconds)).astype(np.int16)
+    delay = int(delay_s * 8000)
+    echo = np.zeros(len(out))
+    echo[delay:] = out[:-delay] * echo_gain
+    line = rng.normal(0, 100, len(out))
+    caller = rng.normal(0, 3000, len(out))
+    return out, echo + line, caller
+
+
+def test_delayed_echo_is_suppressed():
+    """Our own audio coming back 200ms later is recognised"""
+    out, echo, _ = _signals()
+    gate = EchoGate()
+    _feed(gate, out, echo.astype(np.int16))
+    assert gate.is_echo()
+    assert gate.last_correlation > 0.9
+
+
+def test_caller_talking_over_us_is_accepted():
+    """Double talk: the caller is louder than the leak"""
+    out, echo, caller = _signals()
+    gate = EchoGate()
+    _feed(gate, out, (echo + caller).astype(np.int16))
+    assert not gate.is_echo()
+
+
+def test_no_outbound_audio_means_no_echo():
+    """While we send silence, any inbound speech is the caller"""
+    out, _, caller = _signals()
+    gate = EchoGate()
+    _feed(gate, np.zeros_like(out), caller.astype(np.int16))
+    assert not gate.is_echo()
+
+
+def test_suppressed_run_counts_once():
+    """A run of echo frames is one suppressed interrupt"""
+    out, echo, _ = _signals()
+    gate = EchoGate()
+    _feed(gate, out, echo.astype(np.int16))
+    for _ in range(5):
+        assert gate.check_candidate()
+    gate.end_candidate()
+    assert gate.check_candidate()
+    assert gate.suppressed == 2
+    assert gate.accepted == 0
+
+
+def test_audio_ring_read_last_n():
+    ring = AudioRing(5)
+    ring.write(np.arange(1, 8, dtype=np.int16))
+    assert list(ring.read()) == [3, 4, 5, 6, 7]
+    assert list(ring.read(2)) == [6, 7]
+    assert list(ring.read(4)) == [4, 5, 6, 7]
+    assert len(ring.read(0)) == 0
@@ -3,7 +3,7 @@
 import asyncio
 import json
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 
 async def _fake_to_thread(fn, *args):
@@ -46,7 +46,11 @@ class TestHandleInterrupt:
 
         await _handle_interrupt(mock_ws, stream_sid)
 
+        # Cancellation is requested, not awaited: the task unwinds on its own
+        with pytest.raises(asyncio.CancelledError):
+            await task
         assert task.cancelled()
+        assert stream_sid not in manager.response_tasks
 
         # Cleanup
         manager.response_tasks.pop(stream_sid, None)
@@ -85,6 +89,80 @@ class TestHandleInterrupt:
         manager.interrupt_events.pop(stream_sid, None)
         manager.vad_detectors.pop(stream_sid, None)
 
+    @pytest.mark.asyncio
+    async def test_interrupt_stops_audio_before_cancelling(self):
+        """Queue drop and cancel happen before the first await on Twilio"""
+        from src.twilio.handlers import _handle_interrupt, manager
+
+        stream_sid = "test_interrupt_order"
+        call_sid = "call_order"
+        order = []
+
+        async def slow_task():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                order.append("task_cancelled")
+                raise
+
+        task = asyncio.create_task(slow_task())
+        await asyncio.sleep(0)
+        manager.response_tasks[stream_sid] = task
+        manager.stream_to_call[stream_sid] = call_sid
+        mock_streamer = AsyncMock()
+        mock_streamer.clear_queue.side_effect = lambda: order.append("queue_cleared")
+        manager.streamers[call_sid] = mock_streamer
+        manager.is_responding[stream_sid] = True
+        manager.interrupt_events[stream_sid] = asyncio.Event()
+
+        mock_ws = AsyncMock()
+        mock_ws.send_text.side_effect = lambda msg: order.append(
+            "clear_sent" + ("_after_cancel" if task.cancelling() else "")
+        )
+
+        await _handle_interrupt(mock_ws, stream_sid)
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert order == ["queue_cleared", "clear_sent_after_cancel", "task_cancelled"]
+
+        # Cleanup
+        manager.stream_to_call.pop(stream_sid, None)
+        manager.streamers.pop(call_sid, None)
+        manager.is_responding.pop(stream_sid, None)
+        manager.interrupt_events.pop(stream_sid, None)
+
+    @pytest.mark.asyncio
+    async def test_interrupt_records_stop_latency(self):
+        """Stop latency runs from the first speech frame to the last audio frame"""
+        import time
+        from src.twilio.handlers import _handle_interrupt, manager
+
+        stream_sid = "test_interrupt_latency"
+        call_sid = "call_latency"
+        now = time.monotonic()
+
+        manager.stream_to_call[stream_sid] = call_sid
+        mock_streamer = AsyncMock()
+        mock_streamer.stream_sid = stream_sid
+        mock_streamer.last_audio_sent_at = now + 0.040
+        manager.streamers[call_sid] = mock_streamer
+        manager.is_responding[stream_sid] = True
+        manager.interrupt_events[stream_sid] = asyncio.Event()
+        before = manager.barge_ins_total
+
+        await _handle_interrupt(AsyncMock(), stream_sid, speech_started_at=now)
+        await asyncio.sleep(0.08)
+
+        assert manager.barge_ins_total == before + 1
+        assert abs(manager.barge_in_latencies_ms[-1] - 40.0) < 1.0
+
+        # Cleanup
+        manager.stream_to_call.pop(stream_sid, None)
+        manager.streamers.pop(call_sid, None)
+        manager.is_responding.pop(stream_sid, None)
+        manager.interrupt_events.pop(stream_sid, None)
+
     @pytest.mark.asyncio
     async def test_interrupt_sends_twilio_clear(self):
         """Twilio 'clear' message is sent on interrupt."""
@@ -164,7 +242,7 @@ class TestHandleInterrupt:
         ]
         manager.conversations[stream_sid].get_turn_count.return_value = 2
 
-        async def mock_generate(messages):
+        async def mock_generate(messages, **kwargs):
             yield "New response!"
 
         mock_llm = AsyncMock()
@@ -200,7 +278,7 @@ class TestHandleInterrupt:
         manager.stream_to_call[stream_sid] = call_sid
         manager.streamers[call_sid] = None
 
-        async def slow_generate(messages):
+        async def slow_generate(messages, **kwargs):
             yield "Hello"
             yield " there"
             await asyncio.sleep(10)  # Will be cancelled here
@@ -232,3 +310,164 @@ class TestHandleInterrupt:
         manager.is_responding.pop(stream_sid, None)
         manager.response_tasks.pop(stream_sid, None)
         manager.llm_client = None
+
+
+class TestTurnCoalescing:
+    """A turn arriving before the previous response played merges into it."""
+
+    def _turn_end(self, stream_sid):
+        """VAD reporting turn end, and a captured utterance for it."""
+        import numpy as np
+        from src.audio.buffers import UtteranceCapture
+        from src.twilio.handlers import manager
+
+        mock_vad = MagicMock()
+        mock_vad.process_chunk.return_value = {
+            "is_speech": False,
+            "turn_complete": True,
+            "speech_probability": 0.1,
+            "silence_duration_ms": 600,
+            "speech_duration_ms": 800,
+            "speech_start": False,
+            "speech_aborted": False,
+            "onset_ms": 0,
+        }
+        mock_vad.sampling_rate = 8000
+        mock_vad.accum_buffer = np.array([], dtype=np.int16)
+        manager.vad_detectors[stream_sid] = mock_vad
+
+        capture = UtteranceCapture()
+        capture.start(np.full(8000, 3000, dtype=np.int16))
+        manager.speech_buffers[stream_sid] = capture
+
+        import base64
+        payload = base64.b64encode(b"\x00" * 160).decode()
+        return {"media": {"payload": payload}, "streamSid": stream_sid}
+
+    def _cleanup(self, stream_sid, call_sid):
+        from src.twilio.handlers import manager
+        for d in (manager.vad_detectors, manager.speech_buffers, manager.conversations,
+                  manager.stream_to_call, manager.is_responding, manager.response_tasks,
+                  manager.response_audio_marks, manager.language_locks):
+            d.pop(stream_sid, None)
+        manager.streamers.pop(call_sid, None)
+        manager.llm_client = None
+        manager.stt_router = None
+
+    async def _pending_response(self, stream_sid, call_sid):
+        """Start a real response whose LLM is still thinking."""
+        from src.audio.buffers import AudioStreamer
+        from src.twilio.handlers import _generate_response, manager
+
+        async def slow_generate(messages, **kwargs):
+            await asyncio.sleep(10)
+            yield "Sure."
+
+        manager.llm_client = MagicMock()
+        manager.llm_client.generate_streaming = slow_generate
+        manager.stream_to_call[stream_sid] = call_sid
+        manager.streamers[call_sid] = AudioStreamer(AsyncMock(), stream_sid)  # not started
+        manager.get_conversation(stream_sid).add_user_message("I'd like to book a table")
+        manager.response_audio_marks[stream_sid] = 0
+
+        task = asyncio.create_task(_generate_response(stream_sid, "I'd like to book a table"))
+        manager.response_tasks[stream_sid] = task
+        await asyncio.sleep(0.01)
+        return task
+
+    @pytest.mark.asyncio
+    async def test_unplayed_response_is_coalesced(self):
+        from src.config import settings
+        from src.twilio.handlers import manager, handle_media
+
+        stream_sid, call_sid = "test_coalesce", "call_coalesce"
+        first = await self._pending_response(stream_sid, call_sid)
+        data = self._turn_end(stream_sid)
+        manager.stt_router = MagicMock()
+        manager.stt_router.transcribe_utterance.return_value = {
+            "text": "for four people", "decode_ms": 1.0, "duration": 1.0,
+            "profile": "turn_final_fast", "model": "fast", "escalated": False,
+        }
+        coalesced = manager.coalesced_turns_total
+
+        with patch.object(settings, "stt_filter_enabled", False), \
+             patch("src.twilio.handlers.asyncio.to_thread", side_effect=_fake_to_thread), \
+             patch("src.twilio.handlers._generate_response", new_callable=AsyncMock) as mock_generate:
+            await handle_media(AsyncMock(), data)
+            await first
+
+        history = manager.get_conversation(stream_sid).history
+        assert history == [{"role": "user", "content": "I'd like to book a table for four people"}]
+        mock_generate.assert_called_once_with(stream_sid, "I'd like to book a table for four people", ANY)
+        assert manager.coalesced_turns_total == coalesced + 1
+
+        self._cleanup(stream_sid, call_sid)
+
+    @pytest.mark.asyncio
+    async def test_played_response_is_not_coalesced(self):
+        from src.config import settings
+        from src.twilio.handlers import manager, handle_media
+
+        stream_sid, call_sid = "test_no_coalesce", "call_no_coalesce"
+        first = await self._pending_response(stream_sid, call_sid)
+        manager.streamers[call_sid].audio_frames_sent = 5  # caller heard the reply
+        data = self._turn_end(stream_sid)
+        manager.stt_router = MagicMock()
+        manager.stt_router.transcribe_utterance.return_value = {
+            "text": "and a high chair", "decode_ms": 1.0, "duration": 1.0,
+            "profile": "turn_final_fast", "model": "fast", "escalated": False,
+        }
+
+        with patch.object(settings, "stt_filter_enabled", False), \
+             patch("src.twilio.handlers.asyncio.to_thread", side_effect=_fake_to_thread), \
+             patch("src.twilio.handlers._generate_response", new_callable=AsyncMock) as mock_generate:
+            await handle_media(AsyncMock(), data)
+
+        # Not coalesced, but not left streaming next to the new response
+        # either: interrupted first (it had produced no text to keep)
+        assert first.done()
+        mock_generate.assert_called_once_with(
+            stream_sid, "I'd like to book a table and a high chair", ANY
+        )
+        assert manager.response_tasks[stream_sid] is not first
+
+        self._cleanup(stream_sid, call_sid)
+
+    @pytest.mark.asyncio
+    async def test_coalesced_cancel_saves_no_partial(self):
+        """Text sent to TTS but never played is not saved as said."""
+        from src.twilio.handlers import _generate_response, _COALESCED, manager
+
+        stream_sid = "test_coalesce_partial"
+        conversation = MagicMock()
+        conversation.get_messages.return_value = [{"role": "user", "content": "hi"}]
+        manager.conversations[stream_sid] = conversation
+
+        async def generate(messages, **kwargs):
+            yield "Hello!"
+            await asyncio.sleep(10)
+            yield " More"
+
+        manager.llm_client = MagicMock()
+        manager.llm_client.generate_streaming = generate
+        streamer = MagicMock()
+        streamer.queue_audio = AsyncMock()
+        manager.stream_to_call[stream_sid] = "call_coalesce_partial"
+        manager.streamers["call_coalesce_partial"] = streamer
+        tts = MagicMock()
+
+        async def fake_tts(text):
+            yield "AAAA"
+        tts.generate = fake_tts
+        manager.tts_stream = tts
+
+        task = asyncio.create_task(_generate_response(stream_sid, "hi"))
+        manager.response_tasks[stream_sid] = task
+        await asyncio.sleep(0.01)
+        task.cancel(_COALESCED)
+        await task
+
+        conversation.add_assistant_message_partial.assert_not_called()
+
+        manager.tts_stream = None
+        self._cleanup(stream_sid, "call_coalesce_partial")
@@ -0,0 +1,47 @@
+"""Tests for per-call language lock-in (src/stt/language.py)."""
+
+from src.stt.language import LanguageLock
+
+
+def _result(language="es", probability=0.95, duration=2.0, avg_logprob=-0.3):
+    return {"language": language, "language_probability": probability,
+            "duration": duration, "avg_logprob": avg_logprob}
+
+
+def test_locks_on_first_reliable_detection():
+    """Short or unsure detections don't lock; the first reliable one does"""
+    lock = LanguageLock(min_detect_s=1.5, lock_probability=0.8)
+    assert lock.language_for_turn() == "auto"
+
+    lock.observe(_result(duration=0.6))          # "sí" — too short
+    lock.observe(_result(probability=0.5))       # unsure
+    assert lock.language_for_turn() == "auto"
+
+    lock.observe(_result())
+    assert lock.language_for_turn() == "es"
+    lock.observe(_result())
+    assert lock.detect_turns == 3
+    assert lock.pinned_turns == 1
+
+
+def test_unlocks_after_consecutive_unsure_turns():
+    """Pinned decodes that keep failing trigger re-detection"""
+    lock = LanguageLock(redetect_logprob=-1.0, redetect_after=2)
+    lock.observe(_result())
+
+    lock.observe(_result(avg_logprob=-1.5))
+    lock.observe(_result(avg_logprob=-0.2))      # streak broken
+    lock.observe(_result(avg_logprob=-1.5))
+    assert lock.language_for_turn() == "es"
+
+    lock.observe(_result(avg_logprob=-1.5))
+    assert lock.language_for_turn() == "auto"
+
+
+def test_fixed_language_never_detects():
+    """STT_LANGUAGE=en pins English for the whole call"""
+    lock = LanguageLock(default="en")
+    for _ in range(3):
+        lock.observe(_result(language="es", avg_logprob=-2.0))
+    assert lock.language_for_turn() == "en"
+    assert lock.detect_turns == 0
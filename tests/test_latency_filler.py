@@ -0,0 +1,209 @@
+"""Tests for latency-masking fillers (src/tts/filler.py and _generate_response)."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.llm.conversation import ConversationManager
+from src.tts.filler import LatencyFiller
+
+FILLER = ["mm-0", "mm-1", "mm-2"]
+
+
+@pytest.mark.asyncio
+async def test_filler_not_started_is_dropped():
+    queued = []
+
+    async def queue_audio(payload):
+        queued.append(payload)
+
+    filler = LatencyFiller(queue_audio, FILLER, delay_s=0.2)
+    filler.start()
+    await asyncio.sleep(0.01)
+    await filler.settle()
+    await asyncio.sleep(0.25)
+
+    assert queued == [] and not filler.played
+
+
+@pytest.mark.asyncio
+async def test_started_filler_is_queued_whole_before_settle_returns():
+    queued = []
+
+    async def queue_audio(payload):
+        await asyncio.sleep(0.01)  # backpressure from a full queue
+        queued.append(payload)
+
+    filler = LatencyFiller(queue_audio, FILLER, delay_s=0.01)
+    filler.start()
+    await asyncio.sleep(0.02)
+    await filler.settle()
+
+    assert queued == FILLER and filler.played
+
+
+class TestResponseFiller:
+    """_generate_response plays a filler when its first audio is late."""
+
+    def _setup(self, stream_sid, call_sid, llm_delay_s):
+        from src.twilio.handlers import manager
+        conversation = ConversationManager()
+        conversation.add_user_message("What's my balance?")
+        manager.conversations[stream_sid] = conversation
+        manager.stream_to_call[stream_sid] = call_sid
+        manager.response_audio_marks[stream_sid] = 0
+
+        streamer = MagicMock()
+        streamer.audio_frames_sent = 0
+        streamer.queued = []
+
+        async def queue_audio(payload):
+            streamer.queued.append(payload)
+
+        streamer.queue_audio = queue_audio
+
+        async def clear_queue():
+            streamer.queued.clear()
+
+        streamer.clear_queue = clear_queue
+        manager.streamers[call_sid] = streamer
+
+        async def generate_streaming(messages, **kwargs):
+            await asyncio.sleep(llm_delay_s)
+            yield "Your balance is ten dollars."
+
+        async def synthesize(text):
+            yield f"audio<{text}>"
+
+        llm = MagicMock()
+        llm.generate_streaming = MagicMock(side_effect=generate_streaming)
+        tts = MagicMock()
+        tts.generate = MagicMock(side_effect=synthesize)
+        tts.precomputed = lambda text: list(FILLER) if text == "Let me check." else None
+        manager.llm_client = llm
+        manager.tts_stream = tts
+        return streamer
+
+    def _cleanup(self, stream_sid, call_sid):
+        from src.twilio.handlers import manager
+        for d in (manager.conversations, manager.stream_to_call, manager.is_responding,
+                  manager.response_tasks, manager.response_audio_marks, manager.latency_fillers):
+            d.pop(stream_sid, None)
+        manager.streamers.pop(call_sid, None)
+        manager.llm_client = None
+        manager.tts_stream = None
+
+    def _settings(self):
+        return patch.multiple(
+            "src.twilio.handlers.settings",
+            latency_filler_enabled=True,
+            latency_filler_delay_ms=50,
+            latency_filler_phrases="Mm-hmm.|Let me check.",
+            response_cache_enabled=False,
+        )
+
+    @pytest.mark.asyncio
+    async def test_slow_response_gets_filler_then_answer(self):
+        from src.twilio.handlers import _generate_response, manager
+        streamer = self._setup("filler-1", "call-f1", llm_delay_s=0.2)
+        fillers = manager.latency_fillers_total
+
+        with self._settings():
+            await _generate_response("filler-1", "What's my balance?")
+
+        # "Mm-hmm." has no precomputed audio: the next phrase is used
+        assert streamer.queued == FILLER + ["audio<Your balance is ten dollars.>"]
+        assert manager.latency_fillers_total == fillers + 1
+        # Filler frames do not count as the response's
+        assert manager.response_audio_marks["filler-1"] == len(FILLER)
+        assert manager.perceived_latencies_ms[-1] < 100
+        assert manager.response_latencies_ms[-1] >= 200
+        assert "filler-1" not in manager.latency_fillers
+        self._cleanup("filler-1", "call-f1")
+
+    @pytest.mark.asyncio
+    async def test_fast_response_plays_no_filler(self):
+        from src.twilio.handlers import _generate_response, manager
+        streamer = self._setup("filler-2", "call-f2", llm_delay_s=0.0)
+
+        with self._settings():
+            await _generate_response("filler-2", "What's my balance?")
+            await asyncio.sleep(0.1)  # past the filler delay
+
+        assert streamer.queued == ["audio<Your balance is ten dollars.>"]
+        assert manager.perceived_latencies_ms[-1] == manager.response_latencies_ms[-1]
+        self._cleanup("filler-2", "call-f2")
+
+    @pytest.mark.asyncio
+    async def test_caller_continuing_after_filler_still_coalesces(self):
+        from src.twilio.handlers import _coalesce_turn, _generate_response, manager
+        streamer = self._setup("filler-3", "call-f3", llm_delay_s=1.0)
+
+        with self._settings():
+            task = asyncio.create_task(_generate_response("filler-3", "What's my balance?"))
+            manager.response_tasks["filler-3"] = task
+            await asyncio.sleep(0.1)
+            streamer.audio_frames_sent = len(FILLER)  # the filler was heard
+
+            assert await _coalesce_turn("filler-3")
+            await asyncio.sleep(0)
+
+        assert streamer.queued == []
+        assert task.done() and "filler-3" not in manager.latency_fillers
+        self._cleanup("filler-3", "call-f3")
+
+    @pytest.mark.asyncio
+    async def test_barge_in_stops_filler(self):
+        from src.twilio.handlers import _generate_response, _handle_interrupt, manager
+        streamer = self._setup("filler-4", "call-f4", llm_delay_s=1.0)
+        gate = asyncio.Event()
+
+        async def slow_queue_audio(payload):
+            streamer.queued.append(payload)
+            await gate.wait()  # queue full after the first frame
+
+        streamer.queue_audio = slow_queue_audio
+        websocket = MagicMock()
+        websocket.send_text = MagicMock(side_effect=lambda msg: asyncio.sleep(0))
+
+        with self._settings():
+            task = asyncio.create_task(_generate_response("filler-4", "What's my balance?"))
+            manager.response_tasks["filler-4"] = task
+            await asyncio.sleep(0.1)
+            assert streamer.queued == FILLER[:1]
+
+            await _handle_interrupt(websocket, "filler-4")
+            gate.set()
+            await asyncio.sleep(0.05)
+
+        assert streamer.queued == []
+        assert task.done()
+        self._cleanup("filler-4", "call-f4")
+
+
+@pytest.mark.asyncio
+async def test_stop_cancels_filler_and_background_work():
+    from src.twilio.handlers import handle_stop, manager
+    queued = []
+
+    async def queue_audio(payload):
+        queued.append(payload)
+
+    filler = LatencyFiller(queue_audio, FILLER, delay_s=0.05)
+    filler.start()
+    manager.latency_fillers["filler-stop"] = filler
+    stt = asyncio.create_task(asyncio.sleep(10))
+    prefill = asyncio.create_task(asyncio.sleep(10))
+    manager.stt_tasks["filler-stop"] = stt
+    manager.prefill_tasks["filler-stop"] = prefill
+
+    with patch("src.twilio.handlers.state_manager") as state:
+        state.on_stop = AsyncMock()
+        await handle_stop(MagicMock(), {"stop": {"streamSid": "filler-stop"}})
+    await asyncio.sleep(0.1)
+
+    assert queued == [] and not filler.played
+    assert stt.cancelled() and prefill.cancelled()
+    assert "filler-stop" not in manager.latency_fillers
+    assert "filler-stop" not in manager.stt_tasks and "filler-stop" not in manager.prefill_tasks
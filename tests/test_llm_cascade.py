@@ -0,0 +1,193 @@
+"""Tests for the two-tier LLM cascade (src/llm/cascade.py and _generate_response)."""
+
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.llm.cascade import OPENER_INSTRUCTION, LLMCascade, ReadAhead, trim_opener
+from src.llm.client import LLMClient
+from src.llm.conversation import ConversationManager
+from tests.fake_vllm import FakeVLLM, render_prompt
+
+OPENER = "Sure, let me check that for you."
+ANSWER = "Your balance is ten dollars."
+QUESTION = "What's the balance on my account?"
+
+
+def test_trim_opener():
+    assert trim_opener("Sure, let me check. Your balance is") == "Sure, let me check."
+    assert trim_opener("Okay, so about that") == "Okay,"
+    assert trim_opener("Okay so about that") == ""  # may stop mid-phrase
+    assert trim_opener("Well, " + "very " * 20 + "long.") == ""
+
+
+def test_continue_final_message_renders_open_assistant_turn():
+    messages = [{"role": "user", "content": "Hi"}, {"role": "assistant", "content": "Sure,"}]
+    assert render_prompt(messages, continue_final=True) == "<user>Hi</user><assistant>Sure,"
+
+
+def test_routing_rules():
+    large = LLMClient(base_url="http://large/v1")
+    cascade = LLMCascade(MagicMock(), min_words=3, min_ttft_s=0.25)
+    turn = [{"role": "system", "content": "Be brief."}, {"role": "user", "content": QUESTION}]
+
+    assert cascade.should_route(turn, large)  # no TTFT samples yet: assume slow
+    assert not cascade.should_route(turn[:1] + [{"role": "user", "content": "Yes."}], large)
+    large.ttft_tracker.samples.extend([0.1] * 50)
+    assert not cascade.should_route(turn, large)
+    large.ttft_tracker.samples.extend([0.6] * 100)
+    assert cascade.should_route(turn, large)
+    assert cascade.get_stats() == {
+        "routed": 2, "openers": 0, "fallbacks": 0, "skipped_short": 1, "skipped_fast": 1,
+        "replaced": 0, "wasted_request_rate": 0.0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_cancelled_read_ahead_ends_its_stream():
+    """A consumer waiting on a cancelled ReadAhead sees the end, not a hang"""
+    async def tokens():
+        yield "Sure"
+        await asyncio.sleep(10)
+        yield " thing"
+
+    stream = ReadAhead(tokens())
+    assert await stream.__anext__() == "Sure"
+    waiting = asyncio.create_task(stream.__anext__())
+    await asyncio.sleep(0)
+    stream.cancel()
+    with pytest.raises(StopAsyncIteration):
+        await asyncio.wait_for(waiting, 1.0)
+
+
+class TestCascadeResponse:
+    """_generate_response with a small and a large stand-in vLLM server."""
+
+    def _setup(self, stream_sid, call_sid, small, large, timeout_s=0.5, tts_delay_s=0.0):
+        from src.twilio.handlers import manager
+        conversation = ConversationManager(system_prompt="You are a bank's phone assistant.")
+        conversation.add_user_message(QUESTION)
+        manager.conversations[stream_sid] = conversation
+        manager.stream_to_call[stream_sid] = call_sid
+
+        streamer = MagicMock()
+        streamer.queued = []
+
+        async def queue_audio(payload):
+            streamer.queued.append((time.monotonic(), payload))
+
+        streamer.queue_audio = queue_audio
+        manager.streamers[call_sid] = streamer
+
+        async def synthesize(text):
+            await asyncio.sleep(tts_delay_s)
+            yield f"audio<{text}>"
+
+        tts = MagicMock()
+        tts.generate = MagicMock(side_effect=synthesize)
+        manager.tts_stream = tts
+        manager.llm_client = LLMClient(base_url="http://large/v1", model="large",
+                                       http_client=large.http_client())
+        manager.llm_cascade = LLMCascade(
+            LLMClient(base_url="http://small/v1", model="small", max_tokens=16,
+                      http_client=small.http_client()),
+            timeout_s=timeout_s,
+        )
+        return conversation, streamer
+
+    def _cleanup(self, stream_sid, call_sid):
+        from src.twilio.handlers import manager
+        for d in (manager.conversations, manager.stream_to_call, manager.is_responding,
+                  manager.response_tasks):
+            d.pop(stream_sid, None)
+        manager.streamers.pop(call_sid, None)
+        manager.llm_client = None
+        manager.llm_cascade = None
+        manager.tts_stream = None
+
+    def _settings(self):
+        return patch.multiple("src.twilio.handlers.settings",
+                              response_cache_enabled=False, latency_filler_enabled=False)
+
+    @pytest.mark.asyncio
+    async def test_opener_spoken_first_and_continued_by_large_model(self):
+        from src.twilio.handlers import _generate_response, manager
+        small = FakeVLLM(delay_s=0.02, reply=f"{OPENER} I think it is fine.")
+        large = FakeVLLM(delay_s=0.8, reply=ANSWER)
+        conversation, streamer = self._setup("cascade-1", "call-k1", small, large, tts_delay_s=0.2)
+        large_requests_seen = []
+
+        async def queue_audio(payload):
+            streamer.queued.append((time.monotonic(), payload))
+            large_requests_seen.append(len(large.requests))
+
+        streamer.queue_audio = queue_audio
+
+        start = time.monotonic()
+        with self._settings():
+            await _generate_response("cascade-1", QUESTION)
+
+        assert [p for _, p in streamer.queued] == [f"audio<{OPENER}>", f"audio<{ANSWER}>"]
+        # Opener audio well before the large model's first token (0.8s)
+        assert streamer.queued[0][0] - start < 0.6
+        # The large model was already working while the opener was synthesized:
+        # the plain turn from the start, then the continuation replacing it
+        assert large_requests_seen[0] == 2
+        assert not large.requests[0]["continue_final_message"]
+        assert OPENER_INSTRUCTION in small.requests[0]["messages"][0]["content"]
+        continuation = large.requests[1]
+        assert continuation["continue_final_message"]
+        assert continuation["messages"][-1] == {"role": "assistant", "content": OPENER}
+        assert manager.llm_cascade.get_stats()["wasted_request_rate"] == 1.0
+        assert conversation.get_messages()[-1] == {
+            "role": "assistant", "content": f"{OPENER} {ANSWER}"
+        }
+        self._cleanup("cascade-1", "call-k1")
+
+    @pytest.mark.asyncio
+    async def test_late_opener_falls_back_to_large_model(self):
+        from src.twilio.handlers import _generate_response, manager
+        small = FakeVLLM(delay_s=1.0, reply=OPENER)
+        large = FakeVLLM(delay_s=0.3, reply=ANSWER)
+        conversation, streamer = self._setup("cascade-2", "call-k2", small, large, timeout_s=0.3)
+
+        start = time.monotonic()
+        with self._settings():
+            await _generate_response("cascade-2", QUESTION)
+
+        assert [p for _, p in streamer.queued] == [f"audio<{ANSWER}>"]
+        # The large model ran while the opener was awaited, not after it
+        assert streamer.queued[0][0] - start < 0.5
+        assert len(large.requests) == 1
+        assert not large.requests[0]["continue_final_message"]
+        assert manager.llm_cascade.fallbacks == 1
+        assert manager.llm_cascade.replaced == 0
+        await asyncio.sleep(0)
+        assert small.in_flight == 0  # the late opener request was cancelled
+        self._cleanup("cascade-2", "call-k2")
+
+    @pytest.mark.asyncio
+    async def test_barge_in_after_opener_cancels_large_model(self):
+        from src.twilio.handlers import _generate_response, manager
+        small = FakeVLLM(delay_s=0.01, reply=OPENER)
+        large = FakeVLLM(delay_s=1.0, reply=ANSWER)
+        conversation, streamer = self._setup("cascade-3", "call-k3", small, large)
+
+        with self._settings():
+            task = asyncio.create_task(_generate_response("cascade-3", QUESTION))
+            manager.response_tasks["cascade-3"] = task
+            await asyncio.sleep(0.2)
+            assert large.in_flight == 1
+            task.cancel()
+            await task
+            await asyncio.sleep(0.01)
+
+        # The plain-turn request the opener replaced, and the continuation
+        assert large.in_flight == 0 and large.cancelled == 2
+        assert conversation.get_messages()[-1] == {
+            "role": "assistant", "content": f"{OPENER} [interrupted]"
+        }
+        assert manager.llm_client.scheduler.running == 0
+        self._cleanup("cascade-3", "call-k3")
@@ -5,9 +5,15 @@ Tests API contract and configuration — does NOT require a running vLLM server.
 Uses mocking to verify client behavior without network calls.
 """
 
+import asyncio
+import time
+
+import httpx
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from src.llm.client import LLMClient
+from src.llm.conversation import ConversationManager
+from tests.fake_vllm import FakeVLLM
 
 
 def test_llm_client_initialization():
@@ -82,3 +88,125 @@ async def test_generate_returns_complete_response():
 
         assert result == "Hello world"
         mock_create.assert_called_once()
+
+
+def _fake_client(fake):
+    return LLMClient(base_url="http://vllm.test/v1", api_key="x", model="test-model",
+                     http_client=fake.http_client())
+
+
+async def _ttft(client, messages):
+    """Seconds until the first streamed token."""
+    start = time.perf_counter()
+    async for _ in client.generate_streaming(messages):
+        return time.perf_counter() - start
+
+
+@pytest.mark.asyncio
+async def test_warm_prefix_sends_one_token_request():
+    """Test: warm_prefix() prefills with max_tokens=1 and no streaming"""
+    fake = FakeVLLM()
+    client = _fake_client(fake)
+
+    await client.warm_prefix(ConversationManager().get_warmup_messages())
+
+    assert fake.requests[0]["max_tokens"] == 1
+    assert not fake.requests[0]["stream"]
+    assert client.warmups == 1 and client.warmup_failures == 0
+
+
+@pytest.mark.asyncio
+async def test_warm_prefix_never_raises():
+    """Test: a failed warm-up is counted, not raised"""
+    def refuse(request):
+        raise httpx.ConnectError("refused")
+
+    client = LLMClient(base_url="http://vllm.test/v1", api_key="x",
+                       http_client=httpx.AsyncClient(transport=httpx.MockTransport(refuse)))
+    client.client = client.client.with_options(max_retries=0)
+
+    await client.warm_prefix([{"role": "user", "content": "Hi"}])
+    assert client.warmup_failures == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_warm_prefix_releases_its_endpoint():
+    """Test: a warm-up cancelled at call end leaves no request in flight"""
+    client = _fake_client(FakeVLLM(delay_s=1.0))
+
+    task = asyncio.create_task(client.warm_prefix([{"role": "user", "content": "Hi"}], "call-1"))
+    await asyncio.sleep(0.05)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert client.pool.endpoints[0].in_flight == 0
+    assert client.scheduler.running == 0
+
+
+@pytest.mark.asyncio
+async def test_prefix_warming_cuts_first_turn_ttft():
+    """Test: after warming, the first turn only prefills the caller's words"""
+    first_turn = ConversationManager()
+    first_turn.add_user_message("Hi, I'd like to book a table for tonight.")
+
+    cold = FakeVLLM()
+    cold_ttft = await _ttft(_fake_client(cold), first_turn.get_messages())
+
+    warm = FakeVLLM()
+    client = _fake_client(warm)
+    await client.warm_prefix(ConversationManager().get_warmup_messages())
+    warm_ttft = await _ttft(client, first_turn.get_messages())
+
+    cold_prefill = cold.requests[-1]["prefill_chars"]
+    warm_prefill = warm.requests[-1]["prefill_chars"]
+    # Only the tail after the last cached block is prefilled
+    assert cold_prefill == cold.requests[-1]["prompt_chars"]
+    assert warm_prefill < cold_prefill / 3
+    assert warm_ttft < cold_ttft
+
+
+@pytest.mark.asyncio
+async def test_call_start_warms_the_calls_prefix():
+    """Test: ConnectionManager.warm_llm_prefix() prefills the call's own prompt"""
+    from src.twilio.handlers import ConnectionManager
+
+    fake = FakeVLLM()
+    mgr = ConnectionManager()
+    mgr.llm_client = _fake_client(fake)
+
+    mgr.warm_llm_prefix("stream_warm")
+    await asyncio.gather(*mgr.background_tasks)
+
+    assert fake.requests[0]["messages"] == mgr.get_conversation("stream_warm").get_warmup_messages()
+    assert not mgr.background_tasks
+
+
+@pytest.mark.asyncio
+async def test_partial_prefill_cuts_long_turn_ttft():
+    """Test: prefilling committed words leaves only the turn's tail for the final request"""
+    conversation = ConversationManager()
+    conversation.add_user_message("Hi there")
+    conversation.add_assistant_message("Hello! How can I help you today?")
+    committed = (
+        "So I booked a flight last week for my parents, they are flying in from "
+        "Lisbon on the twelfth, and the airline changed the departure time twice "
+        "already, and now the connection in Frankfurt is only forty minutes"
+    )
+    final_text = committed + " and I want to know whether I can rebook them."
+
+    final = ConversationManager()
+    final.history = [dict(m) for m in conversation.history]
+    final.add_user_message(final_text)
+
+    cold = FakeVLLM()
+    await _fake_client(cold).warm_prefix(conversation.get_warmup_messages())
+    cold_ttft = await _ttft(_fake_client(cold), final.get_messages())
+
+    warm = FakeVLLM()
+    client = _fake_client(warm)
+    await client.warm_prefix(conversation.get_warmup_messages())
+    await client.warm_prefix(conversation.get_partial_messages(committed))
+    warm_ttft = await _ttft(client, final.get_messages())
+
+    assert warm.requests[-1]["prefill_chars"] < cold.requests[-1]["prefill_chars"] / 2
+    assert warm_ttft < cold_ttft
@@ -0,0 +1,200 @@
+"""Tests for hedged LLM streaming (src/llm/hedging.py and LLMClient)."""
+
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+from src.llm.client import LLMClient
+from src.llm.hedging import HedgeBudget, TTFTTracker
+from src.llm.pool import Endpoint, EndpointPool
+from tests.fake_vllm import FakeVLLM, cluster_http_client
+
+MESSAGES = [{"role": "system", "content": "Be brief."}, {"role": "user", "content": "Hi"}]
+
+
+def _client(servers, hedging=True, delay_s=0.05):
+    client = LLMClient(
+        base_urls=[f"http://{host}/v1" for host in servers],
+        http_client=cluster_http_client(servers),
+    )
+    for endpoint in client.pool.endpoints:
+        endpoint.client = endpoint.client.with_options(max_retries=0)
+    client.hedging_enabled = hedging
+    client.ttft_tracker.default_s = delay_s
+    client.ttft_tracker.min_s = 0.02
+    return client
+
+
+async def _ttft(client, call_id=None):
+    start = time.monotonic()
+    stream = client.generate_streaming(MESSAGES, call_id=call_id)
+    first = await stream.__anext__()
+    ttft = time.monotonic() - start
+    rest = [token async for token in stream]
+    return ttft, first + "".join(rest)
+
+
+def test_tracker_threshold_adapts_and_clamps():
+    tracker = TTFTTracker(percentile=95, min_samples=10, default_s=1.0, min_s=0.1, max_s=0.5)
+    assert tracker.hedge_delay() == 1.0  # not enough samples yet
+
+    for _ in range(100):
+        tracker.add(0.2)
+    assert tracker.hedge_delay() == pytest.approx(0.2)
+
+    for _ in range(500):
+        tracker.add(0.01)
+    assert tracker.hedge_delay() == 0.1  # clamped up
+
+    tracker.samples.extend([5.0] * 100)
+    assert tracker.hedge_delay() == 0.5  # clamped down
+
+
+def test_budget_caps_hedge_ratio():
+    budget = HedgeBudget(ratio=0.05, burst=2)
+    spent = 0
+    for _ in range(1000):
+        budget.earn()
+        spent += budget.try_spend()
+    assert spent <= 0.05 * 1000 + 2
+
+
+def test_choose_other_skips_excluded_and_ejected():
+    pool = EndpointPool([Endpoint(f"http://r{i}/v1", client=None) for i in range(3)], max_failures=1)
+    a, b, c = pool.endpoints
+    pool.begin(b)
+    pool.end(b, error=True)  # ejected
+    assert pool.choose_other(a) is c
+    pool.begin(c)
+    pool.end(c, error=True)
+    assert pool.choose_other(a) is None
+
+
+@pytest.mark.asyncio
+async def test_hedge_wins_over_stuck_replica():
+    """The slow primary is cancelled once the hedge produces a token"""
+    servers = {"stuck": FakeVLLM(delay_s=1.0), "fast": FakeVLLM(delay_s=0.005)}
+    client = _client(servers, delay_s=0.05)
+    # Pin the call to the stuck replica
+    client.pool.sticky["call-1"] = client.pool.endpoints[0]
+
+    ttft, text = await _ttft(client, call_id="call-1")
+
+    assert text == "Sure, I can help with that."
+    assert ttft < 0.3
+    assert client.hedges == 1 and client.hedge_wins == 1
+    assert servers["stuck"].cancelled == 1
+    assert all(e.in_flight == 0 for e in client.pool.endpoints)
+
+
+@pytest.mark.asyncio
+async def test_hedge_holds_a_slot_of_its_own():
+    """A hedge is skipped when no slot is free, and releases its slot after"""
+    servers = {"stuck": FakeVLLM(delay_s=0.2), "fast": FakeVLLM(delay_s=0.005)}
+    client = _client(servers, delay_s=0.02)
+    client.scheduler.max_concurrent = 1
+    client.pool.sticky["call-1"] = client.pool.endpoints[0]
+
+    await _ttft(client, call_id="call-1")
+    assert client.hedges == 0 and client.hedges_no_slot == 1
+    assert len(servers["fast"].requests) == 0
+
+    client.scheduler.max_concurrent = 2
+    await _ttft(client, call_id="call-1")
+    assert client.hedges == 1
+    assert client.scheduler.running == 0
+
+
+def test_full_backup_is_not_hedged_to():
+    pool = EndpointPool([Endpoint(f"http://r{i}/v1", client=None) for i in range(2)],
+                        max_in_flight=1)
+    a, b = pool.endpoints
+    assert pool.choose_other(a) is b
+    pool.begin(b)
+    assert pool.choose_other(a) is None
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged():
+    servers = {"a": FakeVLLM(delay_s=0.001), "b": FakeVLLM(delay_s=0.001)}
+    client = _client(servers, delay_s=0.2)
+    for _ in range(5):
+        await _ttft(client)
+    assert client.hedges == 0
+    assert sum(len(s.requests) for s in servers.values()) == 5
+
+
+@pytest.mark.asyncio
+async def test_failed_primary_falls_back_to_hedge():
+    """A primary that errors after the hedge fired does not fail the turn"""
+    servers = {"down": FakeVLLM(fail=True, delay_s=0.05), "up": FakeVLLM(delay_s=0.1)}
+    client = _client(servers, delay_s=0.02)
+    client.pool.sticky["call-1"] = client.pool.endpoints[0]
+
+    _, text = await _ttft(client, call_id="call-1")
+
+    assert text == "Sure, I can help with that."
+    assert client.pool.endpoints[0].failures == 1
+
+
+@pytest.mark.asyncio
+async def test_single_endpoint_never_hedges():
+    server = FakeVLLM(delay_s=0.1)
+    client = _client({"only": server}, delay_s=0.01)
+    await _ttft(client)
+    assert client.hedges == 0
+    assert len(server.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_consumer_abort_cancels_both_attempts():
+    """Closing the stream (barge-in) leaves nothing in flight"""
+    servers = {"a": FakeVLLM(delay_s=1.0), "b": FakeVLLM(delay_s=1.0)}
+    client = _client(servers, delay_s=0.02)
+
+    async def consume():
+        async for _ in client.generate_streaming(MESSAGES):
+            pass
+
+    task = asyncio.create_task(consume())
+    await asyncio.sleep(0.1)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert client.hedges == 1
+    assert sum(s.cancelled for s in servers.values()) == 2
+    assert all(e.in_flight == 0 for e in client.pool.endpoints)
+
+
+@pytest.mark.asyncio
+async def test_p99_ttft_with_and_without_hedging():
+    """
+    Two replicas, 2% of requests stuck 400ms (seeded): hedging cuts p99 TTFT
+    while staying within the 5% hedge budget.
+    """
+    async def run(hedging):
+        servers = {
+            "r0": FakeVLLM(delay_s=0.005, tail_prob=0.02, tail_delay_s=0.4, seed=1),
+            "r1": FakeVLLM(delay_s=0.005, tail_prob=0.02, tail_delay_s=0.4, seed=2),
+        }
+        client = _client(servers, hedging=hedging, delay_s=0.05)
+        sem = asyncio.Semaphore(8)
+
+        async def one(i):
+            async with sem:
+                return (await _ttft(client, call_id=f"call-{i % 8}"))[0]
+
+        ttfts = await asyncio.gather(*(one(i) for i in range(300)))
+        return float(np.percentile(ttfts, 99)), client.hedges
+
+    p99_plain, _ = await run(hedging=False)
+    p99_hedged, hedges = await run(hedging=True)
+
+    print(f"p99 TTFT: {p99_plain * 1000:.0f} ms without hedging, "
+          f"{p99_hedged * 1000:.0f} ms with ({hedges} hedges / 300)")
+    assert p99_plain > 0.35
+    assert p99_hedged < p99_plain * 0.6
+    assert hedges <= 0.05 * 300 + 2
@@ -0,0 +1,127 @@
+"""Tests for the LLM client's HTTP connection pool (src/llm/http_pool.py)."""
+
+import asyncio
+import json
+
+import pytest
+import pytest_asyncio
+
+from src.llm.client import LLMClient
+from src.llm.http_pool import build_http_client
+
+MODELS = json.dumps({"object": "list", "data": [{"id": "fake", "object": "model", "created": 0, "owned_by": "x"}]})
+
+
+class KeepAliveServer:
+    """Minimal HTTP/1.1 server that keeps connections open and counts them."""
+
+    def __init__(self, delay_s: float = 0.0):
+        self.delay_s = delay_s
+        self.connections = 0
+        self.requests = 0
+        self.server = None
+
+    async def _serve(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.decode().split("\r\n"):
+                    if line.lower().startswith("content-length:"):
+                        length = int(line.split(":")[1])
+                if length:
+                    await reader.readexactly(length)
+                self.requests += 1
+                await asyncio.sleep(self.delay_s)
+                body = MODELS.encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\n"
+                    + f"content-length: {len(body)}\r\n\r\n".encode() + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/v1"
+
+    async def stop(self):
+        self.server.close()
+
+
+@pytest_asyncio.fixture
+async def server():
+    srv = KeepAliveServer()
+    srv.base_url = await srv.start()
+    yield srv
+    await srv.stop()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_opens_connections_that_turns_reuse(server):
+    client = LLMClient(base_url=server.base_url)
+
+    assert await client.warm_connections(count=3) == 3
+    assert server.connections == 3
+    assert client.get_connection_stats()["new_connections"] == 3
+
+    # Later requests (and keep-warm pings) ride the pooled connections
+    for _ in range(5):
+        await client.pool.endpoints[0].client.models.list()
+    await client.warm_connections(count=3)
+    assert server.connections == 3
+
+    stats = client.get_connection_stats()
+    assert stats["new_connections"] == 3
+    assert stats["in_use"] == 0 and stats["waiting"] == 0
+    assert stats["pings"] == 6 and stats["ping_failures"] == 0
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_limit_queues_requests():
+    """Beyond max_connections requests wait, and the waiting gauge shows it"""
+    srv = KeepAliveServer(delay_s=0.1)
+    url = await srv.start()
+    http_client, transport = build_http_client(max_connections=2, keepalive_expiry_s=60)
+
+    requests = [asyncio.create_task(http_client.get(f"{url}/models")) for _ in range(4)]
+    await asyncio.sleep(0.05)
+    assert transport.in_use == 2
+    assert transport.waiting == 2
+
+    await asyncio.gather(*requests)
+    assert transport.in_use == 0 and transport.waiting == 0
+    assert srv.connections == 2
+    await http_client.aclose()
+    await srv.stop()
+
+
+@pytest.mark.asyncio
+async def test_failed_pings_are_counted_not_raised():
+    client = LLMClient(base_url="http://127.0.0.1:9/v1")
+    for endpoint in client.pool.endpoints:
+        endpoint.client = endpoint.client.with_options(max_retries=0)
+
+    assert await client.warm_connections(count=2) == 0
+    stats = client.get_connection_stats()
+    assert stats["ping_failures"] == 2
+    assert stats["in_use"] == 0 and stats["waiting"] == 0
+    await client.close()
+
+
+def test_pool_sized_to_concurrent_calls(monkeypatch):
+    from src.config import settings
+    monkeypatch.setattr(settings, "max_concurrent_calls", 7)
+    monkeypatch.setattr(settings, "llm_connections_per_call", 3)
+    client = LLMClient(base_urls=["http://a/v1", "http://b/v1"])
+
+    assert len(client.transports) == 2
+    pool = client.transports[0]._transport._pool
+    assert pool._max_connections == 21
+    assert pool._max_keepalive_connections == 21
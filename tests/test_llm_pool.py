@@ -0,0 +1,206 @@
+"""Tests for multi-endpoint LLM routing (src/llm/pool.py)."""
+
+import asyncio
+
+import pytest
+
+from src.llm.client import LLMClient
+from src.llm.pool import Endpoint, EndpointPool
+from tests.fake_vllm import FakeVLLM, cluster_http_client
+
+MESSAGES = [{"role": "system", "content": "Be brief."}, {"role": "user", "content": "Hi"}]
+
+
+def _pool(n=3, **kwargs):
+    return EndpointPool([Endpoint(f"http://r{i}/v1", client=None) for i in range(n)], **kwargs)
+
+
+def test_least_outstanding_requests():
+    """New requests go to the endpoint with the fewest in flight"""
+    pool = _pool()
+    a = pool.choose()
+    pool.begin(a)
+    b = pool.choose()
+    pool.begin(b)
+    c = pool.choose()
+    assert len({a, b, c}) == 3
+
+    pool.end(b)
+    assert pool.choose() is b
+
+
+def test_calls_stick_to_their_endpoint():
+    """A call keeps its endpoint until it is much busier than the others"""
+    pool = _pool(n=2, sticky_slack=1)
+    first = pool.choose("call-1")
+    pool.begin(first)
+    assert pool.choose("call-1") is first  # 1 in flight vs 0: within slack
+
+    pool.begin(first)
+    moved = pool.choose("call-1")           # 2 vs 0: move
+    assert moved is not first
+    assert pool.choose("call-1") is moved   # and stick there
+
+    pool.forget("call-1")
+    assert "call-1" not in pool.sticky
+
+
+def test_call_leaves_a_full_replica():
+    """Stickiness never sends a request past the replica's cap"""
+    pool = _pool(n=2, sticky_slack=5, max_in_flight=2)
+    pinned = pool.choose("call-1")
+    other = pool.endpoints[1] if pinned is pool.endpoints[0] else pool.endpoints[0]
+    pool.begin(pinned)
+    pool.begin(other)
+    assert pool.choose("call-1") is pinned  # 1 of 2: room left
+
+    pool.begin(pinned)
+    assert pool.choose("call-1") is other   # full, though within the slack
+
+
+def test_full_replicas_are_skipped():
+    """No endpoint gets more than max_in_flight while another has room"""
+    pool = _pool(n=2, max_in_flight=2, max_failures=1)
+    a, b = pool.endpoints
+    assert pool.capacity() == 4
+    pool.begin(a)
+    pool.begin(a)
+    assert pool.choose() is b
+
+    pool.begin(b)
+    pool.end(b, error=True)  # ejected: only a takes traffic
+    assert pool.capacity() == 2
+
+
+def test_consecutive_errors_eject():
+    pool = _pool(n=2, max_failures=2, eject_s=60)
+    bad = pool.endpoints[0]
+    for _ in range(2):
+        pool.begin(bad)
+        pool.end(bad, error=True)
+    assert not bad.available(__import__("time").monotonic())
+    assert all(pool.choose() is pool.endpoints[1] for _ in range(5))
+    assert pool.get_stats()[0]["ejected"] == 1
+
+
+def test_success_resets_error_streak():
+    pool = _pool(n=2, max_failures=2)
+    e = pool.endpoints[0]
+    for error in (True, False, True):
+        pool.begin(e)
+        pool.end(e, ttft_s=0.1, error=error)
+    assert e.ejections == 0
+
+
+def test_slow_ttft_ejects():
+    pool = _pool(n=2, slow_ttft_s=1.0, ewma_alpha=0.5)
+    slow = pool.endpoints[0]
+    for ttft in (0.5, 0.8, 2.0):
+        pool.begin(slow)
+        pool.end(slow, ttft_s=ttft)
+    assert slow.ejections == 1
+    assert pool.choose() is pool.endpoints[1]
+
+
+def test_all_ejected_still_routes():
+    """The pool never fails closed"""
+    pool = _pool(n=2, max_failures=1)
+    for e in pool.endpoints:
+        pool.begin(e)
+        pool.end(e, error=True)
+    assert pool.choose() in pool.endpoints
+
+
+def test_only_requests_started_after_ejection_count_toward_the_next(monkeypatch):
+    pool = _pool(n=1, max_failures=2, eject_s=1.0)
+    e = pool.endpoints[0]
+    now = [100.0]
+    monkeypatch.setattr("src.llm.pool.time.monotonic", lambda: now[0])
+    stale = [pool.begin(e) for _ in range(3)]
+    now[0] += 0.1
+    for started in stale[:2]:
+        pool.end(e, error=True, started=started)
+    assert e.ejections == 1
+
+    # Fail-open (every replica ejected): new requests' failures count
+    retry = [pool.begin(e), pool.begin(e)]
+    for started in retry:
+        pool.end(e, error=True, started=started)
+    assert e.ejections == 2
+
+    # A request from before the ejections, ending once they expired, does not
+    now[0] += 5.0
+    pool.end(e, error=True, started=stale[2])
+    assert e.consecutive_failures == 0 and e.ejections == 2
+    assert e.failures == 5
+
+
+@pytest.mark.asyncio
+async def test_stand_in_replicas_of_different_speeds():
+    """Least-outstanding routing sends more load to the fast replica; a broken one is ejected"""
+    servers = {
+        "fast": FakeVLLM(delay_s=0.01),
+        "slow": FakeVLLM(delay_s=0.08),
+        "down": FakeVLLM(fail=True),
+    }
+    client = LLMClient(api_key="x", model="m", http_client=cluster_http_client(servers),
+                       base_urls=[f"http://{host}/v1" for host in servers])
+    for endpoint in client.pool.endpoints:
+        endpoint.client = endpoint.client.with_options(max_retries=0)
+
+    async def turn(i):
+        await asyncio.sleep(i * 0.005)
+        try:
+            return "".join([t async for t in client.generate_streaming(MESSAGES)])
+        except Exception:
+            return None
+
+    replies = await asyncio.gather(*(turn(i) for i in range(60)))
+
+    down = client.pool.endpoints[2]
+    assert down.ejections == 1
+    # Only requests routed before the ejection reach the broken replica
+    failed = len(servers["down"].requests)
+    assert client.pool.max_failures <= failed <= client.pool.max_failures + 2
+    assert sum(r is None for r in replies) == failed
+    assert len(servers["fast"].requests) > 2 * len(servers["slow"].requests)
+
+
+@pytest.mark.asyncio
+async def test_call_turns_and_warmup_share_a_replica():
+    """Warm-up and every turn of a call hit the same replica (prefix-cache locality)"""
+    servers = {"a": FakeVLLM(), "b": FakeVLLM()}
+    client = LLMClient(api_key="x", model="m", http_client=cluster_http_client(servers),
+                       base_urls=["http://a/v1", "http://b/v1"])
+
+    await client.warm_prefix(MESSAGES, call_id="call-1")
+    await client.warm_prefix(MESSAGES, call_id="call-2")
+    for _ in range(3):
+        async for _ in client.generate_streaming(MESSAGES, call_id="call-1"):
+            pass
+
+    counts = sorted(len(s.requests) for s in servers.values())
+    assert counts == [1, 4]
+
+
+@pytest.mark.asyncio
+async def test_ejected_replica_shrinks_admission():
+    """With one replica ejected, the healthy one still never exceeds its cap"""
+    servers = {"a": FakeVLLM(delay_s=0.05), "b": FakeVLLM()}
+    client = LLMClient(api_key="x", model="m", http_client=cluster_http_client(servers),
+                       base_urls=["http://a/v1", "http://b/v1"])
+    client.hedging_enabled = False
+    client.pool.max_in_flight = 2
+    down = client.pool.endpoints[1]
+    client.pool.begin(down)
+    for _ in range(client.pool.max_failures):
+        client.pool.end(down, error=True)
+    assert client.scheduler.limit == 2
+
+    async def turn(i):
+        async for _ in client.generate_streaming(MESSAGES, call_id=f"call-{i}"):
+            pass
+
+    await asyncio.gather(*(turn(i) for i in range(6)))
+    assert servers["a"].max_in_flight == 2
+    assert servers["b"].requests == []
@@ -0,0 +1,170 @@
+"""Tests for LLM admission control (src/llm/scheduler.py)."""
+
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+from src.llm.client import LLMClient
+from src.llm.scheduler import (
+    PRIORITY_FIRST_TURN,
+    PRIORITY_NORMAL,
+    PRIORITY_SHORT,
+    LLMScheduler,
+)
+from tests.fake_vllm import FakeVLLM
+
+FIRST_TURN = [{"role": "system", "content": "Be brief."}, {"role": "user", "content": "Hi"}]
+LATER_TURN = FIRST_TURN + [
+    {"role": "assistant", "content": "Hello!"},
+    {"role": "user", "content": "What are your opening hours?"},
+]
+
+
+async def _queue(scheduler, call_id, priority, order):
+    await scheduler.acquire(call_id, priority)
+    order.append(call_id)
+
+
+def test_priority_for():
+    scheduler = LLMScheduler(max_concurrent=1, short_output_tokens=64)
+    assert scheduler.priority_for(FIRST_TURN, 256) == PRIORITY_FIRST_TURN
+    assert scheduler.priority_for(LATER_TURN, 32) == PRIORITY_SHORT
+    assert scheduler.priority_for(LATER_TURN, 256) == PRIORITY_NORMAL
+    # A greeting spoken before the caller's first turn does not demote it
+    greeted = FIRST_TURN[:1] + [{"role": "assistant", "content": "Hi!"}] + FIRST_TURN[1:]
+    assert scheduler.priority_for(greeted, 256) == PRIORITY_FIRST_TURN
+
+
+@pytest.mark.asyncio
+async def test_cap_and_priority_order():
+    scheduler = LLMScheduler(max_concurrent=1)
+    await scheduler.acquire("busy")
+    order = []
+    tasks = [
+        asyncio.create_task(_queue(scheduler, "normal", PRIORITY_NORMAL, order)),
+        asyncio.create_task(_queue(scheduler, "short", PRIORITY_SHORT, order)),
+        asyncio.create_task(_queue(scheduler, "first", PRIORITY_FIRST_TURN, order)),
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.queue_depth == 3 and scheduler.running == 1
+
+    for holder in ("busy", "first", "short"):
+        scheduler.release(holder)
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    assert order == ["first", "short", "normal"]
+
+
+@pytest.mark.asyncio
+async def test_fair_across_calls():
+    """A call already holding a slot waits behind calls holding none"""
+    scheduler = LLMScheduler(max_concurrent=2)
+    await scheduler.acquire("greedy")
+    await scheduler.acquire("other")
+    order = []
+    tasks = [
+        asyncio.create_task(_queue(scheduler, "greedy", PRIORITY_NORMAL, order)),
+        asyncio.create_task(_queue(scheduler, "quiet", PRIORITY_NORMAL, order)),
+    ]
+    await asyncio.sleep(0)
+
+    scheduler.release("other")
+    await asyncio.sleep(0)
+    assert order == ["quiet"]
+    scheduler.release("quiet")
+    await asyncio.gather(*tasks)
+    assert order == ["quiet", "greedy"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_queue():
+    scheduler = LLMScheduler(max_concurrent=1)
+    await scheduler.acquire("a")
+    task = asyncio.create_task(scheduler.acquire("b"))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert scheduler.queue_depth == 0
+
+    scheduler.release("a")
+    assert scheduler.running == 0 and scheduler.running_by_call == {}
+
+
+@pytest.mark.asyncio
+async def test_release_before_cancelled_waiter_runs_again():
+    """Barge-in cancels a queued request, then another request finishes first"""
+    scheduler = LLMScheduler(max_concurrent=1)
+    await scheduler.acquire("a")
+    cancelled = asyncio.create_task(scheduler.acquire("b"))
+    waiting = asyncio.create_task(scheduler.acquire("c"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    scheduler.release("a")  # must not admit "b"
+
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    await waiting
+    assert scheduler.running_by_call == {"c": 1} and scheduler.queue_depth == 0
+    scheduler.release("c")
+    assert scheduler.running == 0
+    assert scheduler.try_acquire("d")
+
+
+@pytest.mark.asyncio
+async def test_try_acquire_does_not_jump_the_queue():
+    scheduler = LLMScheduler(max_concurrent=1)
+    assert scheduler.try_acquire("a")
+    assert not scheduler.try_acquire("b")
+    scheduler.release("a")
+    assert scheduler.get_stats()["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_warm_up_skipped_when_saturated():
+    server = FakeVLLM()
+    client = LLMClient(http_client=server.http_client())
+    client.scheduler.max_concurrent = 1
+    await client.scheduler.acquire("call-1")
+
+    await client.warm_prefix(FIRST_TURN, call_id="call-2")
+    assert client.warmups_skipped == 1
+    assert server.requests == []
+    client.scheduler.release("call-1")
+
+
+@pytest.mark.asyncio
+async def test_burst_is_capped_and_ordered():
+    """
+    24 calls finish a turn at once against a 4-slot backend: vLLM never
+    sees more than 4 requests, first turns are served first, and waits
+    are reported.
+    """
+    server = FakeVLLM(delay_s=0.02)
+    client = LLMClient(http_client=server.http_client())
+    client.scheduler.max_concurrent = 4
+
+    async def turn(i):
+        messages = FIRST_TURN if i % 3 == 0 else LATER_TURN
+        start = time.monotonic()
+        stream = client.generate_streaming(messages, call_id=f"call-{i}")
+        await stream.__anext__()
+        ttft = time.monotonic() - start
+        async for _ in stream:
+            pass
+        return messages is FIRST_TURN, ttft
+
+    results = await asyncio.gather(*(turn(i) for i in range(24)))
+
+    first = [t for is_first, t in results if is_first]
+    later = [t for is_first, t in results if not is_first]
+    stats = client.scheduler.get_stats()
+    print(f"burst of 24, 4 slots: first-turn TTFT max {max(first) * 1000:.0f} ms, "
+          f"later-turn TTFT p50 {np.median(later) * 1000:.0f} / max {max(later) * 1000:.0f} ms, "
+          f"queue wait p95 {stats['wait_p95_ms']:.0f} ms")
+    assert server.max_in_flight <= 4
+    assert max(first) < np.median(later)
+    assert stats["queued"] == 20 and stats["queue_depth"] == 0 and stats["running"] == 0
+    assert stats["wait_p95_ms"] > 0
@@ -0,0 +1,171 @@
+"""Tests for the prebuilt phrase bank (src/tts/phrase_bank.py) and call greeting."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.llm.conversation import ConversationManager
+from src.tts.config import TTSConfig
+from src.tts.phrase_bank import FRAMES_FILE, PhraseBank, build_phrase_bank
+from src.tts.stream import TTSStream
+
+GREETING = "Hi, this is Ava from Acme. How can I help?"
+
+
+async def _collect(agen):
+    return [p async for p in agen]
+
+
+def _tone(text):
+    """Deterministic 24kHz PCM per text, a few frames long."""
+    rng = np.random.default_rng(len(text))
+    return (rng.standard_normal(2400 + 480 * len(text) % 2400) * 3000).astype(np.int16)
+
+
+def _stream(voice="en-US-AriaNeural", phrase_bank=None):
+    stream = TTSStream(config=TTSConfig(voice=voice), phrase_bank=phrase_bank)
+    calls = []
+
+    async def synthesize(text):
+        calls.append(text)
+        yield _tone(text)
+
+    stream.tts_client.synthesize = MagicMock(side_effect=synthesize)
+    return stream, calls
+
+
+@pytest.fixture
+def bank_dir(tmp_path):
+    builder, _ = _stream()
+    asyncio.run(build_phrase_bank(
+        tmp_path, {"greeting": GREETING, "filler": "Sorry, give me just a moment."}, builder
+    ))
+    return tmp_path
+
+
+def test_build_and_map_without_copy(bank_dir):
+    bank = PhraseBank.load(bank_dir)
+    reference, _ = _stream()
+
+    assert isinstance(bank.frames, np.memmap)
+    assert not bank.frames.flags.writeable
+    assert bank.text("greeting") == GREETING and "filler" in bank
+    expected = asyncio.run(_collect(reference.generate(GREETING)))
+    assert list(bank.payloads("greeting")) == expected
+    assert list(bank.payloads("missing")) == []
+    assert bank.get_stats()["bytes_mapped"] == (bank_dir / FRAMES_FILE).stat().st_size
+
+
+def test_stale_bank_is_rejected(bank_dir):
+    with open(bank_dir / FRAMES_FILE, "ab") as f:
+        f.write(b"\xff" * 160)
+    with pytest.raises(ValueError):
+        PhraseBank.load(bank_dir)
+
+
+@pytest.mark.asyncio
+async def test_tts_stream_serves_bank_text_for_matching_voice(bank_dir):
+    bank = PhraseBank.load(bank_dir)
+    aria, aria_calls = _stream(phrase_bank=bank)
+    guy, guy_calls = _stream(voice="en-US-GuyNeural", phrase_bank=bank)
+
+    payloads = await _collect(aria.generate(f" {GREETING} "))
+    await _collect(aria.generate("Something else."))
+    await _collect(guy.generate(GREETING))
+
+    assert payloads == list(bank.payloads("greeting"))
+    assert aria_calls == ["Something else."]
+    assert guy_calls == [GREETING]  # rendered with another voice: synthesized
+
+
+def test_precomputed_never_synthesizes(bank_dir):
+    from src.tts.cache import AudioCache
+    bank = PhraseBank.load(bank_dir)
+    cache = AudioCache()
+    stream, calls = _stream(phrase_bank=bank)
+    stream.cache = cache
+    cache.put(stream.cache_key("Mm-hmm."), ["cached"])
+
+    assert stream.precomputed("Sorry, give me just a moment.") == list(bank.payloads("filler"))
+    assert stream.precomputed("Mm-hmm.") == ["cached"]
+    assert stream.precomputed("Let me check.") is None
+    assert calls == []
+
+
+class TestGreeting:
+    """handle_start speaks CALL_GREETING from the bank before any turn."""
+
+    def _setup(self, stream_sid, call_sid, bank):
+        from src.twilio.handlers import manager
+        manager.conversations[stream_sid] = ConversationManager(system_prompt="Be brief.")
+        manager.stream_to_call[stream_sid] = call_sid
+        streamer = MagicMock()
+        streamer.audio_frames_sent = 0
+        streamer.outbound_queue.qsize.return_value = 0
+        streamer.queue_audio = AsyncMock()
+        manager.streamers[call_sid] = streamer
+        manager.tts_stream, calls = _stream(phrase_bank=bank)
+        return streamer, calls
+
+    def _cleanup(self, stream_sid, call_sid):
+        from src.twilio.handlers import manager
+        for d in (manager.conversations, manager.stream_to_call, manager.is_responding,
+                  manager.response_tasks, manager.response_audio_marks):
+            d.pop(stream_sid, None)
+        manager.streamers.pop(call_sid, None)
+        manager.tts_stream = None
+
+    @pytest.mark.asyncio
+    async def test_greeting_streams_from_bank(self, bank_dir):
+        from src.twilio.handlers import _start_greeting, manager
+        bank = PhraseBank.load(bank_dir)
+        streamer, calls = self._setup("greet-1", "call-g1", bank)
+
+        with patch("src.twilio.handlers.settings.call_greeting", GREETING):
+            _start_greeting("greet-1")
+            assert manager.is_responding.get("greet-1") is not False
+            await manager.response_tasks["greet-1"]
+
+        sent = [c.args[0] for c in streamer.queue_audio.await_args_list]
+        assert sent == list(bank.payloads("greeting"))
+        assert calls == []
+        assert manager.conversations["greet-1"].get_messages()[-1] == {
+            "role": "assistant", "content": GREETING
+        }
+        assert "greet-1" not in manager.response_tasks
+        self._cleanup("greet-1", "call-g1")
+
+    @pytest.mark.asyncio
+    async def test_barge_in_cancels_greeting(self, bank_dir):
+        from src.twilio.handlers import _start_greeting, manager
+        streamer, _ = self._setup("greet-2", "call-g2", PhraseBank.load(bank_dir))
+        played = asyncio.Event()
+
+        async def queue_audio(payload):
+            streamer.audio_frames_sent += 1
+            played.set()
+            await asyncio.sleep(1)  # queue full
+
+        streamer.queue_audio = queue_audio
+
+        with patch("src.twilio.handlers.settings.call_greeting", GREETING):
+            _start_greeting("greet-2")
+            task = manager.response_tasks["greet-2"]
+            await played.wait()
+            task.cancel()
+            await task
+
+        assert manager.conversations["greet-2"].get_messages()[-1] == {
+            "role": "assistant", "content": f"{GREETING} [interrupted]"
+        }
+        assert manager.is_responding.get("greet-2") is False
+        self._cleanup("greet-2", "call-g2")
+
+
+def test_unreadable_bank_is_skipped(tmp_path):
+    from src.twilio.handlers import ConnectionManager
+    manager = ConnectionManager()
+    with patch("src.twilio.handlers.settings.phrase_bank_path", str(tmp_path / "none")):
+        assert manager.load_phrase_bank() is None
@@ -0,0 +1,171 @@
+"""Tests for the spoken-response cache (src/llm/response_cache.py)."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.llm.conversation import ConversationManager
+from src.llm.response_cache import ResponseCache, normalize_utterance
+
+SYSTEM = {"role": "system", "content": "You are a phone assistant."}
+
+
+def _turn(text, *prior):
+    return [SYSTEM, *prior, {"role": "user", "content": text}]
+
+
+def test_normalize_utterance():
+    assert normalize_utterance("  Hello?? Can you HEAR me! ") == "hello can you hear me"
+
+
+def test_key_depends_on_utterance_prompt_and_state():
+    cache = ResponseCache()
+    key = cache.key_for(_turn("Hello?"))
+    assert key == cache.key_for(_turn("hello"))
+    assert key != cache.key_for(_turn("Who is this?"))
+    assert key != cache.key_for([{"role": "system", "content": "Other prompt"},
+                                 {"role": "user", "content": "Hello?"}])
+    after_reply = _turn("Hello?", {"role": "user", "content": "Hi"},
+                        {"role": "assistant", "content": "Hi, how can I help?"})
+    assert key != cache.key_for(after_reply)
+
+
+def test_long_or_opted_out_turns_not_cacheable():
+    cache = ResponseCache(max_words=4, opt_outs=["Who is this?"])
+    assert cache.key_for(_turn("I would like to book a table for two")) is None
+    assert cache.key_for(_turn("who is this")) is None
+    assert cache.key_for([{"role": "user", "content": "Hello?"}]) is None  # no system prompt
+
+
+def test_lru_and_ttl():
+    cache = ResponseCache(max_entries=2, ttl_s=60)
+    keys = [cache.key_for(_turn(t)) for t in ("hello", "hi", "hey")]
+    for key in keys:
+        cache.put(key, "Hi!", [(3, ["AAAA"])])
+    assert cache.get(keys[0]) is None
+    assert cache.evictions == 1
+
+    with patch("src.llm.response_cache.time.monotonic", return_value=1e12):
+        assert cache.get(keys[2]) is None
+    assert cache.expirations == 1
+    assert cache.get_stats()["hit_rate"] == 0.0
+
+
+def test_opt_out_drops_existing_entry():
+    cache = ResponseCache()
+    key = cache.key_for(_turn("Who is this?"))
+    cache.put(key, "It's Ava.", [(9, ["AAAA"])])
+    cache.opt_out("who is this")
+    assert cache.get(key) is None
+    assert cache.key_for(_turn("Who is this?")) is None
+
+
+class TestCachedResponses:
+    """_generate_response answers a repeated common turn from the cache."""
+
+    def _setup(self, stream_sid, call_sid, text="Hello?"):
+        from src.twilio.handlers import manager
+        conversation = ConversationManager(system_prompt="You are a phone assistant.")
+        conversation.add_user_message(text)
+        manager.conversations[stream_sid] = conversation
+        manager.stream_to_call[stream_sid] = call_sid
+        streamer = MagicMock()
+        streamer.queue_audio = AsyncMock()
+        manager.streamers[call_sid] = streamer
+        return conversation, streamer
+
+    def _cleanup(self, *pairs):
+        from src.twilio.handlers import manager
+        for stream_sid, call_sid in pairs:
+            for d in (manager.conversations, manager.stream_to_call, manager.is_responding,
+                      manager.response_tasks):
+                d.pop(stream_sid, None)
+            manager.streamers.pop(call_sid, None)
+        manager.llm_client = None
+        manager.tts_stream = None
+        manager.response_cache.entries.clear()
+
+    @pytest.mark.asyncio
+    async def test_second_call_skips_llm_and_tts(self):
+        from src.twilio.handlers import _generate_response, manager
+
+        async def generate_streaming(messages, **kwargs):
+            for token in ("Hi there!", " How can I help?"):
+                yield token
+
+        async def synthesize(text):
+            yield f"audio<{text}>"
+
+        llm = MagicMock()
+        llm.generate_streaming = MagicMock(side_effect=generate_streaming)
+        tts = MagicMock()
+        tts.generate = MagicMock(side_effect=synthesize)
+        manager.llm_client = llm
+        manager.tts_stream = tts
+        manager.response_cache.entries.clear()
+        hits = manager.response_cache.hits
+
+        first, first_streamer = self._setup("cache-1", "call-c1")
+        await _generate_response("cache-1", "Hello?")
+        second, second_streamer = self._setup("cache-2", "call-c2", text="hello")
+        await _generate_response("cache-2", "hello")
+
+        assert llm.generate_streaming.call_count == 1
+        assert tts.generate.call_count == 2  # two sentences, first call only
+        assert manager.response_cache.hits == hits + 1
+        assert (second_streamer.queue_audio.await_args_list
+                == first_streamer.queue_audio.await_args_list)
+        assert second.get_messages()[-1] == {"role": "assistant", "content": "Hi there! How can I help?"}
+        self._cleanup(("cache-1", "call-c1"), ("cache-2", "call-c2"))
+
+    @pytest.mark.asyncio
+    async def test_barge_in_during_cached_playback_saves_spoken_part(self):
+        from src.twilio.handlers import _generate_response, manager
+
+        key = manager.response_cache.key_for(_turn("Hello?"))
+        manager.response_cache.put(key, "Hi there! How can I help?", [(9, ["a1"]), (25, ["a2"])])
+        conversation, streamer = self._setup("cache-3", "call-c3")
+        played = asyncio.Event()
+
+        async def queue_audio(payload):
+            if payload == "a2":
+                played.set()
+                await asyncio.sleep(10)  # queue full: barge-in lands here
+        streamer.queue_audio = AsyncMock(side_effect=queue_audio)
+        manager.llm_client = MagicMock()
+
+        task = asyncio.create_task(_generate_response("cache-3", "Hello?"))
+        manager.response_tasks["cache-3"] = task
+        await played.wait()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        assert not manager.llm_client.generate_streaming.called
+        assert conversation.get_messages()[-1]["content"].startswith("Hi there!")
+        assert "How can I help" not in conversation.get_messages()[-1]["content"]
+        self._cleanup(("cache-3", "call-c3"))
+
+    @pytest.mark.asyncio
+    async def test_tts_failure_is_not_cached(self):
+        from src.twilio.handlers import _generate_response, manager
+
+        async def generate_streaming(messages, **kwargs):
+            yield "Hi there!"
+
+        async def broken_tts(text):
+            raise RuntimeError("tts down")
+            yield
+
+        llm = MagicMock()
+        llm.generate_streaming = generate_streaming
+        tts = MagicMock()
+        tts.generate = broken_tts
+        manager.llm_client = llm
+        manager.tts_stream = tts
+        manager.response_cache.entries.clear()
+
+        self._setup("cache-4", "call-c4")
+        await _generate_response("cache-4", "Hello?")
+        assert len(manager.response_cache.entries) == 0
+        self._cleanup(("cache-4", "call-c4"))
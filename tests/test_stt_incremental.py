@@ -0,0 +1,104 @@
+"""Tests for incremental long-utterance transcription (src/stt/incremental.py)."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+from src.stt.incremental import IncrementalTranscriber
+
+
+class _BlockASR:
+    """Each 0.5s block of constant value k decodes to word ' wk'."""
+
+    sep = ""
+    original_language = "en"
+
+    def __init__(self):
+        self.decoded_seconds = []
+
+    def transcribe(self, audio, init_prompt=""):
+        self.decoded_seconds.append(len(audio) / 16000)
+        words = []
+        for i in range(len(audio) // 8000):
+            k = int(round(audio[i * 8000] * 32768))
+            words.append((i * 0.5, i * 0.5 + 0.5, f" w{k}"))
+        return words
+
+    def ts_words(self, res):
+        return res
+
+    def segments_end_ts(self, res):
+        return [e for _, e, _ in res[3::4]]
+
+
+def _blocks(first, count):
+    return np.concatenate([np.full(8000, k, dtype=np.int16) for k in range(first, first + count)])
+
+
+def _speak(seconds, step_s=2.0):
+    asr = _BlockASR()
+    transcriber = IncrementalTranscriber(asr, buffer_trimming_s=4.0, max_buffer_s=12.0)
+    blocks = int(seconds * 2)
+    step = int(step_s * 2)
+    for first in range(1, blocks + 1 - step, step):
+        transcriber.advance(_blocks(first, step))
+    fed = (blocks - step) // step * step
+    asr.decoded_seconds.clear()
+    result = transcriber.finish(_blocks(fed + 1, blocks - fed))
+    return result, asr
+
+
+def test_long_utterance_text_is_complete():
+    """All words of a long monologue come out once, in order"""
+    result, _ = _speak(40)
+    assert result["text"].split() == [f"w{k}" for k in range(1, 81)]
+    assert result["incremental"]
+    assert result["duration"] == 40.0
+
+
+def test_turn_end_work_is_bounded():
+    """Turn-end decode covers a bounded tail, not the whole utterance"""
+    _, short = _speak(10)
+    _, long_ = _speak(40)
+    assert max(long_.decoded_seconds) <= 12.0 + 2.0
+    assert max(long_.decoded_seconds) <= max(short.decoded_seconds) + 4.0
+
+
+def test_buffer_respects_hard_cap():
+    """Buffered audio never exceeds max_buffer_s, even without segment ends"""
+    asr = _BlockASR()
+    asr.segments_end_ts = lambda res: []
+    transcriber = IncrementalTranscriber(asr, buffer_trimming_s=4.0, max_buffer_s=6.0)
+    for first in range(1, 60, 4):
+        transcriber.advance(_blocks(first, 4))
+        assert len(transcriber.online.audio_buffer) / 16000 <= 6.0
+    result = transcriber.finish(np.array([], dtype=np.int16))
+    assert result["text"].split() == [f"w{k}" for k in range(1, 61)]
+    assert not transcriber.active
+
+
+@pytest.mark.asyncio
+async def test_partial_prefill_throttled():
+    """Committed text is prefilled once it grows enough, one request at a time"""
+    from src.twilio.handlers import manager, _prefill_partial
+
+    stream_sid = "test_partial_prefill"
+    manager.llm_client = MagicMock()
+    manager.llm_client.warm_prefix = AsyncMock()
+    sent = manager.partial_prefills_total
+
+    _prefill_partial(stream_sid, "short")                            # below min chars
+    _prefill_partial(stream_sid, "I would like to change my booking")
+    _prefill_partial(stream_sid, "I would like to change my booking for next Tuesday at seven")  # in flight
+    await manager.prefill_tasks[stream_sid]
+    _prefill_partial(stream_sid, "I would like to change my booking for next Tuesday at seven")
+
+    assert manager.partial_prefills_total == sent + 2
+    messages = manager.llm_client.warm_prefix.call_args[0][0]
+    assert messages[-1] == {"role": "user",
+                            "content": "I would like to change my booking for next Tuesday at seven"}
+
+    manager.prefill_tasks.pop(stream_sid, None)
+    manager.prefilled_chars.pop(stream_sid, None)
+    manager.conversations.pop(stream_sid, None)
+    manager.llm_client = None
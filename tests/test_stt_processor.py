@@ -7,7 +7,11 @@ with real PSTN audio will be done in Plan 03 E2E testing.
 
 import pytest
 import numpy as np
-from src.stt.processor import STTProcessor
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from src.stt.processor import (
+    STTProcessor, CustomFasterWhisperASR, TRANSCRIPTION_PROFILES
+)
 
 
 @pytest.fixture(scope="module")
@@ -118,3 +122,80 @@ async def test_process_audio_chunk_api_contract(stt_processor):
         assert "text" in result
         assert "beg" in result
         assert "end" in result
+
+
+def _segment(text, start, end, avg_logprob=-0.2, no_speech_prob=0.01, compression_ratio=1.2):
+    return SimpleNamespace(text=text, start=start, end=end, avg_logprob=avg_logprob,
+                           no_speech_prob=no_speech_prob, compression_ratio=compression_ratio,
+                           words=[])
+
+
+def _processor_with_fake_model():
+    """STTProcessor whose WhisperModel is a MagicMock (no download)"""
+    model = MagicMock()
+    model.transcribe.return_value = (
+        iter([_segment(" Hello", 0.0, 1.0, -0.1), _segment(" there.", 1.0, 2.0, -0.3)]),
+        SimpleNamespace(language="en", language_probability=0.98),
+    )
+    with patch.object(CustomFasterWhisperASR, "load_model", return_value=model):
+        processor = STTProcessor(model_size="base.en", device="cpu", compute_type="int8")
+    return processor, model
+
+
+def test_transcribe_utterance_uses_fast_profile():
+    """Turn-end decode is greedy, no timestamps, no fallback"""
+    processor, model = _processor_with_fake_model()
+
+    result = processor.transcribe_utterance(np.zeros(32000, dtype=np.int16))
+
+    kwargs = model.transcribe.call_args.kwargs
+    assert kwargs["beam_size"] == 1
+    assert kwargs["word_timestamps"] is False
+    assert kwargs["without_timestamps"] is True
+    assert kwargs["temperature"] == 0.0
+    assert result["text"] == "Hello there."
+    assert result["avg_logprob"] == pytest.approx(-0.2)
+    assert result["duration"] == pytest.approx(2.0)
+    assert result["language"] == "en"
+    assert result["profile"] == "turn_final_fast"
+
+
+def test_streaming_path_keeps_word_timestamps():
+    """OnlineASRProcessor decodes with the streaming profile"""
+    processor, model = _processor_with_fake_model()
+    model.transcribe.return_value = (iter([]), SimpleNamespace(language="en", language_probability=1.0))
+
+    processor.asr.transcribe(np.zeros(16000, dtype=np.float32), init_prompt="")
+
+    kwargs = model.transcribe.call_args.kwargs
+    assert kwargs["word_timestamps"] is True
+    assert kwargs["initial_prompt"] is None
+    assert kwargs["beam_size"] == TRANSCRIPTION_PROFILES["streaming_partial"]["beam_size"]
+
+
+def test_use_vad_overrides_profile():
+    """Options set on the ASR still apply on top of a profile"""
+    processor, model = _processor_with_fake_model()
+    processor.asr.use_vad()
+
+    processor.transcribe_utterance(np.zeros(16000, dtype=np.int16), profile="accurate")
+
+    kwargs = model.transcribe.call_args.kwargs
+    assert kwargs["vad_filter"] is True
+    assert kwargs["beam_size"] == 5
+
+
+def test_language_override_per_decode():
+    """A call's pinned language or "auto" overrides the model default"""
+    processor, model = _processor_with_fake_model()
+
+    processor.transcribe_utterance(np.zeros(16000, dtype=np.int16), language="de")
+    assert model.transcribe.call_args.kwargs["language"] == "de"
+
+    model.transcribe.return_value = (iter([]), SimpleNamespace(language="fr", language_probability=0.9))
+    result = processor.transcribe_utterance(np.zeros(16000, dtype=np.int16), language="auto")
+    assert model.transcribe.call_args.kwargs["language"] is None
+    assert result["language"] == "fr"
+
+    processor.transcribe_utterance(np.zeros(16000, dtype=np.int16))
+    assert model.transcribe.call_args.kwargs["language"] == "en"
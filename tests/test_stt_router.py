@@ -0,0 +1,68 @@
+"""Tests for the STT model cascade (src/stt/router.py)."""
+
+import numpy as np
+from unittest.mock import MagicMock
+from src.stt.router import STTRouter
+
+
+def _result(text, avg_logprob, decode_ms=10.0):
+    return {"type": "final", "text": text, "avg_logprob": avg_logprob,
+            "no_speech_prob": 0.0, "compression_ratio": 1.0, "language": "en",
+            "language_probability": 1.0, "duration": 1.0,
+            "decode_ms": decode_ms, "cpu_ms": decode_ms, "profile": "turn_final_fast"}
+
+
+def _router(fast_result, accurate_result):
+    fast = MagicMock()
+    fast.transcribe_utterance.return_value = fast_result
+    accurate = MagicMock()
+    accurate.transcribe_utterance.return_value = accurate_result
+    return STTRouter(accurate=accurate, fast=fast, max_fast_duration_s=2.0,
+                     escalate_logprob=-0.8), fast, accurate
+
+
+def test_short_confident_turn_stays_on_fast_model():
+    """'yes' is answered by the tiny model alone"""
+    router, fast, accurate = _router(_result("Yes.", -0.2), _result("Yes.", -0.1))
+
+    result = router.transcribe_utterance(np.zeros(8000, dtype=np.int16))
+
+    assert result["model"] == "fast"
+    assert not result["escalated"]
+    accurate.transcribe_utterance.assert_not_called()
+    assert router.get_stats()["fast_turns"] == 1
+
+
+def test_low_confidence_escalates():
+    """Unsure fast decode is re-run on the accurate model; latency adds up"""
+    router, fast, accurate = _router(_result("Yez?", -1.5, 10.0), _result("Yes, please.", -0.2, 40.0))
+
+    result = router.transcribe_utterance(np.zeros(8000, dtype=np.int16))
+
+    assert result["text"] == "Yes, please."
+    assert result["escalated"]
+    assert result["decode_ms"] == 50.0
+    assert router.get_stats()["escalations"] == 1
+
+
+def test_long_turn_skips_fast_model():
+    """Long utterances go straight to the accurate model"""
+    router, fast, accurate = _router(_result("x", -0.1), _result("a long sentence", -0.3))
+
+    result = router.transcribe_utterance(np.zeros(16000 * 3, dtype=np.int16))
+
+    assert result["model"] == "accurate"
+    assert not result["escalated"]
+    fast.transcribe_utterance.assert_not_called()
+
+
+def test_no_fast_model_disables_cascade():
+    """STT_FAST_MODEL="" routes everything to one model"""
+    accurate = MagicMock()
+    accurate.transcribe_utterance.return_value = _result("ok", -2.0)
+    router = STTRouter(accurate=accurate)
+
+    result = router.transcribe_utterance(np.zeros(1600, dtype=np.int16))
+
+    assert result["model"] == "accurate"
+    assert not result["escalated"]
@@ -0,0 +1,67 @@
+"""Tests for the post-STT noise/hallucination gate (src/stt/filters.py)."""
+
+import numpy as np
+from src.stt.filters import TranscriptFilter, rms_dbfs
+
+
+def _result(text, avg_logprob=-0.2, no_speech_prob=0.01, compression_ratio=1.2):
+    return {"text": text, "avg_logprob": avg_logprob,
+            "no_speech_prob": no_speech_prob, "compression_ratio": compression_ratio}
+
+
+def _speech(rms=3000, n=16000, seed=0):
+    """Noise at a speech-like level (~-21 dBFS at rms=3000)"""
+    rng = np.random.default_rng(seed)
+    return np.clip(rng.normal(0, rms, n), -32768, 32767).astype(np.int16)
+
+
+def test_clear_speech_passes():
+    """A confident, loud transcript is answered"""
+    f = TranscriptFilter()
+    assert f.rejection_reason(_result("I'd like to book a table"), _speech()) is None
+
+
+def test_confident_thank_you_passes():
+    """Known phrases are kept when every signal says it was really said"""
+    f = TranscriptFilter()
+    assert f.rejection_reason(_result("Thank you."), _speech()) is None
+
+
+def test_hallucination_on_noise_dropped():
+    """'Thank you.' decoded from quiet line noise is dropped"""
+    f = TranscriptFilter()
+    noise = _speech(rms=200)  # ~-44 dBFS
+    assert f.rejection_reason(_result("Thank you.", avg_logprob=-0.3), noise) == "hallucination"
+    assert f.rejection_reason(_result("you", no_speech_prob=0.5), _speech()) == "hallucination"
+
+
+def test_signal_rules():
+    """Whisper's own confidence signals and energy reject junk"""
+    f = TranscriptFilter()
+    assert f.rejection_reason(_result("..."), _speech()) == "empty"
+    assert f.rejection_reason(_result("[BLANK_AUDIO]"), _speech()) == "tag"
+    assert f.rejection_reason(_result("hello"), np.zeros(16000, dtype=np.int16)) == "quiet"
+    assert f.rejection_reason(
+        _result("hello there", avg_logprob=-1.4, no_speech_prob=0.8), _speech()
+    ) == "no_speech"
+    assert f.rejection_reason(
+        _result("yes yes yes yes yes yes", compression_ratio=3.1), _speech()
+    ) == "repetitive"
+
+
+def test_counters():
+    """Drops are counted per reason"""
+    f = TranscriptFilter()
+    f.record_drop("hallucination")
+    f.record_drop("hallucination")
+    f.record_drop("quiet")
+    f.record_pass()
+    assert f.dropped == {"hallucination": 2, "quiet": 1}
+    assert f.dropped_total == 3
+    assert f.passed == 1
+
+
+def test_rms_dbfs():
+    assert rms_dbfs(np.zeros(10, dtype=np.int16)) == float("-inf")
+    full = np.full(100, 32767, dtype=np.int16)
+    assert abs(rms_dbfs(full)) < 0.01
@@ -0,0 +1,221 @@
+"""Tests for the synthesized-audio cache (src/tts/cache.py)."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.tts.cache import AudioCache
+from src.tts.config import TTSConfig
+from src.tts.stream import TTSStream
+
+
+def _key(text):
+    return ("edge", "en-US-AriaNeural", "+0%", "+0%", text)
+
+
+async def _collect(agen):
+    return [p async for p in agen]
+
+
+class FakeSynth:
+    """Counts syntheses; yields n frames with a delay between them."""
+
+    def __init__(self, frames=5, delay_s=0.01, fail_at=None):
+        self.frames = frames
+        self.delay_s = delay_s
+        self.fail_at = fail_at
+        self.calls = 0
+
+    def __call__(self, text="x"):
+        self.calls += 1
+        return self._run(text)
+
+    async def _run(self, text):
+        for i in range(self.frames):
+            if i == self.fail_at:
+                raise RuntimeError("tts down")
+            await asyncio.sleep(self.delay_s)
+            yield f"{text}-{i}"
+
+
+def test_lru_within_byte_budget():
+    cache = AudioCache(max_bytes=10)
+    cache.put(_key("a"), ["aaaa"])
+    cache.put(_key("b"), ["bbbb"])
+    assert cache.get(_key("a")) is not None  # a is now most recent
+    cache.put(_key("c"), ["cccc"])
+
+    assert cache.get(_key("b")) is None
+    assert cache.bytes_held == 8
+    assert cache.evictions == 1
+
+    cache.put(_key("huge"), ["x" * 11])  # over budget on its own: not stored
+    assert cache.get(_key("huge")) is None and cache.bytes_held == 8
+
+
+@pytest.mark.asyncio
+async def test_hit_skips_synthesis():
+    cache = AudioCache()
+    synth = FakeSynth(frames=3, delay_s=0)
+    first = await _collect(cache.fetch(_key("hi"), lambda: synth("hi")))
+    second = await _collect(cache.fetch(_key("hi"), lambda: synth("hi")))
+
+    assert first == second == ["hi-0", "hi-1", "hi-2"]
+    assert synth.calls == 1
+    assert cache.get_stats()["hit_rate"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_synthesis():
+    cache = AudioCache()
+    synth = FakeSynth(frames=5, delay_s=0.01)
+
+    results = await asyncio.gather(
+        *(_collect(cache.fetch(_key("same"), lambda: synth("same"))) for _ in range(4))
+    )
+
+    assert synth.calls == 1
+    assert all(r == [f"same-{i}" for i in range(5)] for r in results)
+    assert cache.shared == 3 and cache.misses == 1
+    assert cache.flights == {}
+
+
+@pytest.mark.asyncio
+async def test_followers_stream_before_synthesis_finishes():
+    cache = AudioCache()
+    synth = FakeSynth(frames=10, delay_s=0.02)
+    stream = cache.fetch(_key("long"), lambda: synth("long"))
+
+    first = await asyncio.wait_for(stream.__anext__(), timeout=0.1)
+    assert first == "long-0"
+    await stream.aclose()
+
+    # Leaving early does not stop the synthesis: it completes into the cache
+    await cache.flights[_key("long")].task
+    assert len(cache.get(_key("long"))) == 10
+
+
+@pytest.mark.asyncio
+async def test_leader_barge_in_does_not_cancel_shared_synthesis():
+    cache = AudioCache()
+    synth = FakeSynth(frames=5, delay_s=0.01)
+
+    async def leader():
+        async for _ in cache.fetch(_key("s"), lambda: synth("s")):
+            await asyncio.sleep(10)  # caller's queue is full; barge-in cancels here
+
+    leader_task = asyncio.create_task(leader())
+    await asyncio.sleep(0.015)
+    follower = asyncio.create_task(_collect(cache.fetch(_key("s"), lambda: synth("s"))))
+    await asyncio.sleep(0)
+    leader_task.cancel()
+
+    assert await follower == [f"s-{i}" for i in range(5)]
+    assert synth.calls == 1
+    assert cache.get(_key("s")) is not None
+
+
+@pytest.mark.asyncio
+async def test_failure_reaches_every_caller_and_is_not_cached():
+    cache = AudioCache()
+    synth = FakeSynth(frames=5, delay_s=0.005, fail_at=2)
+
+    results = await asyncio.gather(
+        *(_collect(cache.fetch(_key("bad"), lambda: synth("bad"))) for _ in range(2)),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert cache.get(_key("bad")) is None and cache.flights == {}
+
+
+@pytest.mark.asyncio
+async def test_tts_stream_keys_on_voice_and_text():
+    cache = AudioCache()
+    aria = TTSStream(config=TTSConfig(voice="en-US-AriaNeural"), cache=cache)
+    guy = TTSStream(config=TTSConfig(voice="en-US-GuyNeural"), cache=cache)
+    calls = []
+
+    async def synthesize(text):
+        calls.append(text)
+        yield np.zeros(2400, dtype=np.int16)
+
+    with patch.object(aria.tts_client, "synthesize", side_effect=synthesize), \
+            patch.object(guy.tts_client, "synthesize", side_effect=synthesize):
+        await _collect(aria.generate("Sorry, give me just a moment."))
+        await _collect(aria.generate(" Sorry, give me just a moment. "))
+        await _collect(guy.generate("Sorry, give me just a moment."))
+
+    assert len(calls) == 2
+    assert cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_csm_audio_is_never_cached():
+    """CSM output depends on the call's speaker context, which the key lacks"""
+    calls = []
+
+    async def synthesize(text):
+        calls.append(text)
+        yield np.zeros(480, dtype=np.int16)
+
+    client = MagicMock()
+    client.synthesize = MagicMock(side_effect=synthesize)
+    with patch("src.tts.stream.create_tts_client", return_value=client):
+        stream = TTSStream(config=TTSConfig(engine="csm"), cache=AudioCache())
+
+    for _ in range(2):
+        await _collect(stream.generate("Hello there."))
+    assert stream.cache is None
+    assert stream.precomputed("Hello there.") is None
+    assert calls == ["Hello there."] * 2
+
+
+@pytest.mark.asyncio
+async def test_csm_response_is_never_replayed_across_calls():
+    """The response cache neither serves nor stores a CSM stream's audio"""
+    from src.llm.conversation import ConversationManager
+    from src.twilio.handlers import _generate_response, manager
+
+    async def generate_streaming(messages, **kwargs):
+        yield "Hi there!"
+
+    async def synthesize(text):
+        yield np.zeros(480, dtype=np.int16)
+
+    client = MagicMock()
+    client.synthesize = MagicMock(side_effect=synthesize)
+    with patch("src.tts.stream.create_tts_client", return_value=client):
+        manager.tts_stream = TTSStream(config=TTSConfig(engine="csm"))
+    manager.llm_client = MagicMock()
+    manager.llm_client.generate_streaming = MagicMock(side_effect=generate_streaming)
+    manager.response_cache.entries.clear()
+    turn = ConversationManager(system_prompt="You are a phone assistant.")
+    turn.add_user_message("Hello?")
+    key = manager.response_cache.key_for(turn.get_messages())
+    manager.response_cache.put(key, "Cached from another call.", [(25, ["a1"])])
+    hits = manager.response_cache.hits
+
+    for stream_sid, call_sid in (("csm-1", "call-csm1"), ("csm-2", "call-csm2")):
+        conversation = ConversationManager(system_prompt="You are a phone assistant.")
+        conversation.add_user_message("Hello?")
+        manager.conversations[stream_sid] = conversation
+        manager.stream_to_call[stream_sid] = call_sid
+        manager.streamers[call_sid] = MagicMock(queue_audio=AsyncMock())
+        await _generate_response(stream_sid, "Hello?")
+        assert conversation.get_messages()[-1]["content"] == "Hi there!"
+
+    assert manager.llm_client.generate_streaming.call_count == 2
+    assert client.synthesize.call_count == 2
+    assert manager.response_cache.hits == hits
+    assert list(manager.response_cache.entries.values())[0].text == "Cached from another call."
+    for stream_sid, call_sid in (("csm-1", "call-csm1"), ("csm-2", "call-csm2")):
+        for d in (manager.conversations, manager.stream_to_call, manager.is_responding,
+                  manager.response_tasks):
+            d.pop(stream_sid, None)
+        manager.streamers.pop(call_sid, None)
+    manager.llm_client = None
+    manager.tts_stream = None
+    manager.response_cache.entries.clear()
@@ -81,3 +81,228 @@ def test_reset_clears_state(vad_detector):
     assert vad_detector.is_speaking == False
     assert vad_detector.silence_duration_ms == 0
     assert vad_detector.speech_duration_ms == 0
+
+
+class _FakeSilero:
+    """Stand-in for the Silero model: scores windows by a fixed RMS cut-off."""
+
+    def __init__(self, speech_rms=2000.0):
+        self.speech_rms = speech_rms
+        self.calls = 0
+
+    def cpu(self):
+        return self
+
+    def reset_states(self):
+        pass
+
+    def __call__(self, audio_tensor, sampling_rate):
+        self.calls += 1
+        rms = float(np.sqrt(np.mean((audio_tensor.numpy() * 32768.0) ** 2)))
+
+        class _Prob:
+            def __init__(self, value):
+                self.value = value
+
+            def item(self):
+                return self.value
+
+        return _Prob(0.9 if rms >= self.speech_rms else 0.05)
+
+
+def _make_vad(**kwargs):
+    """VADDetector with the fake model patched in (no torch.hub download)."""
+    from unittest.mock import patch
+    fake = _FakeSilero()
+    with patch("src.vad.detector.torch.hub.load", return_value=(fake, (None,) * 5)):
+        vad = VADDetector(**kwargs)
+    return vad, fake
+
+
+def _noise(n, rms, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.standard_normal(n) * rms).astype(np.int16)
+
+
+def test_energy_gate_skips_digital_silence():
+    """Test: all-zero windows (muted caller, 0xFF mu-law) never reach the model"""
+    vad, fake = _make_vad()
+    for _ in range(50):
+        result = vad.process_chunk(np.zeros(512, dtype=np.int16))
+
+    assert fake.calls == 0
+    assert result["speech_probability"] == 0.0
+    assert vad.model_skip_ratio == 1.0
+
+
+def test_energy_gate_skips_quiet_line_noise_after_warmup():
+    """Test: once the floor is learned, frames near it are gated"""
+    vad, fake = _make_vad(gate_warmup_ms=200)
+    for i in range(200):
+        vad.process_chunk(_noise(512, 50, seed=i))
+
+    # Only the warm-up windows (~7 at 32ms) plus a few floor-tracking calls
+    assert fake.calls < 40
+    assert vad.model_skip_ratio > 0.8
+    assert not vad.is_speaking
+
+
+def test_energy_gate_passes_speech_onset_and_hangover():
+    """Test: loud onset after gated silence is modelled, and the tail is too"""
+    vad, fake = _make_vad(gate_warmup_ms=0, gate_hangover_ms=300)
+    for i in range(100):
+        vad.process_chunk(_noise(512, 50, seed=i))
+    calls_before = fake.calls
+
+    result = vad.process_chunk(_noise(512, 5000, seed=999))
+    assert fake.calls == calls_before + 1
+    assert result["speech_probability"] > vad.threshold
+
+    # Quiet tail windows stay on the model during the hangover
+    calls_before = fake.calls
+    for i in range(5):
+        vad.process_chunk(_noise(512, 50, seed=2000 + i))
+    assert fake.calls == calls_before + 5
+
+
+def test_energy_gate_turn_timing_matches_ungated():
+    """Test: gating does not shift when turn_complete fires"""
+    def turn_complete_index(**kwargs):
+        vad, _ = _make_vad(**kwargs)
+        frames = (
+            [_noise(512, 40, seed=i) for i in range(60)]
+            + [_noise(512, 6000, seed=100 + i) for i in range(20)]
+            + [_noise(512, 40, seed=200 + i) for i in range(40)]
+        )
+        for i, frame in enumerate(frames):
+            if vad.process_chunk(frame)["turn_complete"]:
+                return i
+        return None
+
+    gated = turn_complete_index(energy_gate=True, gate_warmup_ms=0)
+    ungated = turn_complete_index(energy_gate=False)
+    assert gated is not None
+    assert gated == ungated
+
+
+def test_reset_keeps_noise_floor_and_gate_stats():
+    """Test: reset() between turns keeps the learned floor and counters"""
+    vad, _ = _make_vad(gate_warmup_ms=0)
+    for i in range(30):
+        vad.process_chunk(_noise(512, 300, seed=i))
+    floor = vad.noise_floor
+    windows = vad.windows_processed
+
+    vad.reset()
+
+    assert vad.noise_floor == floor
+    assert vad.windows_processed == windows
+
+
+def test_native_8k_window_size():
+    """Test: 8kHz mode uses 256-sample (32ms) Silero windows"""
+    vad, _ = _make_vad(sampling_rate=8000)
+    assert vad.min_samples == 256
+
+    with pytest.raises(ValueError):
+        _make_vad(sampling_rate=22050)
+
+
+def test_native_8k_turn_timing_matches_16k():
+    """Test: turn_complete fires at the same audio time at 8kHz and 16kHz"""
+    from src.audio.resampling import resample_8k_to_16k
+
+    frames_8k = (
+        [_noise(160, 40, seed=i) for i in range(50)]
+        + [_noise(160, 6000, seed=100 + i) for i in range(40)]
+        + [_noise(160, 40, seed=200 + i) for i in range(60)]
+    )
+
+    def turn_complete_ms(rate):
+        vad, _ = _make_vad(sampling_rate=rate, gate_warmup_ms=0)
+        for i, frame in enumerate(frames_8k):
+            chunk = frame if rate == 8000 else resample_8k_to_16k(frame)
+            if vad.process_chunk(chunk)["turn_complete"]:
+                return (i + 1) * 20
+        return None
+
+    native = turn_complete_ms(8000)
+    upsampled = turn_complete_ms(16000)
+    assert native is not None
+    assert native == upsampled
+
+
+def test_single_blip_does_not_start_speech():
+    """Test: one window over the onset threshold is not speech (no barge-in)"""
+    vad, _ = _make_vad(gate_warmup_ms=0, min_onset_ms=96)
+    for i in range(20):
+        vad.process_chunk(_noise(512, 40, seed=i))
+
+    result = vad.process_chunk(_noise(512, 6000, seed=50))
+    assert not result["is_speech"]
+    assert not vad.is_speaking
+
+    result = vad.process_chunk(_noise(512, 40, seed=51))
+    assert not result["is_speech"]
+    assert vad.onset_duration_ms == 0
+
+
+def test_onset_confirmed_after_min_onset():
+    """Test: sustained speech confirms onset exactly once, with speech_start"""
+    vad, _ = _make_vad(gate_warmup_ms=0, min_onset_ms=96)
+    starts = []
+    for i in range(6):
+        result = vad.process_chunk(_noise(512, 6000, seed=i))
+        starts.append(result["speech_start"])
+
+    assert starts == [False, False, True, False, False, False]
+    assert vad.is_speaking
+    assert result["is_speech"]
+
+
+def test_hysteresis_keeps_speech_between_thresholds():
+    """Test: once speaking, probabilities between offset and onset stay speech"""
+    vad, fake = _make_vad(energy_gate=False, threshold=0.5, offset_threshold=0.3)
+    vad.is_speaking = True
+
+    window = np.ones(512, dtype=np.int16)
+    result = vad._update_state(window, 0.4)
+    assert result["is_speech"]
+    assert vad.silence_duration_ms == 0
+
+    result = vad._update_state(window, 0.2)
+    assert not result["is_speech"]
+    assert vad.silence_duration_ms > 0
+
+
+def test_short_segment_is_discarded():
+    """Test: speech shorter than min_speech_ms followed by silence is aborted"""
+    vad, _ = _make_vad(gate_warmup_ms=0, min_onset_ms=64, min_speech_ms=250)
+    for i in range(3):
+        vad.process_chunk(_noise(512, 6000, seed=i))
+    assert vad.is_speaking
+
+    aborted = False
+    for i in range(20):
+        result = vad.process_chunk(_noise(512, 40, seed=100 + i))
+        assert not result["turn_complete"]
+        aborted = aborted or result["speech_aborted"]
+
+    assert aborted
+    assert not vad.is_speaking
+
+
+def test_prefix_buffer_is_ordered_preroll():
+    """Test: pre-roll ring returns the most recent audio oldest-first"""
+    vad, _ = _make_vad(energy_gate=False, sampling_rate=8000,
+                       prefix_padding_ms=64, min_onset_ms=32)
+    # Ring holds 96ms = 768 samples at 8kHz; feed 5 windows of ramp values
+    for k in range(5):
+        vad.process_chunk(np.full(256, k, dtype=np.int16))
+    vad.process_chunk(np.full(100, 9, dtype=np.int16))  # partial window
+
+    preroll = vad.get_prefix_buffer()
+    expected = np.concatenate([
+        np.full(256, 2), np.full(256, 3), np.full(256, 4), np.full(100, 9)
+    ]).astype(np.int16)
+    np.testing.assert_array_equal(preroll, expected)
@@ -0,0 +1,99 @@
+"""Tests for the vendored streaming buffers (src/stt/whisper_online.py)."""
+
+import numpy as np
+from src.stt.whisper_online import HypothesisBuffer, OnlineASRProcessor
+
+
+class _FakeASR:
+    """Returns one 0.5s word per full half-second of audio: w0, w1, ..."""
+
+    sep = " "
+
+    def __init__(self):
+        self.prompts = []
+
+    def transcribe(self, audio, init_prompt=""):
+        self.prompts.append(init_prompt)
+        # audio values encode absolute time, so words stay stable across trims
+        start = float(audio[0]) if len(audio) else 0.0
+        words = []
+        t = start
+        while t + 0.5 <= start + len(audio) / 16000:
+            words.append((t - start, t - start + 0.5, f"w{int(round(t * 2))}"))
+            t += 0.5
+        return words
+
+    def ts_words(self, res):
+        return res
+
+    def segments_end_ts(self, res):
+        return [e for _, e, _ in res[::4]]
+
+
+def _audio(beg_s, seconds):
+    n = int(seconds * 16000)
+    return (beg_s + np.arange(n, dtype=np.float32) / 16000).astype(np.float32)
+
+
+def test_hypothesis_buffer_commits_agreed_prefix():
+    """Words are committed once two consecutive hypotheses agree"""
+    buf = HypothesisBuffer()
+    buf.insert([(0.0, 0.5, "hello"), (0.5, 1.0, "there")], 0)
+    assert buf.flush() == []
+    buf.insert([(0.0, 0.5, "hello"), (0.5, 1.0, "world")], 0)
+    assert buf.flush() == [(0.0, 0.5, "hello")]
+    assert buf.complete() == [(0.5, 1.0, "world")]
+
+
+def test_hypothesis_buffer_drops_repeated_ngram():
+    """A re-transcribed n-gram at the commit boundary is not committed twice"""
+    buf = HypothesisBuffer()
+    buf.insert([(0.0, 0.5, "a"), (0.5, 1.0, "b")], 0)
+    buf.flush()
+    buf.insert([(0.0, 0.5, "a"), (0.5, 1.0, "b")], 0)
+    assert buf.flush() == [(0.0, 0.5, "a"), (0.5, 1.0, "b")]
+    # the next hypothesis repeats "a b" right at the last commit time
+    buf.insert([(0.95, 1.2, "a"), (1.2, 1.5, "b"), (1.5, 2.0, "c")], 0)
+    assert [w[2] for w in buf.new] == ["c"]
+
+
+def test_online_processor_buffer_survives_trimming():
+    """Appends after chunk_at keep the audio contiguous and time-aligned"""
+    online = OnlineASRProcessor(_FakeASR(), buffer_trimming=("segment", 2))
+    committed = []
+    t = 0.0
+    for _ in range(60):
+        online.insert_audio_chunk(_audio(t, 0.1))
+        t += 0.1
+        beg, _, text = online.process_iter()
+        if text:
+            committed.append(text)
+        # buffer always starts at buffer_time_offset
+        assert abs(online.audio_buffer[0] - online.buffer_time_offset) < 1e-3
+        assert abs(online.audio_buffer[-1] - (t - 1 / 16000)) < 1e-3
+
+    words = " ".join(committed).split()
+    assert words == [f"w{i}" for i in range(len(words))]
+    assert online.buffer_time_offset > 0
+    assert len(online.audio_buffer) < 6 * 16000
+
+
+def test_online_processor_starts_with_preallocated_storage():
+    online = OnlineASRProcessor(_FakeASR())
+    storage = online._audio
+    online.insert_audio_chunk(_audio(0.0, 0.5))
+    assert online._audio is storage
+    assert len(online.audio_buffer) == 8000
+
+
+def test_online_processor_prompt_is_bounded():
+    """The prompt is the last ~200 characters of text scrolled out of the buffer"""
+    online = OnlineASRProcessor(_FakeASR())
+    online.commited = [(i * 0.5, i * 0.5 + 0.5, f"word{i}") for i in range(1000)]
+    online.buffer_time_offset = 499.0  # words from 998 on are still buffered
+
+    prompt, context = online.prompt()
+
+    assert context == "word998 word999"
+    assert prompt.endswith("word997")
+    assert len(prompt) <= 200 + len("word997")